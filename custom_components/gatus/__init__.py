@@ -2,16 +2,37 @@
 
 from __future__ import annotations
 
+from functools import partial
 from typing import TYPE_CHECKING
 
-from homeassistant.const import CONF_URL, CONF_VERIFY_SSL, Platform
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.const import CONF_URL, CONF_VERIFY_SSL, CONF_WEBHOOK_ID, Platform
+from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.loader import async_get_loaded_integration
 
-from .api import GatusApiClient
-from .const import LOGGER
-from .coordinator import GatusDataUpdateCoordinator
+from .api import DATA_SOURCE_API, GatusApiClient, create_session
+from .const import (
+    CONF_DATA_SOURCE,
+    CONF_DEBOUNCE_FAILURES,
+    CONF_DEBOUNCE_WINDOW,
+    CONF_INSTANCES,
+    DEFAULT_DEBOUNCE_FAILURES,
+    DEFAULT_DEBOUNCE_WINDOW,
+    DOMAIN,
+    HISTORY_IMPORT_INTERVAL,
+    LOGGER,
+    REQUEST_CACHE_TTL,
+)
+from .coordinator import (
+    GatusAggregateCoordinator,
+    GatusDataUpdateCoordinator,
+    GatusFederatedCoordinator,
+)
 from .data import GatusData
+from .history import GatusHistoryImporter
+from .outcomes import OutcomeTracker
+from .snapshot import GatusSnapshot
+from .webhook import async_register_webhook
 
 if TYPE_CHECKING:  # pragma: no cover
     from homeassistant.core import HomeAssistant
@@ -20,6 +41,7 @@ if TYPE_CHECKING:  # pragma: no cover
 
 PLATFORMS: list[Platform] = [
     Platform.BINARY_SENSOR,
+    Platform.SENSOR,
 ]
 
 
@@ -28,29 +50,86 @@ async def async_setup_entry(
     entry: GatusConfigEntry,
 ) -> bool:
     """Set up the Gatus integration."""
-    coordinator = GatusDataUpdateCoordinator(
-        hass=hass,
-        config_entry_id=entry.entry_id,
-        client=GatusApiClient(
-            url=entry.data[CONF_URL],
-            session=async_get_clientsession(hass),
-            verify_ssl=entry.data[CONF_VERIFY_SSL],
-        ),
+    # One pooled session for the entry's Gatus instances, closed on unload.
+    session = create_session()
+    entry.async_on_unload(session.close)
+    create_client = partial(
+        GatusApiClient,
+        session=session,
+        verify_ssl=entry.data[CONF_VERIFY_SSL],
+        validate=hass.config.debug,
+        data_source=entry.options.get(CONF_DATA_SOURCE, DATA_SOURCE_API),
+        request_ttl=REQUEST_CACHE_TTL.total_seconds(),
     )
+    client = create_client(url=entry.data[CONF_URL])
+    webhook = CONF_WEBHOOK_ID in entry.options
+    if instances := entry.options.get(CONF_INSTANCES):
+        coordinator = GatusFederatedCoordinator(
+            hass=hass,
+            config_entry_id=entry.entry_id,
+            client=client,
+            instances=[create_client(url=url) for url in instances],
+            webhook=webhook,
+        )
+    else:
+        coordinator = GatusDataUpdateCoordinator(
+            hass=hass,
+            config_entry_id=entry.entry_id,
+            client=client,
+            webhook=webhook,
+        )
     entry.runtime_data = GatusData(
-        client=GatusApiClient(
-            url=entry.data[CONF_URL],
-            session=async_get_clientsession(hass),
-            verify_ssl=entry.data[CONF_VERIFY_SSL],
-        ),
+        client=client,
         coordinator=coordinator,
         integration=async_get_loaded_integration(hass, entry.domain),
+        device_info=DeviceInfo(
+            identifiers={(DOMAIN, entry.entry_id)},
+            manufacturer="Gatus Integration",
+            entry_type=DeviceEntryType.SERVICE,
+        ),
     )
-
-    await coordinator.async_config_entry_first_refresh()
+    outcomes = OutcomeTracker(
+        entry.options.get(CONF_DEBOUNCE_FAILURES, DEFAULT_DEBOUNCE_FAILURES),
+        entry.options.get(CONF_DEBOUNCE_WINDOW, DEFAULT_DEBOUNCE_WINDOW),
+    )
+    coordinator.outcomes = outcomes
+    snapshot = GatusSnapshot(hass, entry.entry_id, lambda: list(coordinator.store))
+
+    if restored := await snapshot.async_load():
+        # Entities start from the statuses saved by the previous run, and Gatus
+        # is polled once setup is done instead of holding it up.
+        coordinator.async_restore(restored)
+    else:
+        await coordinator.async_config_entry_first_refresh()
+    coordinator.snapshot = snapshot
+    aggregates = GatusAggregateCoordinator(hass, client, coordinator)
+    entry.runtime_data.aggregates = aggregates
 
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    if webhook:
+        async_register_webhook(hass, entry)
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
+    if restored:
+        entry.async_create_background_task(
+            hass, coordinator.async_refresh(), f"{DOMAIN}_refresh"
+        )
+    # Uptimes take a request per endpoint and duration, so they are fetched in
+    # the background rather than holding up setup.
+    entry.async_create_background_task(
+        hass, aggregates.async_refresh(), f"{DOMAIN}_aggregates_refresh"
+    )
+    history = GatusHistoryImporter(hass, entry.entry_id, coordinator)
+    entry.async_on_unload(
+        async_track_time_interval(
+            hass,
+            history.async_import,
+            HISTORY_IMPORT_INTERVAL,
+            name=f"{DOMAIN}_history_import",
+        )
+    )
+    entry.async_create_background_task(
+        hass, history.async_import(), f"{DOMAIN}_history_import"
+    )
 
     LOGGER.info("Integration %s has been set up", entry.title)
     return True
@@ -64,10 +143,18 @@ async def async_unload_entry(
     return await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
 
+async def async_remove_entry(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+) -> None:
+    """Remove the snapshot and history watermarks of a removed entry."""
+    await GatusSnapshot(hass, entry.entry_id, list).async_remove()
+    await GatusHistoryImporter(hass, entry.entry_id, []).async_remove()
+
+
 async def async_reload_entry(
     hass: HomeAssistant,
     entry: GatusConfigEntry,
 ) -> None:
-    """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    """Reload config entry, running the cleanup it registered on unload."""
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,156 @@
+"""Columnar statistics over the result histories of many endpoints."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+# Percentiles of the response time computed for each endpoint and group.
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass(frozen=True, slots=True)
+class ResultStatistics:
+    """
+    ResultStatistics holds a row of statistics for each endpoint, or group.
+
+    Rows without any result have NaN ratios and percentiles.
+    """
+
+    names: list[str]
+    results: np.ndarray
+    # Ratio of successful results.
+    uptime: np.ndarray
+    # Ratio of results with errors.
+    error_rate: np.ndarray
+    # Response times at each of PERCENTILES, in nanoseconds: one column each.
+    percentiles: np.ndarray
+
+    def as_dict(self) -> dict[str, dict[str, Any]]:
+        """Return the statistics by name, with None for missing values."""
+        return {
+            name: {
+                "results": int(self.results[row]),
+                "uptime": _value(self.uptime[row]),
+                "error_rate": _value(self.error_rate[row]),
+                **{
+                    f"p{percentile}": _value(self.percentiles[row, column])
+                    for column, percentile in enumerate(PERCENTILES)
+                },
+            }
+            for row, name in enumerate(self.names)
+        }
+
+
+def _value(value: np.floating) -> float | None:
+    """Return value as a float, or None if it is NaN."""
+    return None if np.isnan(value) else float(value)
+
+
+@dataclass(frozen=True, slots=True)
+class ResultColumns:
+    """
+    ResultColumns packs the results of many endpoints into contiguous arrays.
+
+    The results of the endpoint at index i are at offsets[i]:offsets[i + 1] of the
+    durations, successes and errors columns, oldest first.
+    """
+
+    keys: list[str]
+    groups: list[str]
+    offsets: np.ndarray
+    # Response times, in nanoseconds.
+    durations: np.ndarray
+    successes: np.ndarray
+    # Whether each result has errors.
+    errors: np.ndarray
+
+    @classmethod
+    def from_payload(cls: type[ResultColumns], data: list[dict]) -> ResultColumns:
+        """Pack the results of a statuses payload fetched with their history."""
+        histories = [endpoint.get("results") or [] for endpoint in data]
+        results = [result for history in histories for result in history]
+        return cls(
+            keys=[endpoint["key"] for endpoint in data],
+            groups=[endpoint.get("group", "") for endpoint in data],
+            offsets=np.concatenate(
+                ([0], np.cumsum([len(history) for history in histories]))
+            ).astype(np.int64),
+            durations=np.fromiter(
+                (result["duration"] for result in results),
+                dtype=np.float64,
+                count=len(results),
+            ),
+            successes=np.fromiter(
+                (result["success"] for result in results),
+                dtype=np.bool_,
+                count=len(results),
+            ),
+            errors=np.fromiter(
+                (bool(result.get("errors")) for result in results),
+                dtype=np.bool_,
+                count=len(results),
+            ),
+        )
+
+    def by_endpoint(self) -> ResultStatistics:
+        """Return the statistics of each endpoint, by key."""
+        return _segment_statistics(
+            self.keys, self.offsets, self.durations, self.successes, self.errors
+        )
+
+    def by_group(self) -> ResultStatistics:
+        """Return the statistics of each group, over all of its endpoints' results."""
+        names, endpoint_groups = np.unique(np.asarray(self.groups), return_inverse=True)
+        result_groups = np.repeat(endpoint_groups, np.diff(self.offsets))
+        # Results only move between groups, so each group's stay in order.
+        order = np.argsort(result_groups, kind="stable")
+        offsets = np.concatenate(
+            ([0], np.cumsum(np.bincount(result_groups, minlength=len(names))))
+        )
+        return _segment_statistics(
+            names.tolist(),
+            offsets,
+            self.durations[order],
+            self.successes[order],
+            self.errors[order],
+        )
+
+
+def _segment_statistics(
+    names: list[str],
+    offsets: np.ndarray,
+    durations: np.ndarray,
+    successes: np.ndarray,
+    errors: np.ndarray,
+) -> ResultStatistics:
+    """Compute the statistics of every contiguous segment of results at once."""
+    counts = np.diff(offsets)
+    segments = np.repeat(np.arange(len(names)), counts)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        uptime = np.bincount(segments, successes, minlength=len(names)) / counts
+        error_rate = np.bincount(segments, errors, minlength=len(names)) / counts
+
+    percentiles = np.full((len(names), len(PERCENTILES)), np.nan)
+    if len(durations):
+        # Sort the durations within each segment, then interpolate linearly
+        # between the closest ranks, as numpy.percentile does by default.
+        ordered = durations[np.lexsort((durations, segments))]
+        ranks = np.asarray(PERCENTILES) / 100 * (counts[:, np.newaxis] - 1)
+        positions = offsets[:-1, np.newaxis] + ranks
+        lower = np.clip(np.floor(positions).astype(np.int64), 0, len(ordered) - 1)
+        upper = np.clip(np.ceil(positions).astype(np.int64), 0, len(ordered) - 1)
+        values = ordered[lower] + (ordered[upper] - ordered[lower]) * (
+            positions - np.floor(positions)
+        )
+        percentiles = np.where(counts[:, np.newaxis] > 0, values, np.nan)
+
+    return ResultStatistics(
+        names=names,
+        results=counts,
+        uptime=uptime,
+        error_rate=error_rate,
+        percentiles=percentiles,
+    )
@@ -2,24 +2,68 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any
+import hashlib
+import json
+import time
+from contextlib import asynccontextmanager
+from dataclasses import MISSING, dataclass, fields, replace
+from datetime import UTC, datetime
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING, Any, get_type_hints
 from urllib.parse import urljoin
 
 import async_timeout
 from aiohttp import (
     ClientConnectionError,
     ClientConnectorDNSError,
+    ClientResponseError,
+    ClientSession,
     ClientSSLError,
+    TCPConnector,
+    hdrs,
 )
-from pydantic import BaseModel
+from pydantic import ConfigDict, create_model
+
+from .const import LOGGER, NANOSECONDS_PER_SECOND
+from .decoder import EndpointStreamDecoder
+from .gate import RequestGate
+from .prometheus import MetricsStreamParser
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import AsyncIterable, AsyncIterator, Callable
+
     import aiohttp
 
+    from .analytics import ResultColumns
+    from .prometheus import EndpointMetrics, SeriesLabels
+
 
 API_PATH = "api/v1/"
 CONFIG_PATH = urljoin(API_PATH, "config")
 STATUSES_PATH = urljoin(API_PATH, "endpoints/statuses")
+ENDPOINT_STATUSES_PATH = urljoin(API_PATH, "endpoints/{key}/statuses")
+UPTIME_PATH = urljoin(API_PATH, "endpoints/{key}/uptimes/{duration}")
+METRICS_PATH = "metrics"
+STREAM_CHUNK_SIZE = 64 * 1024
+# Gatus doesn't serve pages of more results than this.
+HISTORY_PAGE_SIZE = 100
+
+# Connection pool tuning for polling a single Gatus instance.
+CONNECTION_LIMIT_PER_HOST = 4
+DNS_CACHE_TTL = 300
+# Longer than the polling interval, so polls reuse the same connection.
+KEEPALIVE_TIMEOUT = 75
+
+# Where statuses are read from: Gatus' JSON API, or its Prometheus metrics.
+DATA_SOURCE_API = "api"
+DATA_SOURCE_METRICS = "metrics"
+
+# Response validators, and the request headers that send them back.
+CONDITIONAL_HEADERS = {
+    hdrs.ETAG: hdrs.IF_NONE_MATCH,
+    hdrs.LAST_MODIFIED: hdrs.IF_MODIFIED_SINCE,
+}
 
 
 class GatusApiClientError(Exception):
@@ -42,6 +86,36 @@ class GatusApiClientSSLError(GatusApiClientError):
     """Gatus API Client SSL Exception."""
 
 
+class GatusApiClientNotFoundError(GatusApiClientError):
+    """Gatus API Client Not Found Exception."""
+
+
+def create_session(*, compress: bool = True) -> ClientSession:
+    """
+    Create a client session pooling connections to a single Gatus instance.
+
+    The session owns its connector, so it must be closed by its creator.
+    Responses are requested compressed unless compress is False.
+    """
+    return ClientSession(
+        connector=TCPConnector(
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            keepalive_timeout=KEEPALIVE_TIMEOUT,
+        ),
+        headers=None if compress else {hdrs.ACCEPT_ENCODING: "identity"},
+    )
+
+
+async def _hash_chunks(
+    chunks: AsyncIterable[bytes], update: Callable[[bytes], None]
+) -> AsyncIterator[bytes]:
+    """Hash the chunks of a body as they are passed on to the stream decoder."""
+    async for chunk in chunks:
+        update(chunk)
+        yield chunk
+
+
 class ConfigResponse:
     """ConfigResponse is the response from the config endpoint in Gatus."""
 
@@ -51,8 +125,25 @@ class ConfigResponse:
         self.authenticated = data.get("authenticated", False)
 
 
-class GatusEndpointStatus(BaseModel):
-    """Status is a single endpoint status in gatus."""
+@dataclass
+class FetchStats:
+    """FetchStats describes the cost of a request to Gatus."""
+
+    path: str
+    bytes_transferred: int
+    decode_time: float
+    # Time spent building status records from the decoded JSON.
+    build_time: float = 0.0
+
+
+@dataclass(slots=True)
+class GatusEndpointStatus:
+    """
+    Status is a single endpoint status in gatus.
+
+    Statuses are built for every endpoint on every poll, so they are plain slotted
+    records. Pass validate=True to from_dict to check their types strictly.
+    """
 
     name: str
     group: str
@@ -62,50 +153,133 @@ class GatusEndpointStatus(BaseModel):
     success: bool
     response_time: int
     errors: list[str]
+    # The Gatus instance reporting the endpoint, when several are federated.
+    instance: str = ""
+    # Whether last_checked was made up on receipt rather than reported by Gatus,
+    # as for alerts and metrics.
+    estimated: bool = False
 
     @classmethod
-    def from_dict(cls: type[GatusEndpointStatus], data: dict) -> GatusEndpointStatus:
+    def from_dict(
+        cls: type[GatusEndpointStatus],
+        data: dict,
+        *,
+        validate: bool = False,
+    ) -> GatusEndpointStatus:
         """Status is a single endpoint status in gatus."""
         last_check = data["results"][-1]
 
+        fields = {
+            "name": data["name"],
+            "group": data.get("group", ""),
+            "key": data["key"],
+            "hostname": last_check["hostname"],
+            "last_checked": last_check["timestamp"],
+            "success": last_check["success"],
+            "response_time": last_check["duration"],
+            "errors": last_check.get("errors", []),
+        }
+        if validate:
+            _ENDPOINT_STATUS_SCHEMA.model_validate(fields)
+        return cls(**fields)
+
+
+# Strict pydantic schema for GatusEndpointStatus, only used when validating.
+_ENDPOINT_STATUS_SCHEMA = create_model(
+    "GatusEndpointStatusSchema",
+    __config__=ConfigDict(strict=True),
+    **{
+        field.name: (
+            get_type_hints(GatusEndpointStatus)[field.name],
+            ... if field.default is MISSING else field.default,
+        )
+        for field in fields(GatusEndpointStatus)
+    },
+)
+
+
+@dataclass(slots=True)
+class GatusResult:
+    """GatusResult is a single check of an endpoint, from its history."""
+
+    timestamp: datetime
+    success: bool
+    # Response time, in nanoseconds.
+    duration: int
+
+    @classmethod
+    def from_dict(cls: type[GatusResult], data: dict) -> GatusResult:
+        """GatusResult is a single check of an endpoint, from its history."""
         return cls(
-            name=data["name"],
-            group=data.get("group", ""),
-            key=data["key"],
-            hostname=last_check["hostname"],
-            last_checked=last_check["timestamp"],
-            success=last_check["success"],
-            response_time=last_check["duration"],
-            errors=last_check.get("errors", []),
+            timestamp=datetime.fromisoformat(data["timestamp"]),
+            success=data["success"],
+            duration=data["duration"],
         )
 
 
-class StatusesResponse(BaseModel):
+@dataclass(slots=True)
+class StatusesResponse:
     """StatusesResponse is a list of Statuses from the Gatus status endpoint."""
 
     statuses: list[GatusEndpointStatus]
 
     @classmethod
-    def from_list(cls: type[StatusesResponse], data: list[dict]) -> StatusesResponse:
+    def from_list(
+        cls: type[StatusesResponse],
+        data: list[dict],
+        *,
+        validate: bool = False,
+    ) -> StatusesResponse:
         """StatusesResponse is a list of Statuses from the Gatus status endpoint."""
         return cls(
-            statuses=[GatusEndpointStatus.from_dict(endpoint) for endpoint in data]
+            statuses=[
+                GatusEndpointStatus.from_dict(endpoint, validate=validate)
+                for endpoint in data
+            ]
         )
 
 
 class GatusApiClient:
     """Sample API Client."""
 
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         url: str,
         session: aiohttp.ClientSession,
         verify_ssl: bool,  # noqa: FBT001
+        *,
+        latest_only: bool = True,
+        validate: bool = False,
+        data_source: str = DATA_SOURCE_API,
+        request_ttl: float = 0.0,
     ) -> None:
-        """Initialize the API client."""
+        """
+        Initialize the API client.
+
+        Concurrent calls for the same request share a single one, and its result
+        is reused for request_ttl seconds.
+        """
         self._url = url
         self._verify_ssl = verify_ssl
         self._session = session
+        self._latest_only = latest_only
+        self._validate = validate
+        self._cached: StatusesResponse | None = None
+        self._validators: dict[str, str] = {}
+        self._body_digest: bytes | None = None
+        self._data_source = data_source
+        # The metrics of the last scrape, to tell which endpoints were checked since.
+        self._metrics: dict[str, EndpointMetrics] = {}
+        self._metric_labels: dict[str, SeriesLabels] = {}
+        self._gate = RequestGate(request_ttl)
+        # Refreshes answered by, and without, the cached statuses.
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def url(self) -> str:
+        """Return the base URL of the Gatus instance."""
+        return self._url
 
     async def async_get_config(self) -> ConfigResponse:
         """Get the configuration."""
@@ -113,19 +287,270 @@ class GatusApiClient:
         return ConfigResponse(data)
 
     async def async_get_statuses(self) -> StatusesResponse:
-        """Get the statuses."""
-        data = await self._get(STATUSES_PATH)
-        return StatusesResponse.from_list(data)
+        """
+        Get the statuses.
+
+        When the statuses haven't changed since the last call, the previous
+        StatusesResponse is returned as-is. Gatus sends no ETag or Last-Modified
+        header, so this is usually told by hashing the body while it is decoded:
+        the decoding is still paid, but nothing downstream of it is.
+        """
+        response, _ = await self.async_fetch_statuses()
+        return response
+
+    async def async_fetch_statuses(self) -> tuple[StatusesResponse, FetchStats]:
+        """Get the statuses along with the cost of the request that fetched them."""
+        return await self._gate.async_call(STATUSES_PATH, self._async_get_statuses)
+
+    async def _async_get_statuses(self) -> tuple[StatusesResponse, FetchStats]:
+        """Get the statuses from the configured data source."""
+        if self._data_source == DATA_SOURCE_METRICS:
+            try:
+                return await self._async_get_statuses_from_metrics()
+            except GatusApiClientNotFoundError:
+                LOGGER.warning(
+                    "Gatus doesn't expose metrics, reading statuses from its API"
+                )
+                self._data_source = DATA_SOURCE_API
+        return await self._async_get_statuses_from_api()
 
-    async def _get(self, path: str) -> Any:
-        """Make a GET request."""
-        try:
-            async with async_timeout.timeout(10):
-                response = await self._session.get(
-                    urljoin(self._url, path), ssl=self._verify_ssl
+    async def _async_get_statuses_from_api(
+        self,
+    ) -> tuple[StatusesResponse, FetchStats]:
+        """Get the statuses from the JSON API."""
+        # Gatus' page/pageSize parameters paginate each endpoint's results,
+        # not the endpoint list: every endpoint is returned by one request.
+        params = {"pageSize": 1} if self._latest_only else None
+        headers = {}
+        if self._cached is not None:
+            headers = {
+                CONDITIONAL_HEADERS[name]: value
+                for name, value in self._validators.items()
+            }
+        async with self._request(STATUSES_PATH, params, headers) as response:
+            if response.status == HTTPStatus.NOT_MODIFIED and self._cached is not None:
+                return self._cache_hit(0)
+            self._validators = {
+                name: response.headers[name]
+                for name in CONDITIONAL_HEADERS
+                if name in response.headers
+            }
+            chunks = response.content.iter_chunked(STREAM_CHUNK_SIZE)
+            hasher = None
+            if not self._validators:
+                # Gatus sends no validators, so an unchanged body is told by its
+                # digest instead, hashed as it streams into the decoder.
+                hasher = hashlib.blake2b(digest_size=16)
+                chunks = _hash_chunks(chunks, hasher.update)
+            statuses, stats = await self._decode_statuses(chunks)
+        digest = hasher.digest() if hasher is not None else None
+        if digest is not None and digest == self._body_digest:
+            # The body was decoded for nothing, but the cached statuses are still
+            # returned, so the store and entities are left alone.
+            self.cache_hits += 1
+            return self._cached, stats  # type: ignore[return-value]
+        self._body_digest = digest
+        self._cached = statuses
+        self.cache_misses += 1
+        return statuses, stats
+
+    async def async_get_history(self) -> ResultColumns:
+        """Get the results Gatus keeps for every endpoint, packed into columns."""
+        # NumPy is only imported once history is asked for, not with the client.
+        from .analytics import ResultColumns  # noqa: PLC0415
+
+        data = await self._get(STATUSES_PATH, {"pageSize": HISTORY_PAGE_SIZE})
+        return ResultColumns.from_payload(data)
+
+    async def async_get_endpoint_results(
+        self, key: str, since: datetime | None = None
+    ) -> list[GatusResult]:
+        """Get the results of an endpoint checked after since, oldest first."""
+        path = ENDPOINT_STATUSES_PATH.format(key=key)
+        results: list[GatusResult] = []
+        # Pages go back in time from the latest results, which come first.
+        page = 0
+        while True:
+            page += 1
+            data = await self._get(path, {"page": page, "pageSize": HISTORY_PAGE_SIZE})
+            page_results = [
+                GatusResult.from_dict(result) for result in data.get("results") or []
+            ]
+            newer = [
+                result
+                for result in page_results
+                if since is None or result.timestamp > since
+            ]
+            results[:0] = newer
+            if len(page_results) < HISTORY_PAGE_SIZE or len(newer) < len(page_results):
+                return results
+
+    async def async_get_uptime(self, key: str, duration: str) -> float:
+        """Get the uptime of an endpoint over duration, as a ratio."""
+        path = UPTIME_PATH.format(key=key, duration=duration)
+        async with self._request(path) as response:
+            return float(await response.text())
+
+    async def _async_get_statuses_from_metrics(
+        self,
+    ) -> tuple[StatusesResponse, FetchStats]:
+        """
+        Get the statuses from the Prometheus metrics.
+
+        Metrics have no hostnames, errors or check times, so the JSON API is read
+        instead whenever an endpoint is new, failing or can't be told apart.
+        """
+        parser = MetricsStreamParser(self._metric_labels)
+        size = 0
+        decode_time = 0.0
+        async with self._request(METRICS_PATH) as response:
+            async for chunk in response.content.iter_chunked(STREAM_CHUNK_SIZE):
+                size += len(chunk)
+                started = time.perf_counter()
+                parser.feed(chunk)
+                decode_time += time.perf_counter() - started
+        started = time.perf_counter()
+        metrics = parser.close()
+        decoded = time.perf_counter()
+        statuses = self._statuses_from_metrics(metrics)
+        build_time = time.perf_counter() - decoded
+        decode_time += decoded - started
+
+        self._metrics = metrics
+        self._metric_labels = parser.labels
+        if statuses is None:
+            return await self._async_get_statuses_from_api()
+        if statuses is self._cached:
+            return self._cache_hit(size, METRICS_PATH)
+        self._cached = statuses
+        self.cache_misses += 1
+        return statuses, FetchStats(
+            path=METRICS_PATH,
+            bytes_transferred=size,
+            decode_time=decode_time,
+            build_time=build_time,
+        )
+
+    def _statuses_from_metrics(
+        self, metrics: dict[str, EndpointMetrics]
+    ) -> StatusesResponse | None:
+        """
+        Update the cached statuses from metrics.
+
+        Returns the cached StatusesResponse itself when no endpoint was checked
+        since the last scrape, or None when the JSON API has to be read.
+        """
+        if self._cached is None:
+            return None
+        previous = {status.key: status for status in self._cached.statuses}
+        if len(previous) != len(metrics):
+            return None
+        checked_at = datetime.now(UTC).isoformat()
+        statuses = []
+        changed = False
+        for key, endpoint in metrics.items():
+            status = previous.get(key)
+            before = self._metrics.get(key)
+            if status is None or before is None:
+                return None
+            if endpoint.results == before.results:
+                statuses.append(status)
+                continue
+            success = endpoint.success
+            if success is None and (endpoint.successes == before.successes) != (
+                endpoint.failures == before.failures
+            ):
+                # Without the success gauge, the counter that moved tells.
+                success = endpoint.successes > before.successes
+            if not success or endpoint.duration is None:
+                return None
+            statuses.append(
+                replace(
+                    status,
+                    success=True,
+                    response_time=round(endpoint.duration * NANOSECONDS_PER_SECOND),
+                    last_checked=checked_at,
+                    errors=[],
+                    estimated=True,
                 )
+            )
+            changed = True
+        return StatusesResponse(statuses=statuses) if changed else self._cached
+
+    def _cache_hit(
+        self, size: int, path: str = STATUSES_PATH
+    ) -> tuple[StatusesResponse, FetchStats]:
+        """Record a refresh answered by the cached statuses."""
+        self.cache_hits += 1
+        stats = FetchStats(path=path, bytes_transferred=size, decode_time=0.0)
+        return self._cached, stats  # type: ignore[return-value]
+
+    async def _decode_statuses(
+        self, chunks: AsyncIterable[bytes]
+    ) -> tuple[StatusesResponse, FetchStats]:
+        """Decode a statuses payload, one endpoint at a time."""
+        decoder = EndpointStreamDecoder(latest_only=self._latest_only)
+        statuses: list[GatusEndpointStatus] = []
+        size = 0
+        decode_time = 0.0
+        build_time = 0.0
+        async for chunk in chunks:
+            size += len(chunk)
+            started = time.perf_counter()
+            endpoints = decoder.feed(chunk)
+            decoded = time.perf_counter()
+            statuses.extend(
+                GatusEndpointStatus.from_dict(endpoint, validate=self._validate)
+                for endpoint in endpoints
+            )
+            decode_time += decoded - started
+            build_time += time.perf_counter() - decoded
+        started = time.perf_counter()
+        endpoints = decoder.close()
+        decoded = time.perf_counter()
+        statuses.extend(
+            GatusEndpointStatus.from_dict(endpoint, validate=self._validate)
+            for endpoint in endpoints
+        )
+        decode_time += decoded - started
+        build_time += time.perf_counter() - decoded
+        return StatusesResponse(statuses=statuses), FetchStats(
+            path=STATUSES_PATH,
+            bytes_transferred=size,
+            decode_time=decode_time,
+            build_time=build_time,
+        )
+
+    async def _get(self, path: str, params: dict[str, Any] | None = None) -> Any:
+        """Make a GET request, shared with concurrent ones for the same data."""
+        key = (path, frozenset((params or {}).items()))
+        return await self._gate.async_call(key, partial(self._async_get, path, params))
+
+    async def _async_get(self, path: str, params: dict[str, Any] | None) -> Any:
+        """Make a GET request, decoding its JSON body."""
+        async with self._request(path, params) as response:
+            return json.loads(await response.read())
+
+    @asynccontextmanager
+    async def _request(
+        self,
+        path: str,
+        params: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+    ) -> AsyncIterator[aiohttp.ClientResponse]:
+        """Make a GET request, translating errors raised while handling it."""
+        try:
+            async with (
+                async_timeout.timeout(10),
+                self._session.get(
+                    urljoin(self._url, path),
+                    params=params,
+                    headers=headers,
+                    ssl=self._verify_ssl,
+                ) as response,
+            ):
                 response.raise_for_status()
-                return await response.json()
+                yield response
         except TimeoutError as e:
             msg = f"Timeout error getting from {path}: {e}"
             raise GatusApiClientTimeoutError(msg) from e
@@ -138,6 +563,11 @@ class GatusApiClient:
         except ClientConnectionError as e:
             msg = f"Connection error getting from {path}: {e}"
             raise GatusApiClientConnectionError(msg) from e
+        except ClientResponseError as e:
+            msg = f"Error getting from {path}: {e}"
+            if e.status == HTTPStatus.NOT_FOUND:
+                raise GatusApiClientNotFoundError(msg) from e
+            raise GatusApiClientError(msg) from e
         except Exception as e:
             msg = f"Error getting from {path}: {e}"
             raise GatusApiClientError(msg) from e
@@ -9,17 +9,64 @@ from homeassistant.components.binary_sensor import (
     BinarySensorEntity,
     BinarySensorEntityDescription,
 )
+from homeassistant.const import Platform
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
 
-from .entity import GatusEntity
+from .const import (
+    ATTRIBUTE_PROFILE_FULL,
+    ATTRIBUTE_PROFILE_MINIMAL,
+    ATTRIBUTE_PROFILE_STANDARD,
+    CONF_ATTRIBUTE_PROFILE,
+    DEFAULT_ATTRIBUTE_PROFILE,
+)
+from .coordinator import GatusDataUpdateCoordinator, GatusFederatedCoordinator
+from .entity import (
+    GatusEntity,
+    GatusGroupEntity,
+    async_remove_stale_entities,
+    async_track_endpoints,
+    async_track_entities,
+    async_track_groups,
+)
 
 if TYPE_CHECKING:  # pragma: no cover
     from homeassistant.core import HomeAssistant
     from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .api import GatusEndpointStatus
-    from .coordinator import GatusDataUpdateCoordinator
     from .data import GatusConfigEntry
 
+# Extra state attributes exposed by each attribute profile. The volatile ones,
+# which change on almost every check, are only part of the full profile.
+VOLATILE_ATTRIBUTES = frozenset({"last_checked", "response_time", "errors"})
+# Attributes shown but not stored by the recorder, as they change on every check
+# of at least some endpoints: consecutive failures grow with each failed check.
+UNRECORDED_ATTRIBUTES = VOLATILE_ATTRIBUTES | {"consecutive_failures"}
+ATTRIBUTE_PROFILES = {
+    ATTRIBUTE_PROFILE_MINIMAL: frozenset({"name", "group", "key"}),
+    ATTRIBUTE_PROFILE_STANDARD: frozenset(
+        {"name", "group", "key", "hostname", "url", "consecutive_failures", "flapping"}
+    ),
+    ATTRIBUTE_PROFILE_FULL: frozenset(
+        {
+            "name",
+            "group",
+            "key",
+            "hostname",
+            "url",
+            "consecutive_failures",
+            "flapping",
+            *VOLATILE_ATTRIBUTES,
+        }
+    ),
+}
+
+
+# Rollups of an endpoint found in several federated instances.
+ROLLUP_ALL = "all"
+ROLLUP_ANY = "any"
+
 ENTITY_DESCRIPTIONS = (
     BinarySensorEntityDescription(
         key="gatus",
@@ -30,13 +77,30 @@ ENTITY_DESCRIPTIONS = (
 
 
 async def async_setup_entry(
-    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    hass: HomeAssistant,
     entry: GatusConfigEntry,
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up the binary_sensor platform."""
     coordinator = entry.runtime_data.coordinator
-    async_add_entities(
+    unique_ids = await async_track_endpoints(
+        entry, coordinator, async_add_entities, _create_entities
+    )
+    unique_ids |= await async_track_groups(
+        entry, coordinator, async_add_entities, _create_group_entities
+    )
+    if isinstance(coordinator, GatusFederatedCoordinator):
+        unique_ids |= await async_track_rollups(entry, coordinator, async_add_entities)
+    # Endpoints removed from Gatus while the integration wasn't running.
+    async_remove_stale_entities(hass, entry, Platform.BINARY_SENSOR, unique_ids)
+
+
+def _create_entities(
+    coordinator: GatusDataUpdateCoordinator,
+    endpoint: GatusEndpointStatus,
+) -> list[GatusBinarySensor]:
+    """Create the binary sensors of an endpoint."""
+    return [
         GatusBinarySensor(
             coordinator=coordinator,
             entity_description=BinarySensorEntityDescription(
@@ -46,12 +110,21 @@ async def async_setup_entry(
             ),
             status=endpoint,
         )
-        for endpoint in coordinator.data.statuses
-    )
+    ]
+
+
+def _create_group_entities(
+    coordinator: GatusDataUpdateCoordinator,
+    group: str,
+) -> list[GatusGroupBinarySensor]:
+    """Create the binary sensors of a group."""
+    return [GatusGroupBinarySensor(coordinator, group)]
 
 
 class GatusBinarySensor(GatusEntity, BinarySensorEntity):
-    """Gatus binary_sensor class."""
+    """Gatus binary_sensor class, the only endpoint entity with extra attributes."""
+
+    _unrecorded_attributes = UNRECORDED_ATTRIBUTES
 
     def __init__(
         self,
@@ -60,11 +133,141 @@ class GatusBinarySensor(GatusEntity, BinarySensorEntity):
         status: GatusEndpointStatus,
     ) -> None:
         """Initialize the binary_sensor class."""
+        self._attributes = ATTRIBUTE_PROFILES[
+            coordinator.config_entry.options.get(
+                CONF_ATTRIBUTE_PROFILE, DEFAULT_ATTRIBUTE_PROFILE
+            )
+        ]
+        # An endpoint's URL only depends on its key, so it is built once.
+        self._url = (
+            coordinator.endpoint_url(status) if "url" in self._attributes else None
+        )
         super().__init__(coordinator, entity_description, status)
         self.entity_description = entity_description
         self.entity_id = f"binary_sensor.gatus_{status.key}"
 
+    def _update_status(self, status: GatusEndpointStatus) -> None:
+        """Update the status the entity reports, along with its attributes."""
+        super()._update_status(status)
+        window = self.coordinator.outcomes.get(status.key)
+        attributes = {
+            "name": status.name,
+            "group": status.group,
+            "key": status.key,
+            "hostname": status.hostname,
+            "last_checked": status.last_checked,
+            "response_time": status.response_time,
+            "errors": status.errors,
+            "url": self._url,
+            "consecutive_failures": window.consecutive_failures if window else 0,
+            "flapping": window.flapping if window else False,
+        }
+        self._attr_extra_state_attributes = {
+            name: value
+            for name, value in attributes.items()
+            if name in self._attributes
+        }
+
     @property
     def is_on(self) -> bool:
-        """Return true if the binary_sensor is on."""
-        return self._status.success
+        """Return true if the endpoint is up, once debounced."""
+        return self.coordinator.endpoint_up(self._status)
+
+
+async def async_track_rollups(
+    entry: GatusConfigEntry,
+    coordinator: GatusFederatedCoordinator,
+    async_add_entities: AddEntitiesCallback,
+) -> set[str]:
+    """Add rollup entities for endpoints found in several instances, and keep them."""
+    return await async_track_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        coordinator.shared_endpoints,
+        lambda endpoint: [
+            GatusRollupBinarySensor(coordinator, *endpoint, rollup)
+            for rollup in (ROLLUP_ALL, ROLLUP_ANY)
+        ],
+    )
+
+
+class GatusRollupBinarySensor(
+    CoordinatorEntity[GatusFederatedCoordinator], BinarySensorEntity
+):
+    """Whether all, or any, of the instances report an endpoint as up."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
+    def __init__(
+        self,
+        coordinator: GatusFederatedCoordinator,
+        group: str,
+        name: str,
+        rollup: str,
+    ) -> None:
+        """Initialize the rollup, only updated when the endpoint changes."""
+        super().__init__(coordinator, context=(group, name))
+        self._group = group
+        self._name = name
+        self._rollup = rollup
+        slug = slugify(f"{group}_{name}" if group else name)
+        entry = coordinator.config_entry
+        self._attr_name = f"{name} {rollup} up"
+        self._attr_unique_id = f"{entry.entry_id}_rollup_{slug}_{rollup}"
+        self._attr_device_info = entry.runtime_data.device_info
+        self.entity_id = f"binary_sensor.gatus_{slug}_{rollup}_up"
+
+    def _statuses(self) -> list[GatusEndpointStatus]:
+        """Return the endpoint's statuses from the instances still answering."""
+        return [
+            status
+            for status in self.coordinator.endpoint_statuses(self._group, self._name)
+            if status.instance not in self.coordinator.failed_instances
+        ]
+
+    @property
+    def available(self) -> bool:
+        """Return whether an instance still reports the endpoint."""
+        return super().available and bool(self._statuses())
+
+    @property
+    def is_on(self) -> bool:
+        """Return whether all, or any, of the instances report the endpoint up."""
+        rollup = all if self._rollup == ROLLUP_ALL else any
+        return rollup(map(self.coordinator.endpoint_up, self._statuses()))
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return how many of the instances report the endpoint up."""
+        statuses = self._statuses()
+        return {
+            "up": sum(map(self.coordinator.endpoint_up, statuses)),
+            "instances": len(statuses),
+        }
+
+
+class GatusGroupBinarySensor(GatusGroupEntity, BinarySensorEntity):
+    """Whether every endpoint of a group is up."""
+
+    _attr_device_class = BinarySensorDeviceClass.CONNECTIVITY
+
+    def __init__(self, coordinator: GatusDataUpdateCoordinator, group: str) -> None:
+        """Initialize the binary sensor of group."""
+        super().__init__(coordinator, group, "up")
+        self._attr_name = f"{group} up"
+        self.entity_id = f"binary_sensor.gatus_group_{self._slug}_up"
+
+    @property
+    def is_on(self) -> bool | None:
+        """Return whether none of the group's endpoints are down, once debounced."""
+        if (aggregate := self._aggregate) is None:
+            return None
+        return aggregate.up
+
+    @property
+    def extra_state_attributes(self) -> dict[str, int]:
+        """Return how many of the group's endpoints are down."""
+        if (aggregate := self._aggregate) is None:
+            return {}
+        return {"endpoints": aggregate.endpoints, "failing": aggregate.failing}
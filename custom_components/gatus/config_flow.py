@@ -2,24 +2,46 @@
 
 import voluptuous as vol
 from homeassistant import config_entries
+from homeassistant.components import webhook
 from homeassistant.const import (
     CONF_NAME,
     CONF_URL,
     CONF_VERIFY_SSL,
+    CONF_WEBHOOK_ID,
 )
+from homeassistant.core import callback
 from homeassistant.helpers import selector
-from homeassistant.helpers.aiohttp_client import async_create_clientsession
 from homeassistant.util import slugify
 
 from .api import (
+    DATA_SOURCE_API,
+    DATA_SOURCE_METRICS,
     GatusApiClient,
     GatusApiClientConnectionError,
     GatusApiClientDNSError,
     GatusApiClientError,
     GatusApiClientSSLError,
     GatusApiClientTimeoutError,
+    create_session,
 )
-from .const import DOMAIN, LOGGER
+from .const import (
+    ATTRIBUTE_PROFILE_FULL,
+    ATTRIBUTE_PROFILE_MINIMAL,
+    ATTRIBUTE_PROFILE_STANDARD,
+    CONF_ATTRIBUTE_PROFILE,
+    CONF_DATA_SOURCE,
+    CONF_DEBOUNCE_FAILURES,
+    CONF_DEBOUNCE_WINDOW,
+    CONF_INSTANCES,
+    CONF_WEBHOOK,
+    DEFAULT_ATTRIBUTE_PROFILE,
+    DEFAULT_DEBOUNCE_FAILURES,
+    DEFAULT_DEBOUNCE_WINDOW,
+    DOMAIN,
+    LOGGER,
+)
+from .coordinator import instance_name
+from .outcomes import OUTCOME_WINDOW
 
 
 class GatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
@@ -27,6 +49,14 @@ class GatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,  # noqa: ARG004
+    ) -> config_entries.OptionsFlow:
+        """Get the options flow for this handler."""
+        return GatusOptionsFlowHandler()
+
     async def async_step_user(
         self,
         user_input: dict | None = None,
@@ -77,23 +107,162 @@ class GatusFlowHandler(config_entries.ConfigFlow, domain=DOMAIN):
         )
 
     async def _test_connection(self, url: str, verifyssl: bool) -> dict[str, str]:  # noqa: FBT001
-        errors: dict[str, str] = {}
-        client = GatusApiClient(url, async_create_clientsession(self.hass), verifyssl)
-        try:
+        if (error := await _async_test_connection(url, verifyssl)) is None:
+            return {}
+        return {"base": error}
+
+
+async def _async_test_connection(url: str, verify_ssl: bool) -> str | None:  # noqa: FBT001
+    """Return the error key of a failed connection to Gatus, if it fails."""
+    try:
+        async with create_session() as session:
+            client = GatusApiClient(url, session, verify_ssl)
             await client.async_get_statuses()
-        except GatusApiClientTimeoutError as e:
-            LOGGER.warning("Timeout error: %s", e)
-            errors["base"] = "timeout"
-        except GatusApiClientSSLError as e:
-            LOGGER.error("SSL error: %s", e)
-            errors["base"] = "ssl"
-        except GatusApiClientDNSError as e:
-            LOGGER.error("DNS error: %s", e)
-            errors["base"] = "dns"
-        except GatusApiClientConnectionError as e:
-            LOGGER.error("Connection error: %s", e)
-            errors["base"] = "connection"
-        except GatusApiClientError as e:
-            LOGGER.error("Error: %s", e)
-            errors["base"] = "unknown"
-        return errors
+    except GatusApiClientTimeoutError as e:
+        LOGGER.warning("Timeout error: %s", e)
+        return "timeout"
+    except GatusApiClientSSLError as e:
+        LOGGER.error("SSL error: %s", e)
+        return "ssl"
+    except GatusApiClientDNSError as e:
+        LOGGER.error("DNS error: %s", e)
+        return "dns"
+    except GatusApiClientConnectionError as e:
+        LOGGER.error("Connection error: %s", e)
+        return "connection"
+    except GatusApiClientError as e:
+        LOGGER.error("Error: %s", e)
+        return "unknown"
+    return None
+
+
+class GatusOptionsFlowHandler(config_entries.OptionsFlow):
+    """Options flow for Gatus Uptime Monitors integration."""
+
+    _webhook_id: str | None = None
+
+    async def async_step_init(
+        self,
+        user_input: dict | None = None,
+    ) -> config_entries.ConfigFlowResult:
+        """Manage the options."""
+        options = self.config_entry.options
+        # Keep the webhook's ID while it stays enabled, so Gatus' config holds,
+        # and submit the ID whose URL the form showed.
+        if self._webhook_id is None:
+            self._webhook_id = (
+                options.get(CONF_WEBHOOK_ID) or webhook.async_generate_id()
+            )
+        webhook_id = self._webhook_id
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            instances = user_input.get(CONF_INSTANCES, [])
+            debounce_failures = int(user_input[CONF_DEBOUNCE_FAILURES])
+            debounce_window = int(user_input[CONF_DEBOUNCE_WINDOW])
+            if debounce_failures > debounce_window:
+                errors = {CONF_DEBOUNCE_FAILURES: "invalid_debounce"}
+            else:
+                errors = await self._validate_instances(instances)
+            if not errors:
+                data = {
+                    CONF_ATTRIBUTE_PROFILE: user_input[CONF_ATTRIBUTE_PROFILE],
+                    CONF_DATA_SOURCE: user_input[CONF_DATA_SOURCE],
+                    CONF_DEBOUNCE_FAILURES: debounce_failures,
+                    CONF_DEBOUNCE_WINDOW: debounce_window,
+                }
+                if instances:
+                    data[CONF_INSTANCES] = instances
+                if user_input[CONF_WEBHOOK]:
+                    data[CONF_WEBHOOK_ID] = webhook_id
+                return self.async_create_entry(data=data)
+        defaults = {**options, **(user_input or {})}
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Required(
+                        CONF_ATTRIBUTE_PROFILE,
+                        default=defaults.get(
+                            CONF_ATTRIBUTE_PROFILE, DEFAULT_ATTRIBUTE_PROFILE
+                        ),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[
+                                ATTRIBUTE_PROFILE_MINIMAL,
+                                ATTRIBUTE_PROFILE_STANDARD,
+                                ATTRIBUTE_PROFILE_FULL,
+                            ],
+                            translation_key=CONF_ATTRIBUTE_PROFILE,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_DATA_SOURCE,
+                        default=defaults.get(CONF_DATA_SOURCE, DATA_SOURCE_API),
+                    ): selector.SelectSelector(
+                        selector.SelectSelectorConfig(
+                            options=[DATA_SOURCE_API, DATA_SOURCE_METRICS],
+                            translation_key=CONF_DATA_SOURCE,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_DEBOUNCE_FAILURES,
+                        default=defaults.get(
+                            CONF_DEBOUNCE_FAILURES, DEFAULT_DEBOUNCE_FAILURES
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=OUTCOME_WINDOW,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Required(
+                        CONF_DEBOUNCE_WINDOW,
+                        default=defaults.get(
+                            CONF_DEBOUNCE_WINDOW, DEFAULT_DEBOUNCE_WINDOW
+                        ),
+                    ): selector.NumberSelector(
+                        selector.NumberSelectorConfig(
+                            min=1,
+                            max=OUTCOME_WINDOW,
+                            mode=selector.NumberSelectorMode.BOX,
+                        ),
+                    ),
+                    vol.Optional(
+                        CONF_INSTANCES,
+                        default=defaults.get(CONF_INSTANCES, []),
+                    ): selector.TextSelector(
+                        selector.TextSelectorConfig(
+                            type=selector.TextSelectorType.URL,
+                            multiple=True,
+                        )
+                    ),
+                    vol.Required(
+                        CONF_WEBHOOK,
+                        default=defaults.get(CONF_WEBHOOK, CONF_WEBHOOK_ID in options),
+                    ): selector.BooleanSelector(),
+                }
+            ),
+            errors=errors,
+            description_placeholders={
+                "webhook_url": webhook.async_generate_url(self.hass, webhook_id),
+            },
+        )
+
+    async def _validate_instances(self, instances: list[str]) -> dict[str, str]:
+        """Check additional instances are distinct, and that new ones answer."""
+        names = [instance_name(url) for url in instances]
+        if (
+            len(set(names)) != len(names)
+            or instance_name(self.config_entry.data[CONF_URL]) in names
+        ):
+            return {CONF_INSTANCES: "duplicate_instance"}
+        for url in instances:
+            if url in self.config_entry.options.get(CONF_INSTANCES, []):
+                continue
+            error = await _async_test_connection(
+                url, self.config_entry.data[CONF_VERIFY_SSL]
+            )
+            if error is not None:
+                return {CONF_INSTANCES: error}
+        return {}
@@ -4,6 +4,43 @@ from datetime import timedelta
 from logging import Logger, getLogger
 
 DOMAIN = "gatus"
+CONF_ATTRIBUTE_PROFILE = "attribute_profile"
+ATTRIBUTE_PROFILE_MINIMAL = "minimal"
+ATTRIBUTE_PROFILE_STANDARD = "standard"
+ATTRIBUTE_PROFILE_FULL = "full"
+DEFAULT_ATTRIBUTE_PROFILE = ATTRIBUTE_PROFILE_STANDARD
+CONF_WEBHOOK = "webhook"
+CONF_DATA_SOURCE = "data_source"
+CONF_INSTANCES = "instances"
+CONF_DEBOUNCE_FAILURES = "debounce_failures"
+CONF_DEBOUNCE_WINDOW = "debounce_window"
+DEFAULT_DEBOUNCE_FAILURES = 1
+DEFAULT_DEBOUNCE_WINDOW = 1
 COORDINATOR_UPDATE_INTERVAL = timedelta(seconds=10)
+COORDINATOR_MIN_UPDATE_INTERVAL = timedelta(seconds=5)
+COORDINATOR_MAX_UPDATE_INTERVAL = timedelta(minutes=5)
+COORDINATOR_MAX_BACKOFF_INTERVAL = timedelta(minutes=10)
+WEBHOOK_RECONCILE_INTERVAL = timedelta(minutes=5)
+# Snapshots are saved at most this often, and when Home Assistant stops.
+SNAPSHOT_SAVE_DELAY = timedelta(minutes=1)
+# How long a federated instance may take to answer before it counts as failed.
+INSTANCE_TIMEOUT = timedelta(seconds=5)
+# Requests made by several callers at once are shared, and their results reused
+# for this long, well under the shortest polling interval.
+REQUEST_CACHE_TTL = timedelta(seconds=1)
+AGGREGATE_UPDATE_INTERVAL = timedelta(minutes=5)
+AGGREGATE_BATCH_SIZE = 50
+# Endpoints whose entities are created at setup before yielding to the loop.
+ENTITY_BATCH_SIZE = 250
+UPTIME_DURATIONS = ("1h", "24h", "7d")
+# Gatus keeps 100 results per endpoint by default, so history is imported well
+# before frequently checked endpoints drop results that weren't imported yet.
+HISTORY_IMPORT_INTERVAL = timedelta(minutes=10)
+HISTORY_BATCH_SIZE = 50
+HISTORY_SAVE_DELAY = timedelta(seconds=10)
+# Gatus reports durations in nanoseconds.
+NANOSECONDS_PER_MILLISECOND = 1_000_000
+NANOSECONDS_PER_SECOND = 1_000_000_000
+MILLISECONDS_PER_SECOND = 1_000
 
 LOGGER: Logger = getLogger(__package__)
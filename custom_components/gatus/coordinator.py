@@ -2,21 +2,51 @@
 
 from __future__ import annotations
 
+import asyncio
+import time
+from collections import defaultdict
+from dataclasses import replace
 from typing import TYPE_CHECKING
+from urllib.parse import urlparse
 
+from homeassistant.const import CONF_URL
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import slugify
 
 from .api import (
+    STATUSES_PATH,
+    FetchStats,
     GatusApiClient,
     GatusApiClientError,
+    GatusApiClientNotFoundError,
+    GatusApiClientTimeoutError,
     StatusesResponse,
 )
-from .const import COORDINATOR_UPDATE_INTERVAL, DOMAIN, LOGGER
+from .const import (
+    AGGREGATE_BATCH_SIZE,
+    AGGREGATE_UPDATE_INTERVAL,
+    COORDINATOR_UPDATE_INTERVAL,
+    DOMAIN,
+    INSTANCE_TIMEOUT,
+    LOGGER,
+    UPTIME_DURATIONS,
+    WEBHOOK_RECONCILE_INTERVAL,
+)
+from .groups import GroupAggregates, changed_group_contexts
+from .metrics import RefreshMetrics, RefreshMetricsWindow
+from .outcomes import OutcomeTracker
+from .scheduler import AdaptivePollInterval
+from .store import GatusStatusStore, StatusesDelta
 
 if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Hashable
+
     from homeassistant.core import HomeAssistant
 
+    from .api import GatusEndpointStatus
     from .data import GatusConfigEntry
+    from .snapshot import GatusSnapshot
 
 
 # https://developers.home-assistant.io/docs/integration_fetching_data#coordinated-single-api-poll-for-data-for-all-entities
@@ -32,6 +62,8 @@ class GatusDataUpdateCoordinator(DataUpdateCoordinator):
         hass: HomeAssistant,
         config_entry_id: str,
         client: GatusApiClient,
+        *,
+        webhook: bool = False,
     ) -> None:
         """Initialize coordinator."""
         super().__init__(
@@ -42,12 +74,398 @@ class GatusDataUpdateCoordinator(DataUpdateCoordinator):
         )
         self._config_entry_id = config_entry_id
         self.client = client
+        self.store = GatusStatusStore()
+        self.scheduler = AdaptivePollInterval()
+        if webhook:
+            # Gatus pushes alerts, so polls only reconcile what was missed.
+            self.scheduler = AdaptivePollInterval(
+                default=WEBHOOK_RECONCILE_INTERVAL,
+                minimum=WEBHOOK_RECONCILE_INTERVAL,
+                maximum=WEBHOOK_RECONCILE_INTERVAL,
+            )
+            self.update_interval = WEBHOOK_RECONCILE_INTERVAL
+        # None means every listener must be updated.
+        self.delta: StatusesDelta | None = None
+        self._pushed = False
+        # Federated instances whose endpoints are unavailable after failing.
+        self.failed_instances: set[str] = set()
+        self.snapshot: GatusSnapshot | None = None
+        self.outcomes = OutcomeTracker()
+        self.groups = GroupAggregates(self.store)
+        self.metrics = RefreshMetricsWindow()
+        # The metrics of the last refresh, until its entity writes are timed.
+        self._pending_metrics: RefreshMetrics | None = None
+
+    @property
+    def cache_hits(self) -> int:
+        """Return how many refreshes were answered by the client's cache."""
+        return self.client.cache_hits
+
+    @property
+    def cache_misses(self) -> int:
+        """Return how many refreshes had to decode a new statuses payload."""
+        return self.client.cache_misses
+
+    def endpoint_client(
+        self, status: GatusEndpointStatus
+    ) -> tuple[GatusApiClient, str]:
+        """Return the client of the instance reporting status, and its key there."""
+        return self.client, status.key
+
+    def endpoint_up(self, status: GatusEndpointStatus) -> bool:
+        """Return whether the endpoint is up, debouncing its latest checks."""
+        return self.outcomes.is_up(status.key, success=status.success)
+
+    def endpoint_url(self, status: GatusEndpointStatus) -> str:
+        """Return the URL of the endpoint's page in Gatus."""
+        return f"{self.config_entry.data[CONF_URL]}/endpoints/{status.key}"
 
     async def _async_update_data(self) -> StatusesResponse:
         """Update data via library."""
+        started = time.perf_counter()
         try:
-            response = await self.client.async_get_statuses()
+            response, stats = await self._async_fetch_statuses()
         except GatusApiClientError as exception:
+            self.update_interval = self.scheduler.on_failure()
+            self.metrics.record(
+                RefreshMetrics(
+                    network=time.perf_counter() - started,
+                    error=type(exception).__name__,
+                )
+            )
             raise UpdateFailed(exception) from exception
+        fetched = time.perf_counter()
+
+        metrics = RefreshMetrics(
+            network=fetched - started,
+            endpoints=len(response.statuses),
+            cached=response is self.data,
+        )
+        LOGGER.debug(
+            "Fetched %s bytes from %s, decoded in %.3fs, built in %.3fs",
+            stats.bytes_transferred,
+            stats.path,
+            stats.decode_time,
+            stats.build_time,
+        )
+        metrics.network -= stats.decode_time + stats.build_time
+        metrics.decode = stats.decode_time
+        metrics.build = stats.build_time
+        metrics.bytes_transferred = stats.bytes_transferred
+
+        if metrics.cached and not self._pushed:
+            # The client answered from its cache: nothing changed in Gatus.
+            delta = StatusesDelta()
+        else:
+            delta = self._apply(self.store.update(response.statuses))
+            self._pushed = False
+        metrics.store = time.perf_counter() - fetched
+        if self.snapshot is not None and delta.keys:
+            self.snapshot.async_schedule_save()
+        self.update_interval = self.scheduler.on_success(self.store, delta)
+        # Entities went unavailable while updates were failing, so every one
+        # of them is refreshed when the coordinator recovers.
+        self.delta = delta if self.last_update_success else None
+        self.metrics.record(metrics)
+        self._pending_metrics = metrics
+        return response
+
+    @callback
+    def async_push_status(self, status: GatusEndpointStatus) -> None:
+        """Apply the status of one endpoint pushed by Gatus, between polls."""
+        self.delta = self._apply(self.store.update_one(status))
+        # The store now differs from Gatus' last response, even if it's cached.
+        self._pushed = True
+        if self.snapshot is not None:
+            self.snapshot.async_schedule_save()
+        self.async_update_listeners()
+
+    @callback
+    def async_restore(self, statuses: list[GatusEndpointStatus]) -> None:
+        """Start from statuses saved by a previous run, until the first refresh."""
+        self.data = StatusesResponse(statuses=statuses)
+        self._apply(self.store.update(statuses))
+
+    def _apply(self, delta: StatusesDelta) -> StatusesDelta:
+        """Update the outcomes and group aggregates with a store update's delta."""
+        self.outcomes.update(self.store, delta)
+        self.groups.update(delta, self.endpoint_up)
+        return delta
+
+    async def _async_fetch_statuses(self) -> tuple[StatusesResponse, FetchStats]:
+        """Fetch the statuses of the endpoints from Gatus."""
+        return await self.client.async_fetch_statuses()
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Update the listeners, timing the entity writes of the last refresh."""
+        started = time.perf_counter()
+        self._async_notify_listeners()
+        if (metrics := self._pending_metrics) is not None:
+            metrics.write = time.perf_counter() - started
+            self._pending_metrics = None
+
+    @callback
+    def _async_notify_listeners(self) -> None:
+        """Update the listeners of the endpoints changed by the last refresh."""
+        if self.delta is None or not self.last_update_success:
+            super().async_update_listeners()
+            return
+
+        contexts = self._changed_contexts(self.delta)
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or context in contexts:
+                update_callback()
+
+    def _changed_contexts(self, delta: StatusesDelta) -> set[Hashable]:
+        """Return the listener contexts of the entities delta affected."""
+        return {*delta.keys, *changed_group_contexts(self.store, delta)}
+
+
+def instance_name(url: str) -> str:
+    """Return the name namespacing the endpoint keys of a federated instance."""
+    parsed = urlparse(url)
+    return slugify(f"{parsed.netloc}{parsed.path}")
+
+
+class GatusFederatedCoordinator(GatusDataUpdateCoordinator):
+    """
+    Coordinator polling several Gatus instances at once, as a single store.
+
+    The keys of the additional instances' endpoints are prefixed with the name of
+    their instance, while the primary instance's keep their own. An instance that
+    fails or times out keeps its endpoints' last statuses, but marks them as
+    unavailable, so it doesn't hold up or fail the others.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        config_entry_id: str,
+        client: GatusApiClient,
+        instances: list[GatusApiClient],
+        *,
+        webhook: bool = False,
+    ) -> None:
+        """Initialize the coordinator with the clients of additional instances."""
+        super().__init__(hass, config_entry_id, client, webhook=webhook)
+        self.instances = {
+            "": client,
+            **{instance_name(instance.url): instance for instance in instances},
+        }
+        # The latest response of each instance, and its namespaced statuses.
+        self._responses: dict[
+            str, tuple[StatusesResponse | None, list[GatusEndpointStatus]]
+        ] = {}
+        # The keys of each group and name's endpoint, across instances.
+        self._endpoint_keys: defaultdict[tuple[str, str], set[str]] = defaultdict(set)
+
+    def endpoint_statuses(self, group: str, name: str) -> list[GatusEndpointStatus]:
+        """Return the statuses of the endpoint named name in group, by instance."""
+        return [
+            status
+            for key in self._endpoint_keys.get((group, name), ())
+            if (status := self.store.get(key)) is not None
+        ]
+
+    def shared_endpoints(self) -> set[tuple[str, str]]:
+        """Return the group and name of endpoints found in several instances."""
+        return {
+            endpoint for endpoint, keys in self._endpoint_keys.items() if len(keys) > 1
+        }
 
+    @property
+    def cache_hits(self) -> int:
+        """Return how many instance refreshes were answered by a client's cache."""
+        return sum(client.cache_hits for client in self.instances.values())
+
+    @property
+    def cache_misses(self) -> int:
+        """Return how many instance refreshes had to decode a new payload."""
+        return sum(client.cache_misses for client in self.instances.values())
+
+    def endpoint_client(
+        self, status: GatusEndpointStatus
+    ) -> tuple[GatusApiClient, str]:
+        """Return the client of the instance reporting status, and its key there."""
+        if not status.instance:
+            return self.client, status.key
+        key = status.key.removeprefix(f"{status.instance}_")
+        return self.instances[status.instance], key
+
+    def endpoint_url(self, status: GatusEndpointStatus) -> str:
+        """Return the URL of the endpoint's page in its Gatus instance."""
+        if not status.instance:
+            return super().endpoint_url(status)
+        client, key = self.endpoint_client(status)
+        return f"{client.url}/endpoints/{key}"
+
+    @callback
+    def async_restore(self, statuses: list[GatusEndpointStatus]) -> None:
+        """Start from statuses saved by a previous run, until the first refresh."""
+        super().async_restore(statuses)
+        # Instances failing the first refresh keep their restored endpoints.
+        by_instance: defaultdict[str, list[GatusEndpointStatus]] = defaultdict(list)
+        for status in statuses:
+            by_instance[status.instance].append(status)
+        self._responses = {
+            instance: (None, instance_statuses)
+            for instance, instance_statuses in by_instance.items()
+            if instance in self.instances
+        }
+
+    def _apply(self, delta: StatusesDelta) -> StatusesDelta:
+        """Index the endpoints delta affected by group and name, then apply it."""
+        for key in delta.keys:
+            if (previous := delta.previous.get(key)) is not None:
+                keys = self._endpoint_keys[previous.group, previous.name]
+                keys.discard(key)
+                if not keys:
+                    del self._endpoint_keys[previous.group, previous.name]
+            if (status := self.store.get(key)) is not None:
+                self._endpoint_keys[status.group, status.name].add(key)
+        return super()._apply(delta)
+
+    def _changed_contexts(self, delta: StatusesDelta) -> set[Hashable]:
+        """Return the contexts of the entities, and rollups, delta affected."""
+        contexts = super()._changed_contexts(delta)
+        for key in delta.keys:
+            for status in (self.store.get(key), delta.previous.get(key)):
+                if status is not None:
+                    contexts.add((status.group, status.name))
+        return contexts
+
+    async def _async_update_data(self) -> StatusesResponse:
+        """Update data, refreshing every entity when an instance fails or recovers."""
+        failed = self.failed_instances
+        response = await super()._async_update_data()
+        if self.failed_instances != failed:
+            self.delta = None
         return response
+
+    async def _async_fetch_statuses(self) -> tuple[StatusesResponse, FetchStats]:
+        """Fetch the statuses of every instance concurrently."""
+        results = await asyncio.gather(
+            *(
+                self._async_fetch_instance(instance, client)
+                for instance, client in self.instances.items()
+            ),
+            return_exceptions=True,
+        )
+        stats = FetchStats(path=STATUSES_PATH, bytes_transferred=0, decode_time=0.0)
+        failed = set()
+        changed = False
+        for instance, result in zip(self.instances, results, strict=True):
+            if isinstance(result, BaseException):
+                if not isinstance(result, GatusApiClientError):
+                    raise result
+                if instance not in self.failed_instances:
+                    LOGGER.warning(
+                        "Gatus instance %s failed: %s",
+                        self.instances[instance].url,
+                        result,
+                    )
+                failed.add(instance)
+                continue
+            instance_changed, instance_stats = result
+            changed |= instance_changed
+            stats.bytes_transferred += instance_stats.bytes_transferred
+            stats.decode_time += instance_stats.decode_time
+            stats.build_time += instance_stats.build_time
+        if len(failed) == len(self.instances):
+            msg = "Every Gatus instance failed"
+            raise GatusApiClientError(msg)
+
+        changed |= failed != self.failed_instances
+        self.failed_instances = failed
+        if not changed and self.data is not None:
+            return self.data, stats
+        return StatusesResponse(
+            statuses=[
+                status
+                for _, statuses in self._responses.values()
+                for status in statuses
+            ]
+        ), stats
+
+    async def _async_fetch_instance(
+        self, instance: str, client: GatusApiClient
+    ) -> tuple[bool, FetchStats]:
+        """Fetch the statuses of one instance, returning whether they changed."""
+        try:
+            async with asyncio.timeout(INSTANCE_TIMEOUT.total_seconds()):
+                response, stats = await client.async_fetch_statuses()
+        except TimeoutError as e:
+            msg = f"Timeout after {INSTANCE_TIMEOUT}"
+            raise GatusApiClientTimeoutError(msg) from e
+        previous = self._responses.get(instance)
+        if previous is not None and previous[0] is response:
+            return False, stats
+        statuses = response.statuses
+        if instance:
+            statuses = [
+                replace(status, key=f"{instance}_{status.key}", instance=instance)
+                for status in statuses
+            ]
+        self._responses[instance] = (response, statuses)
+        return True, stats
+
+
+class GatusAggregateCoordinator(DataUpdateCoordinator[dict[str, dict[str, float]]]):
+    """
+    Class to manage fetching endpoint uptimes, on a slower schedule.
+
+    Data maps each endpoint key to its uptime ratio over each of UPTIME_DURATIONS.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: GatusApiClient,
+        coordinator: GatusDataUpdateCoordinator,
+    ) -> None:
+        """Initialize coordinator."""
+        super().__init__(
+            hass,
+            LOGGER,
+            name=f"{DOMAIN}_aggregates",
+            update_interval=AGGREGATE_UPDATE_INTERVAL,
+        )
+        self.client = client
+        self._coordinator = coordinator
+
+    async def _async_update_data(self) -> dict[str, dict[str, float]]:
+        """Fetch the uptimes of every endpoint, a batch at a time."""
+        statuses = list(self._coordinator.store)
+        data: dict[str, dict[str, float]] = {}
+        try:
+            for start in range(0, len(statuses), AGGREGATE_BATCH_SIZE):
+                batch = statuses[start : start + AGGREGATE_BATCH_SIZE]
+                uptimes = await asyncio.gather(
+                    *(
+                        self._async_fetch_uptimes(
+                            *self._coordinator.endpoint_client(status)
+                        )
+                        for status in batch
+                    )
+                )
+                data.update(
+                    (status.key, endpoint_uptimes)
+                    for status, endpoint_uptimes in zip(batch, uptimes, strict=True)
+                    if endpoint_uptimes is not None
+                )
+        except GatusApiClientError as exception:
+            raise UpdateFailed(exception) from exception
+        return data
+
+    async def _async_fetch_uptimes(
+        self, client: GatusApiClient, key: str
+    ) -> dict[str, float] | None:
+        """Fetch the uptimes of one endpoint, or None if Gatus no longer has it."""
+        try:
+            return {
+                duration: await client.async_get_uptime(key, duration)
+                for duration in UPTIME_DURATIONS
+            }
+        except GatusApiClientNotFoundError:
+            return None
@@ -8,10 +8,11 @@ from typing import TYPE_CHECKING
 from homeassistant.config_entries import ConfigEntry
 
 if TYPE_CHECKING:  # pragma: no cover
+    from homeassistant.helpers.device_registry import DeviceInfo
     from homeassistant.loader import Integration
 
     from .api import GatusApiClient
-    from .coordinator import GatusDataUpdateCoordinator
+    from .coordinator import GatusAggregateCoordinator, GatusDataUpdateCoordinator
 
 
 type GatusConfigEntry = ConfigEntry[GatusData]
@@ -24,3 +25,6 @@ class GatusData:
     client: GatusApiClient
     coordinator: GatusDataUpdateCoordinator
     integration: Integration
+    # Built once at setup and shared by all of the entry's entities.
+    device_info: DeviceInfo
+    aggregates: GatusAggregateCoordinator | None = None
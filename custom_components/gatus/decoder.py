@@ -0,0 +1,124 @@
+"""Decoders for Gatus API payloads."""
+
+from __future__ import annotations
+
+import codecs
+import json
+import re
+from typing import Any
+
+_DECODER = json.JSONDecoder()
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+RESULTS_KEY = "results"
+
+
+def _skip_whitespace(text: str, index: int) -> int:
+    """Return the index of the next non-whitespace character."""
+    return _WHITESPACE.match(text, index).end()  # type: ignore[union-attr]
+
+
+def _expect(text: str, index: int, char: str) -> int:
+    """Return the index after char, raising if it is not next."""
+    index = _skip_whitespace(text, index)
+    if text[index : index + 1] != char:
+        msg = f"Expected {char!r} at position {index}"
+        raise ValueError(msg)
+    return index + 1
+
+
+def _decode_last_item(text: str, index: int) -> tuple[list[Any], int]:
+    """Decode the JSON array at index, keeping only its last item."""
+    index = _skip_whitespace(text, _expect(text, index, "["))
+    items = []
+    while text[index] != "]":
+        # Each item replaces the previous one, so older items are released as
+        # soon as they have been scanned instead of accumulating in a list.
+        item, index = _DECODER.raw_decode(text, index)
+        items = [item]
+        index = _skip_whitespace(text, index)
+        if text[index] == ",":
+            index = _skip_whitespace(text, index + 1)
+    return items, index + 1
+
+
+def _decode_endpoint(text: str, index: int) -> tuple[dict[str, Any], int]:
+    """Decode the endpoint object at index, keeping only its last result."""
+    index = _expect(text, index, "{")
+    endpoint: dict[str, Any] = {}
+    index = _skip_whitespace(text, index)
+    while text[index] != "}":
+        key, index = _DECODER.raw_decode(text, index)
+        index = _skip_whitespace(text, _expect(text, index, ":"))
+        if key == RESULTS_KEY:
+            endpoint[key], index = _decode_last_item(text, index)
+        else:
+            endpoint[key], index = _DECODER.raw_decode(text, index)
+        index = _skip_whitespace(text, index)
+        if text[index] == ",":
+            index = _skip_whitespace(text, index + 1)
+    return endpoint, index + 1
+
+
+class EndpointStreamDecoder:
+    """
+    Incrementally decode a statuses payload, one endpoint at a time.
+
+    Only the endpoint currently being received is buffered, so peak memory
+    depends on the largest endpoint rather than on the whole payload.
+    """
+
+    def __init__(self, *, latest_only: bool = True) -> None:
+        """Create an Instance of EndpointStreamDecoder."""
+        self._decode = _decode_endpoint if latest_only else _DECODER.raw_decode
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._started = False
+        self._done = False
+        # Incomplete endpoints are only retried once the buffer has doubled, so
+        # endpoints spanning many chunks are scanned a bounded number of times.
+        self._retry_at = 0
+
+    def feed(self, chunk: bytes) -> list[dict[str, Any]]:
+        """Feed a chunk of the payload, returning the endpoints it completed."""
+        self._buffer += self._utf8.decode(chunk)
+        if len(self._buffer) < self._retry_at:
+            return []
+        return self._parse()
+
+    def close(self) -> list[dict[str, Any]]:
+        """Signal the end of the payload, returning any remaining endpoints."""
+        self._buffer += self._utf8.decode(b"", final=True)
+        endpoints = self._parse()
+        if not self._done or self._buffer.strip():
+            msg = "Incomplete statuses payload"
+            raise ValueError(msg)
+        return endpoints
+
+    def _parse(self) -> list[dict[str, Any]]:
+        """Decode every complete endpoint in the buffer."""
+        buffer = self._buffer
+        endpoints = []
+        index = _skip_whitespace(buffer, 0)
+        try:
+            if not self._started and index < len(buffer):
+                index = _expect(buffer, index, "[")
+                self._started = True
+            while self._started and not self._done:
+                index = _skip_whitespace(buffer, index)
+                if index == len(buffer):
+                    break
+                if buffer[index] == "]":
+                    self._done = True
+                    index += 1
+                elif buffer[index] == ",":
+                    index += 1
+                else:
+                    endpoint, index = self._decode(buffer, index)
+                    endpoints.append(endpoint)
+        except (ValueError, IndexError):
+            self._retry_at = 2 * (len(buffer) - index)
+        else:
+            self._retry_at = 0
+        self._buffer = buffer[index:]
+        return endpoints
@@ -0,0 +1,54 @@
+"""Diagnostics support for gatus."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.const import CONF_URL, CONF_WEBHOOK_ID
+
+from .api import GatusApiClientError
+from .const import CONF_INSTANCES
+
+if TYPE_CHECKING:  # pragma: no cover
+    from homeassistant.core import HomeAssistant
+
+    from .data import GatusConfigEntry
+
+# URLs can hold credentials, and identify the Gatus instances. The webhook ID
+# is all it takes to post alerts.
+TO_REDACT = {CONF_URL, CONF_INSTANCES, CONF_WEBHOOK_ID}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    entry: GatusConfigEntry,
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator = entry.runtime_data.coordinator
+    try:
+        history = await entry.runtime_data.client.async_get_history()
+    except GatusApiClientError as e:
+        groups: dict[str, Any] = {"error": str(e)}
+    else:
+        # Response times and uptimes over the results Gatus keeps, by group.
+        groups = history.by_group().as_dict()
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": async_redact_data(entry.options, TO_REDACT),
+        },
+        "coordinator": {
+            "name": coordinator.name,
+            "endpoints": len(coordinator.store),
+            "update_interval": coordinator.update_interval.total_seconds()
+            if coordinator.update_interval is not None
+            else None,
+            "last_update_success": coordinator.last_update_success,
+            "failed_instances": sorted(coordinator.failed_instances),
+            "cache_hits": coordinator.cache_hits,
+            "cache_misses": coordinator.cache_misses,
+            "refreshes": coordinator.metrics.as_dict(),
+        },
+        "groups": groups,
+    }
@@ -2,17 +2,36 @@
 
 from __future__ import annotations
 
+import asyncio
+from functools import partial
 from typing import TYPE_CHECKING
 
-from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
+from homeassistant.core import callback
+from homeassistant.helpers import entity_registry as er
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import slugify
 
+from .const import ENTITY_BATCH_SIZE
 from .coordinator import GatusDataUpdateCoordinator
+from .groups import group_context
 
 if TYPE_CHECKING:  # pragma: no cover
-    from homeassistant.helpers.entity import EntityDescription
+    from collections.abc import Callable, Hashable, Iterable
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity, EntityDescription
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
     from .api import GatusEndpointStatus
+    from .data import GatusConfigEntry
+    from .groups import GroupAggregate
+
+    type EntityFactory = Callable[
+        [GatusDataUpdateCoordinator, GatusEndpointStatus], Iterable[Entity]
+    ]
+    type GroupEntityFactory = Callable[
+        [GatusDataUpdateCoordinator, str], Iterable[Entity]
+    ]
 
 
 class GatusEntity(CoordinatorEntity[GatusDataUpdateCoordinator]):
@@ -25,29 +44,173 @@ class GatusEntity(CoordinatorEntity[GatusDataUpdateCoordinator]):
         status: GatusEndpointStatus,
     ) -> None:
         """Initialize."""
-        super().__init__(coordinator)
-        self._status = status
-        self._attr_unique_id = f"{coordinator.config_entry.entry_id}_{status.key}"
-        self._attr_device_info = DeviceInfo(
-            identifiers={
-                (
-                    coordinator.config_entry.domain,
-                    coordinator.config_entry.entry_id,
-                ),
-            },
-            manufacturer="Gatus Integration",
-            entry_type=DeviceEntryType.SERVICE,
-        )
-        self._attr_extra_state_attributes = {
-            "name": status.name,
-            "group": status.group,
-            "key": status.key,
-            "hostname": status.hostname,
-            "last_checked": status.last_checked,
-            "response_time": status.response_time,
-            "errors": status.errors,
-            "url": f"{coordinator.config_entry.data['url']}/endpoints/{status.key}",
-        }
+        super().__init__(coordinator, context=status.key)
+        entry = coordinator.config_entry
+        self._attr_unique_id = f"{entry.entry_id}_{status.key}"
+        self._attr_device_info = entry.runtime_data.device_info
+        self._update_status(status)
         self.entity_description = description
-        self._endpoint_status = status
         self._api = coordinator.client
+
+    def _update_status(self, status: GatusEndpointStatus) -> None:
+        """Update the status the entity reports."""
+        self._status = status
+        self._endpoint_status = status
+
+    @property
+    def available(self) -> bool:
+        """Return whether the endpoint is still reported by Gatus."""
+        return (
+            super().available
+            and self._status.key in self.coordinator.store
+            and self._status.instance not in self.coordinator.failed_instances
+        )
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Update the entity's status from the coordinator."""
+        if (status := self.coordinator.store.get(self._status.key)) is not None:
+            self._update_status(status)
+        super()._handle_coordinator_update()
+
+
+async def async_track_entities[K: Hashable](
+    entry: GatusConfigEntry,
+    coordinator: GatusDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    current_ids: Callable[[], Iterable[K]],
+    entity_factory: Callable[[K], Iterable[Entity]],
+) -> set[str]:
+    """
+    Add entities for the IDs current_ids returns, and keep them in sync.
+
+    Entities are added for IDs that appear, and removed along with their
+    registry entries when their ID disappears. IDs are only compared again
+    once endpoints are added or removed. At setup, entities are created in
+    batches, yielding to the event loop in between.
+    Returns the unique IDs of the entities added at setup.
+    """
+    entities: dict[K, list[Entity]] = {}
+
+    def _add(ids: Iterable[K]) -> None:
+        new_entities = []
+        for id_ in ids:
+            entities[id_] = list(entity_factory(id_))
+            new_entities.extend(entities[id_])
+        if new_entities:
+            async_add_entities(new_entities)
+
+    def _sync() -> None:
+        ids = list(current_ids())
+        _add(id_ for id_ in ids if id_ not in entities)
+        registry = er.async_get(coordinator.hass)
+        for id_ in entities.keys() - set(ids):
+            for entity in entities.pop(id_):
+                # Removing the registry entry also removes the entity itself.
+                if entity.registry_entry is not None:
+                    registry.async_remove(entity.entity_id)
+
+    @callback
+    def _async_sync() -> None:
+        delta = coordinator.delta
+        # Without a delta (after a failed refresh) the IDs are compared whole.
+        if delta is None or delta.added or delta.removed:
+            _sync()
+
+    ids = list(current_ids())
+    for start in range(0, len(ids), ENTITY_BATCH_SIZE):
+        if start:
+            await asyncio.sleep(0)
+        _add(ids[start : start + ENTITY_BATCH_SIZE])
+    # A refresh may have added or removed endpoints while setup yielded.
+    _sync()
+    entry.async_on_unload(coordinator.async_add_listener(_async_sync))
+    return {
+        entity.unique_id for id_entities in entities.values() for entity in id_entities
+    }
+
+
+async def async_track_endpoints(
+    entry: GatusConfigEntry,
+    coordinator: GatusDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: EntityFactory,
+) -> set[str]:
+    """Add entities for the coordinator's endpoints, and keep them in sync."""
+
+    def _create_entities(key: str) -> Iterable[Entity]:
+        status = coordinator.store.get(key)
+        return () if status is None else entity_factory(coordinator, status)
+
+    return await async_track_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda: [status.key for status in coordinator.store],
+        _create_entities,
+    )
+
+
+class GatusGroupEntity(CoordinatorEntity[GatusDataUpdateCoordinator]):
+    """Base class of the entities reporting an aggregate of a Gatus group."""
+
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        group: str,
+        key: str,
+    ) -> None:
+        """Initialize the entity, only updated when the group's endpoints change."""
+        super().__init__(coordinator, context=group_context(group))
+        self._group = group
+        entry = coordinator.config_entry
+        self._slug = slugify(group)
+        self._attr_unique_id = f"{entry.entry_id}_group_{self._slug}_{key}"
+        self._attr_device_info = entry.runtime_data.device_info
+
+    @property
+    def _aggregate(self) -> GroupAggregate | None:
+        """Return the aggregate of the group, if it still has endpoints."""
+        return self.coordinator.groups.get(self._group)
+
+    @property
+    def available(self) -> bool:
+        """Return whether the group still has endpoints in Gatus."""
+        return super().available and self._aggregate is not None
+
+
+async def async_track_groups(
+    entry: GatusConfigEntry,
+    coordinator: GatusDataUpdateCoordinator,
+    async_add_entities: AddEntitiesCallback,
+    entity_factory: GroupEntityFactory,
+) -> set[str]:
+    """
+    Add entities for the coordinator's groups, and keep them in sync.
+
+    Endpoints without a group have no group entities.
+    """
+    return await async_track_entities(
+        entry,
+        coordinator,
+        async_add_entities,
+        lambda: [aggregate.name for aggregate in coordinator.groups if aggregate.name],
+        partial(entity_factory, coordinator),
+    )
+
+
+@callback
+def async_remove_stale_entities(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+    domain: str,
+    unique_ids: set[str],
+) -> None:
+    """Remove the entry's registered domain entities that weren't set up again."""
+    registry = er.async_get(hass)
+    for registry_entry in er.async_entries_for_config_entry(registry, entry.entry_id):
+        if (
+            registry_entry.domain == domain
+            and registry_entry.unique_id not in unique_ids
+        ):
+            registry.async_remove(registry_entry.entity_id)
@@ -0,0 +1,75 @@
+"""Single-flight gate sharing concurrent requests to Gatus between callers."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Awaitable, Callable, Hashable
+
+
+class RequestGate:
+    """
+    RequestGate lets concurrent callers of the same request share a single one.
+
+    Callers arriving while a request is in flight await its result instead of
+    sending their own, and the result is then reused for ttl seconds, after which
+    it is dropped whether or not its key is requested again. Errors are only
+    shared with the callers already waiting.
+    """
+
+    def __init__(
+        self,
+        ttl: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """Create a gate reusing results for ttl seconds, as told by clock."""
+        self._ttl = ttl
+        self._clock = clock
+        self._in_flight: dict[Hashable, asyncio.Future[Any]] = {}
+        self._results: dict[Hashable, tuple[float, Any]] = {}
+        self._evictions: dict[Hashable, asyncio.TimerHandle] = {}
+        # Calls answered without a request of their own.
+        self.shared = 0
+
+    async def async_call[T](self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Return the result of func, shared with the other calls for key."""
+        if (cached := self._results.get(key)) is not None:
+            expires, result = cached
+            if self._clock() < expires:
+                self.shared += 1
+                return result
+            del self._results[key]
+        if (future := self._in_flight.get(key)) is not None:
+            self.shared += 1
+        else:
+            future = asyncio.ensure_future(func())
+            self._in_flight[key] = future
+            future.add_done_callback(partial(self._done, key))
+        # A caller giving up doesn't cancel the request the others wait for.
+        return await asyncio.shield(future)
+
+    def _done(self, key: Hashable, future: asyncio.Future[Any]) -> None:
+        """Forget a finished request, keeping its result for ttl seconds."""
+        del self._in_flight[key]
+        # Retrieving the exception also keeps asyncio from logging it when
+        # every caller gave up waiting.
+        if future.cancelled() or future.exception() is not None:
+            return
+        if self._ttl > 0:
+            self._results[key] = (self._clock() + self._ttl, future.result())
+            if (eviction := self._evictions.get(key)) is not None:
+                eviction.cancel()
+            # Keys that aren't requested again, like history pages, don't keep
+            # their payloads around.
+            self._evictions[key] = future.get_loop().call_later(
+                self._ttl, self._evict, key
+            )
+
+    def _evict(self, key: Hashable) -> None:
+        """Drop the result of key once its ttl is over."""
+        del self._evictions[key]
+        self._results.pop(key, None)
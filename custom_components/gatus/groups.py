@@ -0,0 +1,139 @@
+"""Aggregates of the endpoints in each Gatus group, updated incrementally."""
+
+from __future__ import annotations
+
+import heapq
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterator
+
+    from .api import GatusEndpointStatus
+    from .store import GatusStatusStore, StatusesDelta
+
+# Stale heap entries are dropped once the heap outgrows its group this much.
+HEAP_SLACK = 16
+
+
+def group_context(group: str) -> str:
+    """Return the listener context of a group's entities."""
+    # Endpoint keys never contain a colon, so contexts can't clash with them.
+    return f"group:{group}"
+
+
+def changed_group_contexts(store: GatusStatusStore, delta: StatusesDelta) -> set[str]:
+    """Return the contexts of the groups whose endpoints delta affected."""
+    contexts = set()
+    for key in delta.keys:
+        if (status := store.get(key)) is not None:
+            contexts.add(group_context(status.group))
+        if (previous := delta.previous.get(key)) is not None:
+            contexts.add(group_context(previous.group))
+    return contexts
+
+
+@dataclass(slots=True)
+class GroupAggregate:
+    """GroupAggregate counts the endpoints of a group, and which are failing."""
+
+    name: str
+    endpoints: int = 0
+    failing: int = 0
+    # Max-heap of (-response_time, key), with stale entries dropped lazily.
+    heap: list[tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def up(self) -> bool:
+        """Return whether every endpoint of the group is up."""
+        return self.failing == 0
+
+
+class GroupAggregates:
+    """
+    GroupAggregates keeps the aggregate of every group in a store.
+
+    Each update only visits the endpoints a refresh added, changed or removed.
+    Worst response times come from a heap per group: entries left behind by
+    changed endpoints are only dropped once they reach its top.
+    """
+
+    def __init__(self, store: GatusStatusStore) -> None:
+        """Create the aggregates of the groups in store, empty until updated."""
+        self._store = store
+        self._groups: dict[str, GroupAggregate] = {}
+        # The group each failing endpoint is counted in.
+        self._failing: dict[str, str] = {}
+
+    def __iter__(self) -> Iterator[GroupAggregate]:
+        """Iterate over the aggregates of the groups with endpoints."""
+        return iter(self._groups.values())
+
+    def get(self, group: str) -> GroupAggregate | None:
+        """Return the aggregate of group, if it has endpoints."""
+        return self._groups.get(group)
+
+    def update(
+        self,
+        delta: StatusesDelta,
+        is_up: Callable[[GatusEndpointStatus], bool],
+    ) -> None:
+        """Apply the endpoints a store update added, changed and removed."""
+        changed: set[str] = set()
+        for key in delta.removed:
+            group = delta.previous[key].group
+            self._groups[group].endpoints -= 1
+            self._unfail(key)
+            changed.add(group)
+        # Keys include their group, so endpoints never move between groups.
+        for key in delta.added | delta.changed:
+            if (status := self._store.get(key)) is None:
+                continue
+            aggregate = self._groups.get(status.group)
+            if aggregate is None:
+                aggregate = self._groups[status.group] = GroupAggregate(status.group)
+            if key in delta.added:
+                aggregate.endpoints += 1
+            self._unfail(key)
+            if not is_up(status):
+                aggregate.failing += 1
+                self._failing[key] = status.group
+            heapq.heappush(aggregate.heap, (-status.response_time, key))
+            changed.add(status.group)
+        for group in changed:
+            aggregate = self._groups[group]
+            if not aggregate.endpoints:
+                del self._groups[group]
+            elif len(aggregate.heap) > 2 * aggregate.endpoints + HEAP_SLACK:
+                self._compact(aggregate)
+
+    def worst_response_time(self, group: str) -> int | None:
+        """Return the slowest response time among the group's endpoints."""
+        aggregate = self._groups.get(group)
+        if aggregate is None:
+            return None
+        heap = aggregate.heap
+        while heap:
+            response_time, key = heap[0]
+            status = self._store.get(key)
+            if (
+                status is not None
+                and status.group == group
+                and status.response_time == -response_time
+            ):
+                return -response_time
+            heapq.heappop(heap)
+        return None
+
+    def _unfail(self, key: str) -> None:
+        """Stop counting key as failing, if it was."""
+        if (group := self._failing.pop(key, None)) is not None:
+            self._groups[group].failing -= 1
+
+    def _compact(self, aggregate: GroupAggregate) -> None:
+        """Rebuild the heap of a group from its endpoints' current statuses."""
+        aggregate.heap = [
+            (-status.response_time, status.key)
+            for status in self._store.group(aggregate.name)
+        ]
+        heapq.heapify(aggregate.heap)
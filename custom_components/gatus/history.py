@@ -0,0 +1,270 @@
+"""Import of the endpoints' result history into long-term statistics."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import asdict, dataclass
+from datetime import datetime, timedelta
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.components.recorder.models import (
+    StatisticData,
+    StatisticMeanType,
+    StatisticMetaData,
+)
+from homeassistant.components.recorder.statistics import (
+    async_add_external_statistics,
+)
+from homeassistant.const import PERCENTAGE, UnitOfTime
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+from homeassistant.util import slugify
+
+from .api import GatusApiClientError, GatusApiClientNotFoundError
+from .const import (
+    DOMAIN,
+    HISTORY_BATCH_SIZE,
+    HISTORY_SAVE_DELAY,
+    LOGGER,
+    NANOSECONDS_PER_MILLISECOND,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable
+
+    from homeassistant.core import HomeAssistant
+
+    from .api import GatusApiClient, GatusEndpointStatus, GatusResult
+    from .coordinator import GatusDataUpdateCoordinator
+
+HISTORY_VERSION = 1
+HOUR = timedelta(hours=1)
+
+
+@dataclass(slots=True)
+class HourlyResults:
+    """HourlyResults aggregates the results of an endpoint over an hour."""
+
+    start: datetime
+    results: int = 0
+    successes: int = 0
+    # Response times, in nanoseconds.
+    duration_sum: int = 0
+    duration_min: int = 0
+    duration_max: int = 0
+
+    def add(self, result: GatusResult) -> None:
+        """Add a result checked during the hour."""
+        if not self.results or result.duration < self.duration_min:
+            self.duration_min = result.duration
+        if not self.results or result.duration > self.duration_max:
+            self.duration_max = result.duration
+        self.results += 1
+        self.successes += result.success
+        self.duration_sum += result.duration
+
+    def response_time(self) -> StatisticData:
+        """Return the hour's statistics of the response time, in milliseconds."""
+        return StatisticData(
+            start=self.start,
+            mean=self.duration_sum / self.results / NANOSECONDS_PER_MILLISECOND,
+            min=self.duration_min / NANOSECONDS_PER_MILLISECOND,
+            max=self.duration_max / NANOSECONDS_PER_MILLISECOND,
+        )
+
+    def success_ratio(self) -> StatisticData:
+        """Return the hour's statistics of the success ratio, as a percentage."""
+        return StatisticData(
+            start=self.start,
+            mean=100 * self.successes / self.results,
+            min=100 if self.successes == self.results else 0,
+            max=100 if self.successes else 0,
+        )
+
+
+def aggregate_hourly(
+    results: Iterable[GatusResult], pending: HourlyResults | None = None
+) -> list[HourlyResults]:
+    """Aggregate results, oldest first, into hours, continuing the pending hour."""
+    hours = [pending] if pending is not None else []
+    for result in results:
+        start = dt_util.as_utc(result.timestamp).replace(
+            minute=0, second=0, microsecond=0
+        )
+        if not hours or hours[-1].start != start:
+            hours.append(HourlyResults(start=start))
+        hours[-1].add(result)
+    return hours
+
+
+@dataclass(slots=True)
+class EndpointHistory:
+    """EndpointHistory is how far the history of an endpoint was imported."""
+
+    # The time of the latest result imported.
+    watermark: datetime | None = None
+    # The current hour, imported once it is over.
+    pending: HourlyResults | None = None
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return the history in the format it is stored in."""
+        return {
+            "watermark": self.watermark.isoformat() if self.watermark else None,
+            "pending": (
+                {**asdict(self.pending), "start": self.pending.start.isoformat()}
+                if self.pending
+                else None
+            ),
+        }
+
+    @classmethod
+    def from_dict(cls: type[EndpointHistory], data: dict[str, Any]) -> EndpointHistory:
+        """Load the history from the format it is stored in."""
+        pending = data["pending"]
+        return cls(
+            watermark=(
+                datetime.fromisoformat(data["watermark"]) if data["watermark"] else None
+            ),
+            pending=(
+                HourlyResults(
+                    **{**pending, "start": datetime.fromisoformat(pending["start"])}
+                )
+                if pending
+                else None
+            ),
+        )
+
+
+def _statistic_metadata(
+    status: GatusEndpointStatus, kind: str, unit: str
+) -> StatisticMetaData:
+    """Return the metadata of one of an endpoint's statistics."""
+    return StatisticMetaData(
+        mean_type=StatisticMeanType.ARITHMETIC,
+        has_sum=False,
+        name=f"{status.name} {kind.replace('_', ' ')}",
+        source=DOMAIN,
+        statistic_id=f"{DOMAIN}:{slugify(status.key)}_{kind}",
+        unit_of_measurement=unit,
+    )
+
+
+class GatusHistoryImporter:
+    """
+    Import the results Gatus keeps for each endpoint as hourly statistics.
+
+    Each endpoint's watermark is the time of its latest imported result, so every
+    import only fetches newer results. The hour in progress is kept until it ends,
+    then added to the response time and success ratio statistics of the endpoint.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        coordinator: GatusDataUpdateCoordinator,
+    ) -> None:
+        """Create the importer of an entry's endpoints."""
+        self._hass = hass
+        self._store: Store[dict[str, dict[str, Any]]] = Store(
+            hass, HISTORY_VERSION, f"{DOMAIN}.{entry_id}.history", private=True
+        )
+        self._coordinator = coordinator
+        self._histories: dict[str, EndpointHistory] | None = None
+        self._lock = asyncio.Lock()
+
+    async def async_import(self, _now: datetime | None = None) -> None:
+        """Import the results of every endpoint since its watermark."""
+        if "recorder" not in self._hass.config.components:
+            return
+        if self._lock.locked():
+            LOGGER.debug("Skipping history import, the previous one is running")
+            return
+        async with self._lock:
+            await self._async_import()
+
+    async def _async_import(self) -> None:
+        """Import the endpoints' results, a batch of endpoints at a time."""
+        histories = self._histories
+        if histories is None:
+            stored = await self._store.async_load() or {}
+            histories = self._histories = {
+                key: EndpointHistory.from_dict(data) for key, data in stored.items()
+            }
+        statuses = list(self._coordinator.store)
+        # Forget the endpoints removed from Gatus.
+        for key in histories.keys() - {status.key for status in statuses}:
+            del histories[key]
+
+        for start in range(0, len(statuses), HISTORY_BATCH_SIZE):
+            batch = statuses[start : start + HISTORY_BATCH_SIZE]
+            try:
+                results = await asyncio.gather(
+                    *(
+                        self._async_fetch_results(
+                            *self._coordinator.endpoint_client(status),
+                            histories.get(status.key),
+                        )
+                        for status in batch
+                    )
+                )
+            except GatusApiClientError as e:
+                LOGGER.warning("Error importing history from Gatus: %s", e)
+                break
+            for status, endpoint_results in zip(batch, results, strict=True):
+                history = histories.get(status.key)
+                if endpoint_results and history is None:
+                    history = histories[status.key] = EndpointHistory()
+                # Without new results, a pending hour may still have ended.
+                if history is not None:
+                    self._import(status, history, endpoint_results)
+            # Each batch is saved, so an interrupted backfill resumes from there.
+            self._store.async_delay_save(
+                self._data_to_save, HISTORY_SAVE_DELAY.total_seconds()
+            )
+
+    async def _async_fetch_results(
+        self, client: GatusApiClient, key: str, history: EndpointHistory | None
+    ) -> list[GatusResult]:
+        """Fetch the results of an endpoint newer than its watermark."""
+        watermark = history.watermark if history is not None else None
+        try:
+            return await client.async_get_endpoint_results(key, watermark)
+        except GatusApiClientNotFoundError:
+            return []
+
+    def _import(
+        self,
+        status: GatusEndpointStatus,
+        history: EndpointHistory,
+        results: list[GatusResult],
+    ) -> None:
+        """Add the hours over by now to the statistics, keeping the current one."""
+        hours = aggregate_hourly(results, history.pending)
+        if results:
+            history.watermark = results[-1].timestamp
+        history.pending = None
+        if hours and hours[-1].start + HOUR > dt_util.utcnow():
+            history.pending = hours.pop()
+        if not hours:
+            return
+        async_add_external_statistics(
+            self._hass,
+            _statistic_metadata(status, "response_time", UnitOfTime.MILLISECONDS),
+            [hour.response_time() for hour in hours],
+        )
+        async_add_external_statistics(
+            self._hass,
+            _statistic_metadata(status, "success_ratio", PERCENTAGE),
+            [hour.success_ratio() for hour in hours],
+        )
+
+    def _data_to_save(self) -> dict[str, dict[str, Any]]:
+        """Return the histories to save."""
+        return {
+            key: history.as_dict() for key, history in (self._histories or {}).items()
+        }
+
+    async def async_remove(self) -> None:
+        """Remove the saved watermarks."""
+        await self._store.async_remove()
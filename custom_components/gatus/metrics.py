@@ -0,0 +1,89 @@
+"""Timings and payload metrics of coordinator refreshes."""
+
+from __future__ import annotations
+
+import statistics
+from collections import deque
+from dataclasses import asdict, dataclass
+from typing import Any
+
+# How many refreshes percentiles are computed over.
+METRICS_WINDOW = 100
+
+# The stages of a refresh, in the order they run.
+STAGES = ("network", "decode", "build", "store", "write", "total")
+PERCENTILES = (50, 95, 99)
+
+
+@dataclass(slots=True)
+class RefreshMetrics:
+    """RefreshMetrics describes where the time of a single refresh went."""
+
+    network: float = 0.0
+    decode: float = 0.0
+    build: float = 0.0
+    store: float = 0.0
+    # Entity writes happen after the refresh itself, so they are filled in later.
+    write: float = 0.0
+    bytes_transferred: int = 0
+    endpoints: int = 0
+    cached: bool = False
+    error: str | None = None
+
+    @property
+    def total(self) -> float:
+        """Return the duration of the whole refresh."""
+        return self.network + self.decode + self.build + self.store + self.write
+
+
+def _percentiles(values: list[float]) -> dict[str, float | None]:
+    """Return the PERCENTILES of values."""
+    if len(values) < 2:  # noqa: PLR2004
+        value = values[0] if values else None
+        return {f"p{percentile}": value for percentile in PERCENTILES}
+    cuts = statistics.quantiles(values, n=100, method="inclusive")
+    return {f"p{percentile}": cuts[percentile - 1] for percentile in PERCENTILES}
+
+
+class RefreshMetricsWindow:
+    """RefreshMetricsWindow keeps the metrics of the latest refreshes."""
+
+    def __init__(self, size: int = METRICS_WINDOW) -> None:
+        """Create an empty RefreshMetricsWindow."""
+        self._refreshes: deque[RefreshMetrics] = deque(maxlen=size)
+        self.errors = 0
+
+    def __len__(self) -> int:
+        """Return the number of refreshes in the window."""
+        return len(self._refreshes)
+
+    @property
+    def latest(self) -> RefreshMetrics | None:
+        """Return the metrics of the latest refresh."""
+        return self._refreshes[-1] if self._refreshes else None
+
+    def record(self, metrics: RefreshMetrics) -> None:
+        """Add the metrics of a refresh, dropping the oldest beyond the window."""
+        self._refreshes.append(metrics)
+        if metrics.error is not None:
+            self.errors += 1
+
+    def percentiles(self, stage: str) -> dict[str, float | None]:
+        """Return the p50, p95 and p99 durations of a stage, in seconds."""
+        successful = [m for m in self._refreshes if m.error is None]
+        return _percentiles([getattr(metrics, stage) for metrics in successful])
+
+    def as_dict(self) -> dict[str, Any]:
+        """Return a summary of the window, for diagnostics."""
+        return {
+            "refreshes": len(self._refreshes),
+            "errors": self.errors,
+            "window_errors": sum(m.error is not None for m in self._refreshes),
+            "cached": sum(m.cached for m in self._refreshes),
+            "stages": {stage: self.percentiles(stage) for stage in STAGES},
+            "latest": (
+                None
+                if self.latest is None
+                else {**asdict(self.latest), "total": self.latest.total}
+            ),
+        }
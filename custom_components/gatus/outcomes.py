@@ -0,0 +1,130 @@
+"""Rolling windows of the latest check outcomes of each endpoint."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .store import GatusStatusStore, StatusesDelta
+
+# How many of an endpoint's latest outcomes are kept.
+OUTCOME_WINDOW = 20
+# An endpoint flaps when its outcome changed this many times in the window.
+FLAPPING_TRANSITIONS = 5
+
+
+class OutcomeWindow:
+    """
+    OutcomeWindow is a ring buffer of an endpoint's latest check outcomes.
+
+    The counts over the window are kept up to date as outcomes are added, so
+    adding one takes the same time whatever the size of the window.
+    """
+
+    __slots__ = (
+        "_count",
+        "_debounce_window",
+        "_next",
+        "_outcomes",
+        "consecutive_failures",
+        "failures",
+        "transitions",
+    )
+
+    def __init__(self, debounce_window: int = 1, size: int = OUTCOME_WINDOW) -> None:
+        """Create an empty window, debouncing over the latest debounce_window."""
+        self._outcomes = bytearray(size)
+        self._debounce_window = debounce_window
+        # How many outcomes the window holds, and where the next one goes.
+        self._count = 0
+        self._next = 0
+        # Failures among the latest debounce_window outcomes.
+        self.failures = 0
+        # Changes between consecutive outcomes in the window.
+        self.transitions = 0
+        self.consecutive_failures = 0
+
+    def __len__(self) -> int:
+        """Return how many outcomes the window holds."""
+        return self._count
+
+    def add(self, success: bool) -> None:  # noqa: FBT001
+        """Add the outcome of a check, dropping the oldest one if full."""
+        outcomes = self._outcomes
+        size = len(outcomes)
+        if self._count == size:
+            # The oldest outcome leaves, along with its change to the next one.
+            oldest = self._next
+            self.transitions -= outcomes[oldest] != outcomes[(oldest + 1) % size]
+        if self._count >= self._debounce_window:
+            self.failures -= not outcomes[(self._next - self._debounce_window) % size]
+        if self._count:
+            self.transitions += outcomes[(self._next - 1) % size] != success
+        outcomes[self._next] = success
+        self._next = (self._next + 1) % size
+        self._count = min(self._count + 1, size)
+        self.failures += not success
+        self.consecutive_failures = 0 if success else self.consecutive_failures + 1
+
+    @property
+    def flapping(self) -> bool:
+        """Return whether the outcome keeps changing."""
+        return self.transitions >= FLAPPING_TRANSITIONS
+
+
+class OutcomeTracker:
+    """
+    OutcomeTracker keeps the outcome window of every endpoint in a store.
+
+    An endpoint counts as down once debounce_failures of its latest
+    debounce_window checks failed; the default of 1 of 1 follows every check.
+    A check seen first with an estimated time is counted straight away, and not
+    again once Gatus reports its actual time.
+    """
+
+    def __init__(self, debounce_failures: int = 1, debounce_window: int = 1) -> None:
+        """Create an empty tracker with the debounce policy."""
+        self.debounce_failures = debounce_failures
+        self.debounce_window = debounce_window
+        self._windows: dict[str, OutcomeWindow] = {}
+        # The outcome of each endpoint's latest check seen with an estimated time.
+        self._estimated: dict[str, bool] = {}
+
+    def __len__(self) -> int:
+        """Return the number of endpoints tracked."""
+        return len(self._windows)
+
+    def get(self, key: str) -> OutcomeWindow | None:
+        """Return the window of the endpoint key, if any check was seen."""
+        return self._windows.get(key)
+
+    def is_up(self, key: str, *, success: bool) -> bool:
+        """Return the debounced state of an endpoint whose latest check is success."""
+        window = self._windows.get(key)
+        if window is None:
+            return success
+        return window.failures < self.debounce_failures
+
+    def update(self, store: GatusStatusStore, delta: StatusesDelta) -> None:
+        """Add the checks of the endpoints a refresh added or changed."""
+        windows = self._windows
+        for key in delta.removed:
+            windows.pop(key, None)
+            self._estimated.pop(key, None)
+        for key in delta.added | delta.changed:
+            status = store.get(key)
+            if status is None:
+                continue
+            previous = delta.previous.get(key)
+            # Only a new check adds an outcome, not a new hostname or the like.
+            if previous is not None and previous.last_checked == status.last_checked:
+                continue
+            if status.estimated:
+                self._estimated[key] = status.success
+            elif self._estimated.pop(key, None) == status.success:
+                # Gatus reporting the time of the check already counted.
+                continue
+            window = windows.get(key)
+            if window is None:
+                window = windows[key] = OutcomeWindow(self.debounce_window)
+            window.add(status.success)
@@ -0,0 +1,116 @@
+"""Parser for the Prometheus metrics Gatus exposes."""
+
+from __future__ import annotations
+
+import codecs
+import re
+from dataclasses import dataclass
+
+# Only Gatus' per-endpoint series are parsed, every other line is skipped.
+METRIC_PREFIX = "gatus_results_"
+RESULTS_TOTAL = "gatus_results_total"
+DURATION_SECONDS = "gatus_results_duration_seconds"
+ENDPOINT_SUCCESS = "gatus_results_endpoint_success"
+
+_LABEL = re.compile(r'([a-zA-Z_]\w*)="((?:[^"\\]|\\.)*)"')
+_ESCAPES = {"\\\\": "\\", '\\"': '"', "\\n": "\n"}
+_ESCAPE = re.compile(r"\\[\\\"n]")
+
+
+@dataclass(slots=True)
+class EndpointMetrics:
+    """EndpointMetrics holds the series Gatus exposes for a single endpoint."""
+
+    key: str
+    name: str
+    group: str
+    successes: int = 0
+    failures: int = 0
+    # Duration of the latest check, in seconds.
+    duration: float | None = None
+    # Only exposed by recent versions of Gatus.
+    success: bool | None = None
+
+    @property
+    def results(self) -> int:
+        """Return how many times the endpoint has been checked."""
+        return self.successes + self.failures
+
+
+# The labels of a series that matter: its key, name, group and success label.
+type SeriesLabels = tuple[str, str, str, str | None]
+
+
+def _parse_labels(text: str) -> SeriesLabels:
+    """Parse the labels of a series, unescaping their values."""
+    labels = {
+        name: _ESCAPE.sub(lambda m: _ESCAPES[m.group()], value)
+        if "\\" in value
+        else value
+        for name, value in _LABEL.findall(text)
+    }
+    key = labels["key"]
+    return key, labels.get("name", key), labels.get("group", ""), labels.get("success")
+
+
+class MetricsStreamParser:
+    """
+    Incrementally parse a metrics exposition, one line at a time.
+
+    Only the incomplete line at the end of the latest chunk is buffered. Series
+    keep the same labels from one scrape to the next, so the labels parsed by the
+    previous scrape's parser can be passed in to be reused.
+    """
+
+    def __init__(self, labels: dict[str, SeriesLabels] | None = None) -> None:
+        """Create an Instance of MetricsStreamParser."""
+        self._utf8 = codecs.getincrementaldecoder("utf-8")()
+        self._buffer = ""
+        self._previous_labels = labels or {}
+        # Only the labels seen by this scrape, so removed series are dropped.
+        self.labels: dict[str, SeriesLabels] = {}
+        self.endpoints: dict[str, EndpointMetrics] = {}
+
+    def feed(self, chunk: bytes) -> None:
+        """Feed a chunk of the exposition."""
+        lines = (self._buffer + self._utf8.decode(chunk)).split("\n")
+        self._buffer = lines.pop()
+        for line in lines:
+            if line.startswith(METRIC_PREFIX):
+                self._parse_line(line)
+
+    def close(self) -> dict[str, EndpointMetrics]:
+        """Signal the end of the exposition, returning the endpoints by key."""
+        line = self._buffer + self._utf8.decode(b"", final=True)
+        self._buffer = ""
+        if line.startswith(METRIC_PREFIX):
+            self._parse_line(line)
+        return self.endpoints
+
+    def _parse_line(self, line: str) -> None:
+        """Apply a single sample to the endpoint it is about."""
+        name, _, rest = line.partition("{")
+        if name not in (RESULTS_TOTAL, DURATION_SECONDS, ENDPOINT_SUCCESS):
+            return
+        text, _, value = rest.rpartition("}")
+        labels = self._previous_labels.get(text)
+        if labels is None:
+            labels = _parse_labels(text)
+        self.labels[text] = labels
+        key, endpoint_name, group, success = labels
+        # Samples may carry a timestamp after their value.
+        sample = float(value.split()[0])
+        endpoint = self.endpoints.get(key)
+        if endpoint is None:
+            endpoint = self.endpoints[key] = EndpointMetrics(
+                key=key, name=endpoint_name, group=group
+            )
+        if name == RESULTS_TOTAL:
+            if success == "true":
+                endpoint.successes = int(sample)
+            else:
+                endpoint.failures = int(sample)
+        elif name == DURATION_SECONDS:
+            endpoint.duration = sample
+        else:
+            endpoint.success = sample == 1
@@ -0,0 +1,132 @@
+"""Adaptive polling interval for the gatus coordinator."""
+
+from __future__ import annotations
+
+import random
+from typing import TYPE_CHECKING
+
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    COORDINATOR_MAX_BACKOFF_INTERVAL,
+    COORDINATOR_MAX_UPDATE_INTERVAL,
+    COORDINATOR_MIN_UPDATE_INTERVAL,
+    COORDINATOR_UPDATE_INTERVAL,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from datetime import timedelta
+
+    from .store import GatusStatusStore, StatusesDelta
+
+# How much the interval grows after each refresh where nothing changed.
+STRETCH_FACTOR = 1.5
+# Weight given to the newest observation of the Gatus check cadence.
+CADENCE_SMOOTHING = 0.2
+# Relative jitter applied to back-off intervals.
+BACKOFF_JITTER = 0.2
+# Refreshes polled at the minimum interval once an endpoint starts failing.
+FAILURE_REFRESHES = 6
+
+
+class AdaptivePollInterval:
+    """
+    AdaptivePollInterval picks the coordinator's next polling interval.
+
+    The interval stretches while nothing changes, up to half the cadence Gatus
+    is learned to run its checks at, tightens to the minimum for a few refreshes
+    after endpoints start failing, and backs off exponentially with jitter while
+    Gatus can't be reached. A long-standing outage is polled like any endpoint.
+    """
+
+    def __init__(
+        self,
+        default: timedelta = COORDINATOR_UPDATE_INTERVAL,
+        minimum: timedelta = COORDINATOR_MIN_UPDATE_INTERVAL,
+        maximum: timedelta = COORDINATOR_MAX_UPDATE_INTERVAL,
+        backoff_maximum: timedelta = COORDINATOR_MAX_BACKOFF_INTERVAL,
+    ) -> None:
+        """Create an Instance of AdaptivePollInterval."""
+        self._default = default
+        self._minimum = minimum
+        self._maximum = maximum
+        self._backoff_maximum = backoff_maximum
+        self._interval = default
+        self._failures = 0
+        self._refreshes = 0
+        # The refresh each failing endpoint started failing at.
+        self._failing: dict[str, int] = {}
+        self.cadence: timedelta | None = None
+
+    @property
+    def interval(self) -> timedelta:
+        """Return the current polling interval."""
+        return self._interval
+
+    def on_success(self, store: GatusStatusStore, delta: StatusesDelta) -> timedelta:
+        """Return the next interval after a successful refresh."""
+        self._failures = 0
+        self._refreshes += 1
+        for key in delta.removed:
+            self._failing.pop(key, None)
+        for key in delta.added | delta.changed:
+            status = store.get(key)
+            if status is not None and not status.success:
+                self._failing.setdefault(key, self._refreshes)
+            else:
+                self._failing.pop(key, None)
+        self._observe_cadence(store, delta)
+
+        if self._new_failures:
+            self._interval = self._minimum
+        elif delta.keys or self._interval < self._default:
+            self._interval = self._default
+        else:
+            self._interval = min(self._interval * STRETCH_FACTOR, self._idle_maximum)
+        return self._interval
+
+    def on_failure(self) -> timedelta:
+        """Return the next interval after a failed refresh."""
+        self._failures += 1
+        backoff = min(
+            self._default * 2**self._failures,
+            self._backoff_maximum,
+        )
+        jitter = random.uniform(1 - BACKOFF_JITTER, 1 + BACKOFF_JITTER)  # noqa: S311
+        self._interval = max(backoff * jitter, self._minimum)
+        return self._interval
+
+    @property
+    def _new_failures(self) -> bool:
+        """Return whether an endpoint started failing in the last few refreshes."""
+        return any(
+            self._refreshes - started < FAILURE_REFRESHES
+            for started in self._failing.values()
+        )
+
+    @property
+    def _idle_maximum(self) -> timedelta:
+        """Return the longest interval to poll at while nothing changes."""
+        if self.cadence is None:
+            return self._default
+        return max(min(self.cadence / 2, self._maximum), self._default)
+
+    def _observe_cadence(self, store: GatusStatusStore, delta: StatusesDelta) -> None:
+        """Learn how often Gatus checks endpoints from their last_checked times."""
+        gaps = []
+        for key in delta.changed:
+            status = store.get(key)
+            previous = delta.previous[key]
+            if status is None or status.last_checked == previous.last_checked:
+                continue
+            current = dt_util.parse_datetime(status.last_checked)
+            before = dt_util.parse_datetime(previous.last_checked)
+            if current is not None and before is not None and current > before:
+                gaps.append(current - before)
+        if not gaps:
+            return
+        observed = min(gaps)
+        if self.cadence is None:
+            self.cadence = observed
+        else:
+            self.cadence += (observed - self.cadence) * CADENCE_SMOOTHING
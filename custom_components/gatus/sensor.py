@@ -0,0 +1,350 @@
+"""Sensor platform for gatus."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from homeassistant.components.sensor import (
+    SensorDeviceClass,
+    SensorEntity,
+    SensorEntityDescription,
+    SensorStateClass,
+)
+from homeassistant.const import (
+    MAX_LENGTH_STATE_STATE,
+    PERCENTAGE,
+    EntityCategory,
+    Platform,
+    UnitOfInformation,
+    UnitOfTime,
+)
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
+from homeassistant.util import dt as dt_util
+
+from .const import (
+    MILLISECONDS_PER_SECOND,
+    NANOSECONDS_PER_MILLISECOND,
+    UPTIME_DURATIONS,
+)
+from .coordinator import GatusAggregateCoordinator, GatusDataUpdateCoordinator
+from .entity import (
+    GatusEntity,
+    GatusGroupEntity,
+    async_remove_stale_entities,
+    async_track_endpoints,
+    async_track_groups,
+)
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable
+    from datetime import datetime
+
+    from homeassistant.core import HomeAssistant
+    from homeassistant.helpers.entity import Entity
+    from homeassistant.helpers.entity_platform import AddEntitiesCallback
+    from homeassistant.helpers.typing import StateType
+
+    from .api import GatusEndpointStatus
+    from .data import GatusConfigEntry
+    from .groups import GroupAggregates
+    from .metrics import RefreshMetricsWindow
+
+
+@dataclass(frozen=True, kw_only=True)
+class GatusSensorEntityDescription(SensorEntityDescription):
+    """Describes a Gatus sensor reporting a value of an endpoint's status."""
+
+    value_fn: Callable[[GatusEndpointStatus], StateType | datetime]
+
+
+ENDPOINT_SENSORS = (
+    GatusSensorEntityDescription(
+        key="response_time",
+        name="Response Time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=lambda status: status.response_time / NANOSECONDS_PER_MILLISECOND,
+    ),
+    # The volatile status values, kept out of the binary sensors' attributes.
+    GatusSensorEntityDescription(
+        key="last_checked",
+        name="Last Checked",
+        device_class=SensorDeviceClass.TIMESTAMP,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        # Changes on every check, so it is only recorded if enabled.
+        entity_registry_enabled_default=False,
+        value_fn=lambda status: dt_util.parse_datetime(status.last_checked),
+    ),
+    GatusSensorEntityDescription(
+        key="errors",
+        name="Errors",
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda status: "; ".join(status.errors)[:MAX_LENGTH_STATE_STATE],
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GatusGroupSensorEntityDescription(SensorEntityDescription):
+    """Describes a Gatus sensor reporting an aggregate of a group's endpoints."""
+
+    value_fn: Callable[[GroupAggregates, str], StateType]
+
+
+def _worst_response_time(groups: GroupAggregates, group: str) -> float | None:
+    """Return the slowest response time of the group's endpoints, in milliseconds."""
+    if (response_time := groups.worst_response_time(group)) is None:
+        return None
+    return response_time / NANOSECONDS_PER_MILLISECOND
+
+
+GROUP_SENSORS = (
+    GatusGroupSensorEntityDescription(
+        key="failing",
+        name="Failing",
+        state_class=SensorStateClass.MEASUREMENT,
+        value_fn=lambda groups, group: (
+            None if (aggregate := groups.get(group)) is None else aggregate.failing
+        ),
+    ),
+    GatusGroupSensorEntityDescription(
+        key="worst_response_time",
+        name="Worst Response Time",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        value_fn=_worst_response_time,
+    ),
+)
+
+
+@dataclass(frozen=True, kw_only=True)
+class GatusRefreshSensorEntityDescription(SensorEntityDescription):
+    """Describes a Gatus sensor reporting metrics of a coordinator's refreshes."""
+
+    value_fn: Callable[[RefreshMetricsWindow], StateType]
+
+
+def _p95_milliseconds(metrics: RefreshMetricsWindow) -> float | None:
+    """Return the p95 duration of the refreshes in the window, in milliseconds."""
+    if (p95 := metrics.percentiles("total")["p95"]) is None:
+        return None
+    return p95 * MILLISECONDS_PER_SECOND
+
+
+# Refresh durations and payload sizes change on every refresh, so they are only
+# recorded if enabled.
+REFRESH_SENSORS = (
+    GatusRefreshSensorEntityDescription(
+        key="refresh_duration",
+        name="Refresh Duration p95",
+        device_class=SensorDeviceClass.DURATION,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfTime.MILLISECONDS,
+        suggested_display_precision=0,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=_p95_milliseconds,
+    ),
+    GatusRefreshSensorEntityDescription(
+        key="payload_size",
+        name="Payload Size",
+        device_class=SensorDeviceClass.DATA_SIZE,
+        state_class=SensorStateClass.MEASUREMENT,
+        native_unit_of_measurement=UnitOfInformation.BYTES,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        entity_registry_enabled_default=False,
+        value_fn=lambda metrics: (
+            None if metrics.latest is None else metrics.latest.bytes_transferred
+        ),
+    ),
+    GatusRefreshSensorEntityDescription(
+        key="endpoints",
+        name="Endpoints",
+        state_class=SensorStateClass.MEASUREMENT,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda metrics: (
+            None if metrics.latest is None else metrics.latest.endpoints
+        ),
+    ),
+    GatusRefreshSensorEntityDescription(
+        key="refresh_errors",
+        name="Refresh Errors",
+        state_class=SensorStateClass.TOTAL_INCREASING,
+        entity_category=EntityCategory.DIAGNOSTIC,
+        value_fn=lambda metrics: metrics.errors,
+    ),
+)
+
+
+async def async_setup_entry(
+    hass: HomeAssistant,
+    entry: GatusConfigEntry,
+    async_add_entities: AddEntitiesCallback,
+) -> None:
+    """Set up the sensor platform."""
+    coordinator = entry.runtime_data.coordinator
+    aggregates = entry.runtime_data.aggregates
+
+    def _create_entities(
+        coordinator: GatusDataUpdateCoordinator,
+        endpoint: GatusEndpointStatus,
+    ) -> list[Entity]:
+        """Create the sensors of an endpoint."""
+        return [
+            *(
+                GatusEndpointSensor(coordinator, description, endpoint)
+                for description in ENDPOINT_SENSORS
+            ),
+            *(
+                GatusUptimeSensor(aggregates, endpoint, duration)  # type: ignore[arg-type]
+                for duration in UPTIME_DURATIONS
+            ),
+        ]
+
+    unique_ids = await async_track_endpoints(
+        entry, coordinator, async_add_entities, _create_entities
+    )
+    unique_ids |= await async_track_groups(
+        entry, coordinator, async_add_entities, _create_group_entities
+    )
+    refresh_sensors = [
+        GatusRefreshSensor(coordinator, description) for description in REFRESH_SENSORS
+    ]
+    async_add_entities(refresh_sensors)
+    unique_ids.update(sensor.unique_id for sensor in refresh_sensors)  # type: ignore[misc]
+    async_remove_stale_entities(hass, entry, Platform.SENSOR, unique_ids)
+
+
+def _create_group_entities(
+    coordinator: GatusDataUpdateCoordinator,
+    group: str,
+) -> list[GatusGroupSensor]:
+    """Create the sensors of a group."""
+    return [
+        GatusGroupSensor(coordinator, description, group)
+        for description in GROUP_SENSORS
+    ]
+
+
+class GatusEndpointSensor(GatusEntity, SensorEntity):
+    """Gatus sensor class, reporting a value of an endpoint's status."""
+
+    entity_description: GatusSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        entity_description: GatusSensorEntityDescription,
+        status: GatusEndpointStatus,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, entity_description, status)
+        self._attr_unique_id = f"{self._attr_unique_id}_{entity_description.key}"
+        self._attr_name = f"{status.name} {entity_description.name}"
+        self.entity_id = f"sensor.gatus_{status.key}_{entity_description.key}"
+
+    @property
+    def native_value(self) -> StateType | datetime:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self._status)
+
+
+class GatusGroupSensor(GatusGroupEntity, SensorEntity):
+    """Gatus sensor class, reporting an aggregate of a group's endpoints."""
+
+    entity_description: GatusGroupSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        entity_description: GatusGroupSensorEntityDescription,
+        group: str,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator, group, entity_description.key)
+        self.entity_description = entity_description
+        self._attr_name = f"{group} {entity_description.name}"
+        self.entity_id = f"sensor.gatus_group_{self._slug}_{entity_description.key}"
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.groups, self._group)
+
+
+class GatusUptimeSensor(CoordinatorEntity[GatusAggregateCoordinator], SensorEntity):
+    """Uptime of a Gatus endpoint over a duration."""
+
+    def __init__(
+        self,
+        coordinator: GatusAggregateCoordinator,
+        status: GatusEndpointStatus,
+        duration: str,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        entry_id = coordinator.config_entry.entry_id
+        self._key = status.key
+        self._duration = duration
+        self.entity_description = SensorEntityDescription(
+            key=f"{status.key}_uptime_{duration}",
+            name=f"{status.name} Uptime {duration}",
+            state_class=SensorStateClass.MEASUREMENT,
+            native_unit_of_measurement=PERCENTAGE,
+            suggested_display_precision=2,
+        )
+        self._attr_unique_id = f"{entry_id}_{status.key}_uptime_{duration}"
+        self._attr_device_info = coordinator.config_entry.runtime_data.device_info
+        self.entity_id = f"sensor.gatus_{status.key}_uptime_{duration}"
+
+    @property
+    def available(self) -> bool:
+        """Return whether the endpoint's uptime has been fetched."""
+        return (
+            super().available
+            and self.coordinator.data is not None
+            and self._key in self.coordinator.data
+        )
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the uptime, in percent."""
+        if not self.available:
+            return None
+        return self.coordinator.data[self._key][self._duration] * 100
+
+
+class GatusRefreshSensor(CoordinatorEntity[GatusDataUpdateCoordinator], SensorEntity):
+    """Metrics of a coordinator's refreshes."""
+
+    entity_description: GatusRefreshSensorEntityDescription
+
+    def __init__(
+        self,
+        coordinator: GatusDataUpdateCoordinator,
+        entity_description: GatusRefreshSensorEntityDescription,
+    ) -> None:
+        """Initialize the sensor class."""
+        super().__init__(coordinator)
+        entry = coordinator.config_entry
+        self.entity_description = entity_description
+        self._attr_name = f"{entry.title} {entity_description.name}"
+        self._attr_unique_id = (
+            f"{entry.entry_id}_{coordinator.name}_{entity_description.key}"
+        )
+        self._attr_device_info = entry.runtime_data.device_info
+
+    @property
+    def available(self) -> bool:
+        """Return whether the coordinator has refreshed at least once."""
+        return len(self.coordinator.metrics) > 0
+
+    @property
+    def native_value(self) -> StateType:
+        """Return the value of the sensor."""
+        return self.entity_description.value_fn(self.coordinator.metrics)
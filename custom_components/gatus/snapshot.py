@@ -0,0 +1,80 @@
+"""Snapshots of the latest statuses, restored when Home Assistant starts."""
+
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import TYPE_CHECKING, Any
+
+from homeassistant.core import callback
+from homeassistant.helpers.storage import Store
+
+from .api import GatusEndpointStatus
+from .const import DOMAIN, LOGGER, SNAPSHOT_SAVE_DELAY
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Callable, Iterable
+
+    from homeassistant.core import HomeAssistant
+
+SNAPSHOT_VERSION = 1
+# Statuses are stored as rows of their fields, in this order, rather than as
+# objects repeating every field's name.
+SNAPSHOT_FIELDS = [field.name for field in fields(GatusEndpointStatus)]
+
+
+def encode_snapshot(statuses: Iterable[GatusEndpointStatus]) -> dict[str, Any]:
+    """Encode statuses in the snapshot's compact format."""
+    return {
+        "fields": SNAPSHOT_FIELDS,
+        "statuses": [
+            [getattr(status, name) for name in SNAPSHOT_FIELDS] for status in statuses
+        ],
+    }
+
+
+def decode_snapshot(data: dict[str, Any]) -> list[GatusEndpointStatus] | None:
+    """Decode a snapshot, or return None if it was saved with other fields."""
+    if data.get("fields") != SNAPSHOT_FIELDS:
+        return None
+    return [
+        GatusEndpointStatus(**dict(zip(SNAPSHOT_FIELDS, row, strict=True)))
+        for row in data["statuses"]
+    ]
+
+
+class GatusSnapshot:
+    """GatusSnapshot saves the statuses of a config entry between restarts."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        statuses: Callable[[], Iterable[GatusEndpointStatus]],
+    ) -> None:
+        """Create the snapshot of an entry, saving what statuses returns."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_VERSION, f"{DOMAIN}.{entry_id}", private=True
+        )
+        self._statuses = statuses
+
+    async def async_load(self) -> list[GatusEndpointStatus] | None:
+        """Load the statuses saved by the previous run, if any."""
+        if (data := await self._store.async_load()) is None:
+            return None
+        try:
+            return decode_snapshot(data)
+        except (KeyError, TypeError, ValueError) as e:
+            LOGGER.warning("Ignoring invalid snapshot: %s", e)
+            return None
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Save the statuses after a delay, batching changes made in between."""
+        self._store.async_delay_save(
+            lambda: encode_snapshot(self._statuses()),
+            SNAPSHOT_SAVE_DELAY.total_seconds(),
+        )
+
+    async def async_remove(self) -> None:
+        """Remove the saved statuses."""
+        await self._store.async_remove()
@@ -0,0 +1,117 @@
+"""Indexed store of Gatus endpoint statuses."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from collections.abc import Iterable, Iterator
+
+    from .api import GatusEndpointStatus
+
+
+@dataclass
+class StatusesDelta:
+    """StatusesDelta is the set of endpoint keys changed by a refresh."""
+
+    added: set[str] = field(default_factory=set)
+    removed: set[str] = field(default_factory=set)
+    changed: set[str] = field(default_factory=set)
+    # The statuses that changed and removed endpoints had before the refresh.
+    previous: dict[str, GatusEndpointStatus] = field(default_factory=dict)
+
+    @property
+    def keys(self) -> set[str]:
+        """Every endpoint key affected by the refresh."""
+        return self.added | self.removed | self.changed
+
+
+def _status_changed(old: GatusEndpointStatus, new: GatusEndpointStatus) -> bool:
+    """Return whether an endpoint's status changed in a way entities expose."""
+    return (
+        old.success != new.success
+        or old.errors != new.errors
+        or old.hostname != new.hostname
+        or old.response_time != new.response_time
+        or old.last_checked != new.last_checked
+    )
+
+
+class GatusStatusStore:
+    """GatusStatusStore indexes endpoint statuses by key and by group."""
+
+    def __init__(self) -> None:
+        """Create an empty GatusStatusStore."""
+        self._by_key: dict[str, GatusEndpointStatus] = {}
+        self._by_group: dict[str, set[str]] = {}
+
+    def __contains__(self, key: object) -> bool:
+        """Return whether the store holds the endpoint key."""
+        return key in self._by_key
+
+    def __iter__(self) -> Iterator[GatusEndpointStatus]:
+        """Iterate over the statuses in the store."""
+        return iter(self._by_key.values())
+
+    def __len__(self) -> int:
+        """Return the number of endpoints in the store."""
+        return len(self._by_key)
+
+    def get(self, key: str) -> GatusEndpointStatus | None:
+        """Return the status of the endpoint key, if known."""
+        return self._by_key.get(key)
+
+    def group(self, group: str) -> list[GatusEndpointStatus]:
+        """Return the statuses of the endpoints in group."""
+        return [self._by_key[key] for key in self._by_group.get(group, ())]
+
+    @property
+    def groups(self) -> list[str]:
+        """Return the groups with at least one endpoint."""
+        return list(self._by_group)
+
+    def update(self, statuses: Iterable[GatusEndpointStatus]) -> StatusesDelta:
+        """
+        Apply a full snapshot of statuses, returning what changed.
+
+        Only added, removed and changed endpoints touch the indexes.
+        """
+        delta = StatusesDelta()
+        seen = set()
+        for status in statuses:
+            seen.add(status.key)
+            self._apply(status, delta)
+
+        delta.removed = self._by_key.keys() - seen
+        for key in delta.removed:
+            delta.previous[key] = self._by_key.pop(key)
+            self._unindex(delta.previous[key])
+        return delta
+
+    def update_one(self, status: GatusEndpointStatus) -> StatusesDelta:
+        """Apply the status of a single endpoint, leaving the others as they are."""
+        delta = StatusesDelta()
+        self._apply(status, delta)
+        return delta
+
+    def _apply(self, status: GatusEndpointStatus, delta: StatusesDelta) -> None:
+        """Store status if it is new or changed, recording it in delta."""
+        old = self._by_key.get(status.key)
+        if old is None:
+            delta.added.add(status.key)
+        elif _status_changed(old, status):
+            delta.changed.add(status.key)
+            delta.previous[status.key] = old
+            self._unindex(old)
+        else:
+            return
+        self._by_key[status.key] = status
+        self._by_group.setdefault(status.group, set()).add(status.key)
+
+    def _unindex(self, status: GatusEndpointStatus) -> None:
+        """Remove status from the group index."""
+        keys = self._by_group[status.group]
+        keys.discard(status.key)
+        if not keys:
+            del self._by_group[status.group]
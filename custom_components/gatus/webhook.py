@@ -0,0 +1,90 @@
+"""Webhook receiving alerts pushed by Gatus' custom alerting provider."""
+
+from __future__ import annotations
+
+from dataclasses import replace
+from functools import partial
+from http import HTTPStatus
+from typing import TYPE_CHECKING
+
+import voluptuous as vol
+from aiohttp import hdrs, web
+from homeassistant.components import webhook
+from homeassistant.const import CONF_WEBHOOK_ID
+from homeassistant.core import callback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, LOGGER
+
+if TYPE_CHECKING:  # pragma: no cover
+    from homeassistant.core import HomeAssistant
+
+    from .data import GatusConfigEntry
+
+# Values of Gatus' [ALERT_TRIGGERED_OR_RESOLVED] placeholder.
+ALERT_TRIGGERED = "triggered"
+ALERT_RESOLVED = "resolved"
+
+ALERT_SCHEMA = vol.Schema(
+    {
+        vol.Required("name"): str,
+        vol.Optional("group", default=""): str,
+        vol.Required("status"): vol.All(
+            str, vol.Lower, vol.In([ALERT_TRIGGERED, ALERT_RESOLVED])
+        ),
+        vol.Optional("errors", default=""): str,
+        # The name of the federated instance sending the alert, if any.
+        vol.Optional("instance", default=""): str,
+    },
+    extra=vol.ALLOW_EXTRA,
+)
+
+
+@callback
+def async_register_webhook(hass: HomeAssistant, entry: GatusConfigEntry) -> None:
+    """Register the entry's webhook, until the entry unloads."""
+    webhook_id = entry.options[CONF_WEBHOOK_ID]
+    webhook.async_register(
+        hass,
+        DOMAIN,
+        entry.title,
+        webhook_id,
+        partial(_async_handle_alert, entry),
+        allowed_methods=[hdrs.METH_POST],
+    )
+    entry.async_on_unload(partial(webhook.async_unregister, hass, webhook_id))
+
+
+async def _async_handle_alert(
+    entry: GatusConfigEntry,
+    hass: HomeAssistant,  # noqa: ARG001 Unused function argument: `hass`
+    webhook_id: str,  # noqa: ARG001 Unused function argument: `webhook_id`
+    request: web.Request,
+) -> web.Response:
+    """Apply an alert to the endpoint it is about, straight away."""
+    try:
+        alert = ALERT_SCHEMA(await request.json())
+    except (ValueError, vol.Invalid) as e:
+        LOGGER.warning("Invalid alert received from Gatus: %s", e)
+        return web.Response(status=HTTPStatus.BAD_REQUEST)
+
+    coordinator = entry.runtime_data.coordinator
+    for status in coordinator.store.group(alert["group"]):
+        if status.name != alert["name"] or status.instance != alert["instance"]:
+            continue
+        triggered = alert["status"] == ALERT_TRIGGERED
+        coordinator.async_push_status(
+            replace(
+                status,
+                success=not triggered,
+                errors=[alert["errors"]] if triggered and alert["errors"] else [],
+                last_checked=dt_util.utcnow().isoformat(),
+                estimated=True,
+            )
+        )
+        return web.Response(status=HTTPStatus.OK)
+
+    LOGGER.debug("Alert received for unknown endpoint %s", alert["name"])
+    # An endpoint added to Gatus since the last poll: a refresh picks it up.
+    await coordinator.async_request_refresh()
+    return web.Response(status=HTTPStatus.ACCEPTED)
@@ -0,0 +1,145 @@
+"""Fixtures for benchmarking."""
+
+from __future__ import annotations
+
+import asyncio
+import itertools
+import json
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from functools import partial
+from typing import TYPE_CHECKING, Any
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from .payloads import make_metrics_exposition
+
+if TYPE_CHECKING:  # pragma: no cover
+    from pytest_benchmark.fixture import BenchmarkFixture
+
+STATUSES_PATH = "/api/v1/endpoints/statuses"
+UPTIME_PATH = "/api/v1/endpoints/{key}/uptimes/{duration}"
+METRICS_PATH = "/metrics"
+GATUS_DEFAULT_PAGE_SIZE = 20
+
+type AsyncBenchmark = Callable[..., Awaitable[Any]]
+type StubServerFactory = Callable[..., Awaitable[str]]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    """Add the options of the benchmark suite."""
+    parser.addoption(
+        "--history",
+        default="1,20",
+        help="Comma-separated result history depths of the synthetic payloads.",
+    )
+
+
+def pytest_generate_tests(metafunc: pytest.Metafunc) -> None:
+    """Parametrize benchmarks taking a history fixture with the --history depths."""
+    if "history" in metafunc.fixturenames:
+        depths = metafunc.config.getoption("history").split(",")
+        metafunc.parametrize("history", [int(depth) for depth in depths])
+
+
+def _page(results: list[dict], page: int, page_size: int) -> list[dict]:
+    """Return a page of results, newest page first, like Gatus does."""
+    end = max(len(results) - (page - 1) * page_size, 0)
+    return results[max(end - page_size, 0) : end]
+
+
+@pytest.fixture
+def aio_benchmark(benchmark: BenchmarkFixture) -> AsyncBenchmark:
+    """
+    Benchmark a coroutine function against the running event loop.
+
+    pytest-benchmark is synchronous, so the timer runs in an executor thread
+    and each round is scheduled back onto the test's event loop.
+    """
+
+    async def _run(
+        func: Callable[[], Awaitable[Any]],
+        rounds: int = 5,
+        before: Callable[[], Awaitable[Any]] | None = None,
+    ) -> Any:
+        """Benchmark func, awaiting before, if given, untimed ahead of each round."""
+        loop = asyncio.get_running_loop()
+
+        def _round() -> Any:
+            return asyncio.run_coroutine_threadsafe(func(), loop).result()
+
+        def _before() -> None:
+            if before is not None:
+                asyncio.run_coroutine_threadsafe(before(), loop).result()
+
+        return await loop.run_in_executor(
+            None,
+            partial(
+                benchmark.pedantic,
+                _round,
+                setup=_before,
+                rounds=rounds,
+                warmup_rounds=1,
+            ),
+        )
+
+    return _run
+
+
+@pytest.fixture
+async def stub_server() -> AsyncGenerator[StubServerFactory, Any]:
+    """
+    Start local stub Gatus servers serving the given statuses payloads.
+
+    When several payloads are given, each request is answered with the next one,
+    so every poll sees every endpoint change. Their metrics are served too, the
+    results counters of each payload telling them apart.
+    """
+    servers: list[TestServer] = []
+
+    async def _start(*payloads: list[dict]) -> str:
+        bodies: dict[tuple[int, int, int], bytes] = {}
+        cycle = itertools.cycle(range(len(payloads)))
+
+        async def _statuses(request: web.Request) -> web.Response:
+            page = int(request.query.get("page", 1))
+            page_size = int(request.query.get("pageSize", GATUS_DEFAULT_PAGE_SIZE))
+            body_key = (next(cycle), page, page_size)
+            if body_key not in bodies:
+                bodies[body_key] = json.dumps(
+                    [
+                        {
+                            **endpoint,
+                            "results": _page(endpoint["results"], page, page_size),
+                        }
+                        for endpoint in payloads[body_key[0]]
+                    ]
+                ).encode()
+            return web.Response(body=bodies[body_key], content_type="application/json")
+
+        async def _uptime(_: web.Request) -> web.Response:
+            return web.Response(text="1")
+
+        metrics_cycle = itertools.cycle(range(len(payloads)))
+        expositions: dict[int, bytes] = {}
+
+        async def _metrics(_: web.Request) -> web.Response:
+            index = next(metrics_cycle)
+            if index not in expositions:
+                expositions[index] = make_metrics_exposition(payloads[index], index)
+            return web.Response(body=expositions[index], content_type="text/plain")
+
+        app = web.Application()
+        app.router.add_get(STATUSES_PATH, _statuses)
+        app.router.add_get(UPTIME_PATH, _uptime)
+        app.router.add_get(METRICS_PATH, _metrics)
+        server = TestServer(app, host="127.0.0.1")
+        await server.start_server()
+        servers.append(server)
+        return str(server.make_url("/"))
+
+    yield _start
+
+    for server in servers:
+        await server.close()
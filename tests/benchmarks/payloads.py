@@ -0,0 +1,78 @@
+"""Synthetic Gatus payloads for benchmarking."""
+
+from __future__ import annotations
+
+from typing import Any
+
+# Endpoint counts benchmarks sweep, from a small homelab to a very large instance.
+ENDPOINT_COUNTS = [10, 100, 1_000, 10_000]
+
+
+def make_result(index: int, offset: int, *, healthy: bool = False) -> dict[str, Any]:
+    """Build a single Gatus result for the endpoint at index."""
+    success = healthy or index % 10 != 0
+    result: dict[str, Any] = {
+        "status": 200 if success else 503,
+        "hostname": f"endpoint-{index}.example.com",
+        "duration": 40_000_000 + index * 1_000 + offset,
+        "conditionResults": [
+            {"condition": "[STATUS] == 200", "success": success},
+        ],
+        "success": success,
+        "timestamp": f"2025-02-04T04:{offset // 60 % 60:02d}:{offset % 60:02d}Z",
+    }
+    if not success:
+        result["errors"] = [f"Get endpoint-{index}: connection refused"]
+    return result
+
+
+def make_endpoint(
+    index: int, history: int = 1, checks: int = 0, *, healthy: bool = False
+) -> dict[str, Any]:
+    """Build a single Gatus endpoint status with history results, after checks."""
+    group = f"group-{index % 20}"
+    name = f"endpoint-{index}"
+    return {
+        "name": name,
+        "group": group,
+        "key": f"{group}_{name}",
+        "results": [
+            make_result(index, offset, healthy=healthy)
+            for offset in range(checks, checks + history)
+        ],
+    }
+
+
+def make_statuses_payload(
+    count: int, history: int = 1, checks: int = 0, *, healthy: bool = False
+) -> list[dict[str, Any]]:
+    """
+    Build a Gatus statuses payload with count endpoints.
+
+    Payloads built with different checks differ in every endpoint's latest result.
+    Every tenth endpoint is failing, unless healthy is True.
+    """
+    return [
+        make_endpoint(index, history, checks, healthy=healthy) for index in range(count)
+    ]
+
+
+def make_metrics_exposition(payload: list[dict[str, Any]], checks: int = 0) -> bytes:
+    """Build the Prometheus metrics Gatus exposes for a statuses payload."""
+    lines = []
+    for endpoint in payload:
+        result = endpoint["results"][-1]
+        labels = (
+            f'group="{endpoint["group"]}",key="{endpoint["key"]}",'
+            f'name="{endpoint["name"]}",type="HTTP"'
+        )
+        failures = checks // 10 if result["success"] else checks // 10 + 1
+        lines += [
+            f'gatus_results_total{{{labels},success="true"}} {checks + 1 - failures}',
+            f'gatus_results_total{{{labels},success="false"}} {failures}',
+            f'gatus_results_code_total{{code="{result["status"]}",{labels}}} {checks}',
+            f"gatus_results_connected_total{{{labels}}} {checks + 1}",
+            f"gatus_results_duration_seconds{{{labels}}} {result['duration'] / 1e9}",
+            f"gatus_results_endpoint_success{{{labels}}} {int(result['success'])}",
+        ]
+    return "\n".join(lines).encode() + b"\n"
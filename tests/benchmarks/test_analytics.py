@@ -0,0 +1,87 @@
+"""Benchmarks for statistics over the result histories of every endpoint."""
+
+import statistics
+from collections import defaultdict
+from typing import Any
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.gatus.analytics import PERCENTILES, ResultColumns
+
+from .payloads import make_statuses_payload
+
+ENDPOINTS = 1_000
+# Gatus keeps 100 results per endpoint by default.
+HISTORY = 100
+
+
+def _python_statistics(results: list[dict]) -> dict[str, Any]:
+    """Compute the statistics of results one by one, as a baseline."""
+    durations = [result["duration"] for result in results]
+    cuts = statistics.quantiles(durations, n=100, method="inclusive")
+    return {
+        "results": len(results),
+        "uptime": sum(result["success"] for result in results) / len(results),
+        "error_rate": sum(bool(result.get("errors")) for result in results)
+        / len(results),
+        **{f"p{percentile}": cuts[percentile - 1] for percentile in PERCENTILES},
+    }
+
+
+def _python_by_endpoint(payload: list[dict]) -> dict[str, dict[str, Any]]:
+    return {
+        endpoint["key"]: _python_statistics(endpoint["results"]) for endpoint in payload
+    }
+
+
+def _python_by_group(payload: list[dict]) -> dict[str, dict[str, Any]]:
+    groups: defaultdict[str, list[dict]] = defaultdict(list)
+    for endpoint in payload:
+        groups[endpoint["group"]].extend(endpoint["results"])
+    return {group: _python_statistics(results) for group, results in groups.items()}
+
+
+@pytest.fixture(scope="module")
+def payload() -> list[dict]:
+    return make_statuses_payload(ENDPOINTS, history=HISTORY)
+
+
+@pytest.fixture(scope="module")
+def columns(payload: list[dict]) -> ResultColumns:
+    return ResultColumns.from_payload(payload)
+
+
+def test_python_by_endpoint(benchmark: BenchmarkFixture, payload: list[dict]) -> None:
+    assert len(benchmark(_python_by_endpoint, payload)) == ENDPOINTS
+
+
+def test_columns_by_endpoint(
+    benchmark: BenchmarkFixture, payload: list[dict], columns: ResultColumns
+) -> None:
+    result = benchmark(lambda: columns.by_endpoint().as_dict())
+
+    expected = _python_by_endpoint(payload)
+    assert result.keys() == expected.keys()
+    for key, row in expected.items():
+        assert result[key] == pytest.approx(row)
+
+
+def test_python_by_group(benchmark: BenchmarkFixture, payload: list[dict]) -> None:
+    assert benchmark(_python_by_group, payload)
+
+
+def test_columns_by_group(
+    benchmark: BenchmarkFixture, payload: list[dict], columns: ResultColumns
+) -> None:
+    result = benchmark(lambda: columns.by_group().as_dict())
+
+    expected = _python_by_group(payload)
+    assert result.keys() == expected.keys()
+    for group, row in expected.items():
+        assert result[group] == pytest.approx(row)
+
+
+def test_columns_from_payload(benchmark: BenchmarkFixture, payload: list[dict]) -> None:
+    # Packing the columns is paid once for both kinds of statistics.
+    assert len(benchmark(ResultColumns.from_payload, payload).keys) == ENDPOINTS
@@ -0,0 +1,106 @@
+"""Benchmarks for the Gatus API client."""
+
+from collections.abc import AsyncGenerator
+from typing import Any
+
+import pytest
+from aiohttp import ClientSession
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.gatus.api import (
+    DATA_SOURCE_API,
+    DATA_SOURCE_METRICS,
+    METRICS_PATH,
+    STATUSES_PATH,
+    GatusApiClient,
+)
+
+from .conftest import AsyncBenchmark, StubServerFactory
+from .payloads import ENDPOINT_COUNTS, make_statuses_payload
+
+
+@pytest.fixture
+async def session() -> AsyncGenerator[ClientSession, Any]:
+    async with ClientSession() as session:
+        yield session
+
+
+@pytest.mark.parametrize("endpoints", [100, 1_000, 5_000])
+async def test_refresh_wall_clock(
+    aio_benchmark: AsyncBenchmark,
+    stub_server: StubServerFactory,
+    session: ClientSession,
+    endpoints: int,
+) -> None:
+    url = await stub_server(make_statuses_payload(endpoints, history=20))
+    client = GatusApiClient(url, session, verify_ssl=False)
+
+    response = await aio_benchmark(client.async_get_statuses)
+
+    assert len(response.statuses) == endpoints
+
+
+@pytest.mark.parametrize("latest_only", [True, False], ids=["latest", "full"])
+async def test_refresh_history_depth(
+    aio_benchmark: AsyncBenchmark,
+    benchmark: BenchmarkFixture,
+    stub_server: StubServerFactory,
+    session: ClientSession,
+    latest_only: bool,  # noqa: FBT001
+) -> None:
+    url = await stub_server(make_statuses_payload(1_000, history=100))
+    client = GatusApiClient(url, session, verify_ssl=False, latest_only=latest_only)
+
+    _, stats = await aio_benchmark(client.async_fetch_statuses)
+
+    benchmark.extra_info["bytes_transferred"] = stats.bytes_transferred
+    benchmark.extra_info["decode_time"] = stats.decode_time
+
+
+@pytest.mark.parametrize("endpoints", ENDPOINT_COUNTS)
+async def test_get_decode(
+    aio_benchmark: AsyncBenchmark,
+    stub_server: StubServerFactory,
+    session: ClientSession,
+    endpoints: int,
+    history: int,
+) -> None:
+    url = await stub_server(make_statuses_payload(endpoints, history=history))
+    client = GatusApiClient(url, session, verify_ssl=False)
+
+    async def _get() -> list[dict]:
+        return await client._get(STATUSES_PATH, {"pageSize": history})
+
+    data = await aio_benchmark(_get)
+
+    assert len(data) == endpoints
+    assert all(len(endpoint["results"]) == history for endpoint in data)
+
+
+@pytest.mark.parametrize("endpoints", ENDPOINT_COUNTS)
+@pytest.mark.parametrize("data_source", [DATA_SOURCE_API, DATA_SOURCE_METRICS])
+async def test_refresh_data_source(  # noqa: PLR0913
+    aio_benchmark: AsyncBenchmark,
+    benchmark: BenchmarkFixture,
+    stub_server: StubServerFactory,
+    session: ClientSession,
+    data_source: str,
+    endpoints: int,
+) -> None:
+    # Every endpoint is checked between polls, and all of them are healthy so
+    # the metrics never need the API for errors.
+    url = await stub_server(
+        make_statuses_payload(endpoints, history=20, healthy=True),
+        make_statuses_payload(endpoints, history=20, checks=1, healthy=True),
+    )
+    client = GatusApiClient(url, session, verify_ssl=False, data_source=data_source)
+    # The first refresh always reads the API, for hostnames.
+    await client.async_get_statuses()
+
+    response, stats = await aio_benchmark(client.async_fetch_statuses)
+
+    assert len(response.statuses) == endpoints
+    assert stats.path == (
+        METRICS_PATH if data_source == DATA_SOURCE_METRICS else STATUSES_PATH
+    )
+    benchmark.extra_info["bytes_transferred"] = stats.bytes_transferred
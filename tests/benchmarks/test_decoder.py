@@ -0,0 +1,58 @@
+"""Benchmarks for decoding Gatus statuses payloads."""
+
+import json
+import tracemalloc
+from collections.abc import Callable
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.gatus.api import (
+    STREAM_CHUNK_SIZE,
+    GatusEndpointStatus,
+    StatusesResponse,
+)
+from custom_components.gatus.decoder import EndpointStreamDecoder
+
+from .payloads import make_statuses_payload
+
+
+def _decode_full(body: bytes) -> StatusesResponse:
+    """Decode the way the client did before streaming."""
+    return StatusesResponse.from_list(json.loads(body))
+
+
+def _decode_stream(body: bytes) -> StatusesResponse:
+    """Decode the way the client does, one chunk at a time."""
+    decoder = EndpointStreamDecoder(latest_only=False)
+    statuses = []
+    for start in range(0, len(body), STREAM_CHUNK_SIZE):
+        chunk = body[start : start + STREAM_CHUNK_SIZE]
+        statuses.extend(GatusEndpointStatus.from_dict(e) for e in decoder.feed(chunk))
+    statuses.extend(GatusEndpointStatus.from_dict(e) for e in decoder.close())
+    return StatusesResponse(statuses=statuses)
+
+
+@pytest.fixture(scope="module")
+def body() -> bytes:
+    return json.dumps(make_statuses_payload(10_000, history=20)).encode()
+
+
+@pytest.mark.parametrize(
+    "decode",
+    [_decode_full, _decode_stream],
+    ids=["full", "stream"],
+)
+def test_decode_statuses(
+    benchmark: BenchmarkFixture,
+    body: bytes,
+    decode: Callable[[bytes], StatusesResponse],
+) -> None:
+    tracemalloc.start()
+    try:
+        response = decode(body)
+        benchmark.extra_info["peak_memory"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+    assert benchmark(decode, body) == response
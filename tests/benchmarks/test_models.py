@@ -0,0 +1,84 @@
+"""Benchmarks for building endpoint status records."""
+
+import tracemalloc
+from collections.abc import Callable
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.gatus.api import GatusEndpointStatus, StatusesResponse
+
+from .payloads import ENDPOINT_COUNTS, make_statuses_payload
+
+ENDPOINTS = 10_000
+
+
+class PydanticEndpointStatus(BaseModel):
+    """The pydantic model endpoint statuses used to be built as."""
+
+    name: str
+    group: str
+    key: str
+    hostname: str
+    last_checked: str
+    success: bool
+    response_time: int
+    errors: list[str]
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "PydanticEndpointStatus":
+        """Build the model the way GatusEndpointStatus.from_dict used to."""
+        last_check = data["results"][-1]
+        return cls(
+            name=data["name"],
+            group=data.get("group", ""),
+            key=data["key"],
+            hostname=last_check["hostname"],
+            last_checked=last_check["timestamp"],
+            success=last_check["success"],
+            response_time=last_check["duration"],
+            errors=last_check.get("errors", []),
+        )
+
+
+def _validated(data: dict) -> GatusEndpointStatus:
+    return GatusEndpointStatus.from_dict(data, validate=True)
+
+
+@pytest.fixture(scope="module")
+def payload() -> list[dict]:
+    return make_statuses_payload(ENDPOINTS)
+
+
+@pytest.mark.parametrize(
+    "from_dict",
+    [PydanticEndpointStatus.from_dict, GatusEndpointStatus.from_dict, _validated],
+    ids=["pydantic", "record", "record_validated"],
+)
+def test_build_statuses(
+    benchmark: BenchmarkFixture,
+    payload: list[dict],
+    from_dict: Callable[[dict], Any],
+) -> None:
+    tracemalloc.start()
+    try:
+        statuses = [from_dict(endpoint) for endpoint in payload]
+        size = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["bytes_per_status"] = size / len(statuses)
+
+    assert len(benchmark(lambda: [from_dict(endpoint) for endpoint in payload])) == (
+        ENDPOINTS
+    )
+
+
+@pytest.mark.parametrize("endpoints", ENDPOINT_COUNTS)
+def test_from_list(benchmark: BenchmarkFixture, endpoints: int, history: int) -> None:
+    payload = make_statuses_payload(endpoints, history=history)
+
+    response = benchmark(StatusesResponse.from_list, payload)
+
+    assert len(response.statuses) == endpoints
@@ -0,0 +1,152 @@
+"""Benchmarks for the poll, parse and entity update pipeline in Home Assistant."""
+
+import tracemalloc
+from collections.abc import AsyncGenerator, Awaitable, Callable
+from typing import Any
+
+import pytest
+from homeassistant.const import CONF_NAME, CONF_URL, CONF_VERIFY_SSL
+from homeassistant.core import HomeAssistant
+from pytest_benchmark.fixture import BenchmarkFixture
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.gatus.const import DOMAIN
+
+from .conftest import AsyncBenchmark, StubServerFactory
+from .payloads import make_statuses_payload
+
+# Every endpoint has a binary sensor and several sensors, so Home Assistant
+# benchmarks stop short of the largest payloads.
+PIPELINE_ENDPOINT_COUNTS = [10, 100, 1_000]
+# Setup alone is measured at the scale of large instances.
+SETUP_ENDPOINTS = 5_000
+
+type EntryFactory = Callable[..., Awaitable[MockConfigEntry]]
+
+
+@pytest.fixture
+async def setup_entry(
+    hass: HomeAssistant,
+    stub_server: StubServerFactory,
+) -> AsyncGenerator[EntryFactory, Any]:
+    """Set up config entries polling stub Gatus servers."""
+    entries: list[MockConfigEntry] = []
+
+    async def _setup(
+        *payloads: list[dict], wait_background_tasks: bool = True
+    ) -> MockConfigEntry:
+        entry = MockConfigEntry(
+            domain=DOMAIN,
+            data={
+                CONF_NAME: "Benchmark",
+                CONF_URL: await stub_server(*payloads),
+                CONF_VERIFY_SSL: False,
+            },
+        )
+        entry.add_to_hass(hass)
+        await hass.config_entries.async_setup(entry.entry_id)
+        await hass.async_block_till_done(wait_background_tasks=wait_background_tasks)
+        entries.append(entry)
+        return entry
+
+    yield _setup
+
+    for entry in entries:
+        await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+
+@pytest.mark.parametrize("endpoints", PIPELINE_ENDPOINT_COUNTS)
+async def test_refresh_unchanged(
+    hass: HomeAssistant,
+    aio_benchmark: AsyncBenchmark,
+    setup_entry: EntryFactory,
+    endpoints: int,
+) -> None:
+    entry = await setup_entry(make_statuses_payload(endpoints))
+    coordinator = entry.runtime_data.coordinator
+
+    await aio_benchmark(coordinator.async_refresh)
+
+    assert coordinator.last_update_success
+    # An endpoint binary sensor each, and one per group.
+    groups = len(list(coordinator.groups))
+    assert len(hass.states.async_entity_ids("binary_sensor")) == endpoints + groups
+
+
+@pytest.mark.parametrize("endpoints", PIPELINE_ENDPOINT_COUNTS)
+async def test_refresh_every_endpoint_changed(
+    hass: HomeAssistant,
+    aio_benchmark: AsyncBenchmark,
+    benchmark: BenchmarkFixture,
+    setup_entry: EntryFactory,
+    endpoints: int,
+) -> None:
+    entry = await setup_entry(
+        make_statuses_payload(endpoints),
+        make_statuses_payload(endpoints, checks=1),
+    )
+    coordinator = entry.runtime_data.coordinator
+
+    async def _refresh() -> None:
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    await aio_benchmark(_refresh)
+
+    assert coordinator.last_update_success
+    assert len(coordinator.delta.changed) == endpoints
+    benchmark.extra_info["entities"] = len(hass.states.async_entity_ids())
+
+
+@pytest.mark.parametrize("endpoints", PIPELINE_ENDPOINT_COUNTS)
+async def test_entity_writes(
+    hass: HomeAssistant,
+    aio_benchmark: AsyncBenchmark,
+    setup_entry: EntryFactory,
+    endpoints: int,
+) -> None:
+    entry = await setup_entry(make_statuses_payload(endpoints))
+    coordinator = entry.runtime_data.coordinator
+
+    async def _write_all() -> None:
+        # Without a delta, every entity of the coordinator writes its state.
+        coordinator.delta = None
+        coordinator.async_update_listeners()
+
+    await aio_benchmark(_write_all)
+
+    # An endpoint binary sensor each, and one per group.
+    groups = len(list(coordinator.groups))
+    assert len(hass.states.async_entity_ids("binary_sensor")) == endpoints + groups
+
+
+async def test_setup(
+    hass: HomeAssistant,
+    aio_benchmark: AsyncBenchmark,
+    benchmark: BenchmarkFixture,
+    setup_entry: EntryFactory,
+) -> None:
+    payload = make_statuses_payload(SETUP_ENDPOINTS)
+
+    async def _setup() -> MockConfigEntry:
+        # Uptimes and history are fetched in the background, after setup.
+        return await setup_entry(payload, wait_background_tasks=False)
+
+    async def _unload_all() -> None:
+        # Each round starts without the previous entries' background fetches.
+        for entry in hass.config_entries.async_entries(DOMAIN):
+            await hass.config_entries.async_unload(entry.entry_id)
+        await hass.async_block_till_done()
+
+    await aio_benchmark(_setup, rounds=3, before=_unload_all)
+    await _unload_all()
+
+    tracemalloc.start()
+    try:
+        entry = await _setup()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    benchmark.extra_info["peak_memory_bytes"] = peak
+    assert len(entry.runtime_data.coordinator.store) == SETUP_ENDPOINTS
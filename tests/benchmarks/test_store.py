@@ -0,0 +1,76 @@
+"""Benchmarks for looking up endpoint statuses."""
+
+import pytest
+from pytest_benchmark.fixture import BenchmarkFixture
+
+from custom_components.gatus.api import GatusEndpointStatus, StatusesResponse
+from custom_components.gatus.outcomes import OutcomeTracker
+from custom_components.gatus.store import GatusStatusStore, StatusesDelta
+
+from .payloads import make_statuses_payload
+
+ENDPOINTS = 10_000
+LOOKUPS = 100
+
+
+@pytest.fixture(scope="module")
+def response() -> StatusesResponse:
+    return StatusesResponse.from_list(make_statuses_payload(ENDPOINTS))
+
+
+@pytest.fixture(scope="module")
+def keys(response: StatusesResponse) -> list[str]:
+    step = ENDPOINTS // LOOKUPS
+    return [status.key for status in response.statuses[::step]]
+
+
+def test_lookup_list_scan(
+    benchmark: BenchmarkFixture, response: StatusesResponse, keys: list[str]
+) -> None:
+    def _lookup() -> list[GatusEndpointStatus]:
+        return [
+            next(status for status in response.statuses if status.key == key)
+            for key in keys
+        ]
+
+    assert len(benchmark(_lookup)) == LOOKUPS
+
+
+def test_lookup_store(
+    benchmark: BenchmarkFixture, response: StatusesResponse, keys: list[str]
+) -> None:
+    store = GatusStatusStore()
+    store.update(response.statuses)
+
+    def _lookup() -> list[GatusEndpointStatus | None]:
+        return [store.get(key) for key in keys]
+
+    assert None not in benchmark(_lookup)
+
+
+def test_store_update_steady(
+    benchmark: BenchmarkFixture, response: StatusesResponse
+) -> None:
+    store = GatusStatusStore()
+    store.update(response.statuses)
+
+    assert not benchmark(store.update, response.statuses).keys
+
+
+def test_outcomes_update_every_endpoint(benchmark: BenchmarkFixture) -> None:
+    store = GatusStatusStore()
+    tracker = OutcomeTracker(debounce_failures=3, debounce_window=5)
+    responses = [
+        StatusesResponse.from_list(make_statuses_payload(ENDPOINTS, checks=checks))
+        for checks in range(2)
+    ]
+    checks = iter(range(1_000_000))
+
+    def _update() -> StatusesDelta:
+        # Every endpoint has a new check, on every refresh.
+        delta = store.update(responses[next(checks) % 2].statuses)
+        tracker.update(store, delta)
+        return delta
+
+    assert len(benchmark(_update).changed) == ENDPOINTS
+    assert len(tracker) == ENDPOINTS
@@ -1,6 +1,7 @@
 """Fixtures for testing."""
 
 from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
@@ -9,9 +10,18 @@ from homeassistant.core import HomeAssistant
 from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_mock import MockerFixture
 
-from custom_components.gatus.api import GatusApiClient
+from custom_components.gatus.api import (
+    STATUSES_PATH,
+    FetchStats,
+    GatusApiClient,
+    GatusEndpointStatus,
+    StatusesResponse,
+)
 from custom_components.gatus.const import DOMAIN
 
+# When make_status' endpoints are checked, unless checked later than that.
+CHECKED_AT = datetime(2023, 10, 1, tzinfo=UTC)
+
 
 @pytest.fixture(autouse=True)
 def auto_enable_custom_integrations(
@@ -20,11 +30,51 @@ def auto_enable_custom_integrations(
     """Enable custom integrations."""
 
 
+def make_status(
+    name: str,
+    group: str = "",
+    *,
+    success: bool = True,
+    checked: int = 0,
+    response_time: int = 100,
+) -> GatusEndpointStatus:
+    """Build the status of an endpoint, keyed from its group and name like in Gatus."""
+    return GatusEndpointStatus(
+        key=f"{group}_{name}" if group else name,
+        name=name,
+        group=group,
+        hostname=f"{name}.local",
+        success=success,
+        last_checked=(CHECKED_AT + timedelta(seconds=checked)).strftime(
+            "%Y-%m-%dT%H:%M:%SZ"
+        ),
+        response_time=response_time,
+        errors=[] if success else ["down"],
+    )
+
+
+def mock_client(mocker: MockerFixture) -> Any:
+    """Mock a client fetching the statuses its async_get_statuses returns."""
+    client = mocker.MagicMock(spec=GatusApiClient)
+    # Set by __init__, so they aren't part of the spec.
+    client.cache_hits = 0
+    client.cache_misses = 0
+
+    async def fetch_statuses() -> tuple[StatusesResponse, FetchStats]:
+        stats = FetchStats(path=STATUSES_PATH, bytes_transferred=0, decode_time=0.0)
+        return await client.async_get_statuses(), stats
+
+    client.async_fetch_statuses.side_effect = fetch_statuses
+    return client
+
+
 @pytest.fixture
 async def mocked_client(
     mocker: Callable[..., Generator[MockerFixture, None, None]],
 ) -> None:
-    client = mocker.MagicMock(spec=GatusApiClient)
+    client = mock_client(mocker)
+    client.async_get_uptime.return_value = 1.0
+    client.async_get_endpoint_results.return_value = []
     mocker.patch.object(GatusApiClient, "__new__", return_value=client)
     return client
 
@@ -0,0 +1,88 @@
+"""Tests for the columnar statistics over result histories."""
+
+import numpy as np
+import pytest
+
+from custom_components.gatus.analytics import PERCENTILES, ResultColumns
+
+
+def _endpoint(key: str, group: str, durations: list[int]) -> dict:
+    return {
+        "key": key,
+        "name": key,
+        "group": group,
+        "results": [
+            {
+                "duration": duration,
+                # Odd durations fail, every third of them with errors.
+                "success": duration % 2 == 0,
+                **({"errors": ["down"]} if duration % 6 == 1 else {}),
+                "timestamp": "2025-02-04T04:00:00Z",
+            }
+            for duration in durations
+        ],
+    }
+
+
+PAYLOAD = [
+    _endpoint("apps_atuin", "apps", [40, 10, 31, 20, 7, 90, 13]),
+    _endpoint("apps_shlink", "apps", [5]),
+    _endpoint("empty", "", []),
+    _endpoint("core_dns", "core", [2, 4, 8, 16, 32, 64, 128, 256, 512, 1024, 3]),
+]
+
+
+def test_from_payload() -> None:
+    columns = ResultColumns.from_payload(PAYLOAD)
+
+    assert columns.keys == ["apps_atuin", "apps_shlink", "empty", "core_dns"]
+    assert columns.groups == ["apps", "apps", "", "core"]
+    assert columns.offsets.tolist() == [0, 7, 8, 8, 19]
+    assert columns.durations[:7].tolist() == [40, 10, 31, 20, 7, 90, 13]
+    assert columns.successes.sum() == 14  # noqa: PLR2004
+    assert columns.errors.sum() == 3  # noqa: PLR2004
+
+
+def test_by_endpoint() -> None:
+    statistics = ResultColumns.from_payload(PAYLOAD).by_endpoint().as_dict()
+
+    for endpoint in PAYLOAD:
+        durations = [result["duration"] for result in endpoint["results"]]
+        row = statistics[endpoint["key"]]
+        assert row["results"] == len(durations)
+        if not durations:
+            assert row == {
+                "results": 0,
+                "uptime": None,
+                "error_rate": None,
+                **{f"p{percentile}": None for percentile in PERCENTILES},
+            }
+            continue
+        for percentile in PERCENTILES:
+            assert row[f"p{percentile}"] == pytest.approx(
+                np.percentile(durations, percentile)
+            )
+        assert row["uptime"] == pytest.approx(
+            sum(duration % 2 == 0 for duration in durations) / len(durations)
+        )
+        assert row["error_rate"] == pytest.approx(
+            sum(duration % 6 == 1 for duration in durations) / len(durations)
+        )
+
+
+def test_by_group() -> None:
+    statistics = ResultColumns.from_payload(PAYLOAD).by_group().as_dict()
+
+    assert sorted(statistics) == ["", "apps", "core"]
+    assert statistics[""]["results"] == 0
+    apps = [40, 10, 31, 20, 7, 90, 13, 5]
+    assert statistics["apps"]["results"] == len(apps)
+    assert statistics["apps"]["p95"] == pytest.approx(np.percentile(apps, 95))
+    assert statistics["apps"]["uptime"] == pytest.approx(4 / 8)
+
+
+def test_no_results() -> None:
+    columns = ResultColumns.from_payload([])
+
+    assert columns.by_endpoint().as_dict() == {}
+    assert columns.by_group().as_dict() == {}
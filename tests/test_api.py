@@ -1,6 +1,8 @@
 """Tests for the Gatus API client."""
 
+import asyncio
 from collections.abc import AsyncGenerator
+from datetime import UTC, datetime
 from typing import Any
 from unittest.mock import Mock
 
@@ -10,10 +12,15 @@ from aiohttp import (
     ClientConnectorDNSError,
     ClientSession,
     ClientSSLError,
+    web,
 )
+from aiohttp.test_utils import TestServer
 from aioresponses import aioresponses
+from pydantic import ValidationError
+from yarl import URL
 
 from custom_components.gatus.api import (
+    DATA_SOURCE_METRICS,
     ConfigResponse,
     GatusApiClient,
     GatusApiClientConnectionError,
@@ -22,12 +29,16 @@ from custom_components.gatus.api import (
     GatusApiClientSSLError,
     GatusApiClientTimeoutError,
     GatusEndpointStatus,
+    GatusResult,
     StatusesResponse,
+    create_session,
 )
 
 API_URL = "http://testserver/"
 CONFIG_PATH = "api/v1/config"
 STATUSES_PATH = "api/v1/endpoints/statuses"
+LATEST_STATUSES_PATH = f"{STATUSES_PATH}?pageSize=1"
+METRICS_PATH = "metrics"
 
 
 @pytest.fixture
@@ -245,7 +256,7 @@ async def test_async_get_statuses(
 ) -> None:
     with aioresponses() as m:
         m.get(
-            f"{API_URL}{STATUSES_PATH}",
+            f"{API_URL}{LATEST_STATUSES_PATH}",
             payload=statuses,
         )
 
@@ -254,6 +265,341 @@ async def test_async_get_statuses(
         assert response == expected
 
 
+@pytest.mark.asyncio
+async def test_async_get_statuses_returns_every_endpoint(
+    client: GatusApiClient,
+) -> None:
+    statuses = [
+        {
+            "name": f"endpoint-{index}",
+            "key": f"endpoint-{index}",
+            "results": [
+                {
+                    "hostname": f"endpoint-{index}.example.com",
+                    "duration": index,
+                    "success": True,
+                    "timestamp": "2025-02-04T04:14:22.868295096Z",
+                },
+            ],
+        }
+        for index in range(500)
+    ]
+    with aioresponses() as m:
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=statuses)
+
+        response = await client.async_get_statuses()
+        assert [status.key for status in response.statuses] == [
+            endpoint["key"] for endpoint in statuses
+        ]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(("statuses", "expected"), testdata)
+async def test_async_get_statuses_full_history(
+    statuses: dict, expected: StatusesResponse
+) -> None:
+    async with ClientSession() as session:
+        client = GatusApiClient(API_URL, session, verify_ssl=False, latest_only=False)
+        with aioresponses() as m:
+            m.get(f"{API_URL}{STATUSES_PATH}", payload=statuses)
+
+            response = await client.async_get_statuses()
+            assert response == expected
+
+
+@pytest.mark.asyncio
+async def test_async_get_statuses_fetch_stats(client: GatusApiClient) -> None:
+    with aioresponses() as m:
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", body="[]")
+
+        response, stats = await client.async_fetch_statuses()
+        assert response.statuses == []
+        assert stats.path == STATUSES_PATH
+        assert stats.bytes_transferred == len(b"[]")
+        assert stats.decode_time >= 0
+        assert stats.build_time >= 0
+
+
+@pytest.mark.asyncio
+async def test_async_get_statuses_concurrent() -> None:
+    statuses, expected = testdata[0].values
+    async with ClientSession() as session:
+        client = GatusApiClient(API_URL, session, verify_ssl=False, request_ttl=60)
+        with aioresponses() as m:
+            m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=statuses, repeat=True)
+
+            responses = await asyncio.gather(
+                *(client.async_get_statuses() for _ in range(100))
+            )
+            # Within the TTL, a later refresh reuses the same response too.
+            later = await client.async_get_statuses()
+
+            assert (
+                len(m.requests[("GET", URL(f"{API_URL}{LATEST_STATUSES_PATH}"))]) == 1
+            )
+    assert responses[0] == expected
+    assert all(response is responses[0] for response in [*responses, later])
+    assert client.cache_misses == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_history(client: GatusApiClient) -> None:
+    with aioresponses() as m:
+        m.get(f"{API_URL}{STATUSES_PATH}?pageSize=100", payload=testdata[0].values[0])
+
+        history = await client.async_get_history()
+        assert history.keys == ["apps_atuin"]
+        assert history.durations.tolist() == [43782513]
+
+
+def _results(start: int, stop: int) -> list[dict]:
+    return [
+        {
+            "duration": 1_000_000 * index,
+            "success": index % 10 != 0,
+            "timestamp": f"2025-02-04T04:{index // 60:02}:{index % 60:02}.5Z",
+        }
+        for index in range(start, stop)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_async_get_endpoint_results(client: GatusApiClient) -> None:
+    path = f"{API_URL}api/v1/endpoints/apps_atuin/statuses?pageSize=100"
+    with aioresponses() as m:
+        # The latest results come first, each page being oldest first.
+        m.get(f"{path}&page=1", payload={"results": _results(150, 250)})
+        m.get(f"{path}&page=2", payload={"results": _results(50, 150)})
+        m.get(f"{path}&page=3", payload={"results": _results(0, 50)})
+
+        results = await client.async_get_endpoint_results("apps_atuin")
+        assert len(results) == 250  # noqa: PLR2004
+        assert results[0] == GatusResult(
+            timestamp=datetime(2025, 2, 4, 4, 0, 0, 500000, tzinfo=UTC),
+            success=False,
+            duration=0,
+        )
+        assert [r.duration for r in results] == sorted(r.duration for r in results)
+
+
+@pytest.mark.asyncio
+async def test_async_get_endpoint_results_since(client: GatusApiClient) -> None:
+    path = f"{API_URL}api/v1/endpoints/apps_atuin/statuses?pageSize=100"
+    with aioresponses() as m:
+        m.get(f"{path}&page=1", payload={"results": _results(150, 250)})
+
+        results = await client.async_get_endpoint_results(
+            "apps_atuin", datetime(2025, 2, 4, 4, 3, 19, 500000, tzinfo=UTC)
+        )
+        # Only the first page was requested.
+        assert len(m.requests) == 1
+        assert [r.duration // 1_000_000 for r in results] == list(range(200, 250))
+
+
+@pytest.mark.asyncio
+async def test_async_get_endpoint_results_concurrent(client: GatusApiClient) -> None:
+    path = f"{API_URL}api/v1/endpoints/apps_atuin/statuses?pageSize=100"
+    with aioresponses() as m:
+        m.get(f"{path}&page=1", payload={"results": _results(150, 250)})
+        m.get(f"{path}&page=2", payload={"results": _results(50, 150)})
+        m.get(f"{path}&page=3", payload={"results": _results(0, 50)})
+
+        everything, recent = await asyncio.gather(
+            client.async_get_endpoint_results("apps_atuin"),
+            client.async_get_endpoint_results(
+                "apps_atuin", datetime(2025, 2, 4, 4, 3, 19, 500000, tzinfo=UTC)
+            ),
+        )
+        # Both callers shared the first page, each page was requested once.
+        assert sum(len(requests) for requests in m.requests.values()) == 3  # noqa: PLR2004
+    assert len(everything) == 250  # noqa: PLR2004
+    assert len(recent) == 50  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_async_get_uptime(client: GatusApiClient) -> None:
+    with aioresponses() as m:
+        m.get(f"{API_URL}api/v1/endpoints/apps_atuin/uptimes/24h", body="0.998264")
+
+        assert await client.async_get_uptime("apps_atuin", "24h") == 0.998264  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_async_get_uptime_invalid(client: GatusApiClient) -> None:
+    with aioresponses() as m:
+        m.get(f"{API_URL}api/v1/endpoints/apps_atuin/uptimes/24h", body="<html>")
+
+        with pytest.raises(GatusApiClientError):
+            await client.async_get_uptime("apps_atuin", "24h")
+
+
+def _metrics(
+    successes: int,
+    failures: int = 0,
+    duration: float = 0.05,
+    *,
+    success: bool | None = None,
+) -> str:
+    labels = 'group="apps",key="apps_atuin",name="atuin",type="HTTP"'
+    body = (
+        f'gatus_results_total{{{labels},success="true"}} {successes}\n'
+        f'gatus_results_total{{{labels},success="false"}} {failures}\n'
+        f"gatus_results_duration_seconds{{{labels}}} {duration}\n"
+    )
+    if success is not None:
+        body += f"gatus_results_endpoint_success{{{labels}}} {int(success)}\n"
+    return body
+
+
+@pytest.fixture
+async def metrics_client() -> AsyncGenerator[GatusApiClient, Any]:
+    async with ClientSession() as session:
+        yield GatusApiClient(
+            API_URL, session, verify_ssl=False, data_source=DATA_SOURCE_METRICS
+        )
+
+
+@pytest.mark.asyncio
+async def test_async_get_statuses_from_metrics(metrics_client: GatusApiClient) -> None:
+    statuses, expected = testdata[0].values
+    with aioresponses() as m:
+        m.get(f"{API_URL}{METRICS_PATH}", body=_metrics(1))
+        m.get(f"{API_URL}{METRICS_PATH}", body=_metrics(1))
+        m.get(f"{API_URL}{METRICS_PATH}", body=_metrics(2, duration=0.25))
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=statuses)
+
+        # The first poll needs the API for hostnames.
+        first = await metrics_client.async_get_statuses()
+        second = await metrics_client.async_get_statuses()
+        third, stats = await metrics_client.async_fetch_statuses()
+
+    assert first == expected
+    assert second is first
+    (status,) = third.statuses
+    assert status.success is True
+    assert status.response_time == 250_000_000  # noqa: PLR2004
+    assert status.hostname == expected.statuses[0].hostname
+    assert status.last_checked != expected.statuses[0].last_checked
+    assert stats.path == METRICS_PATH
+    assert metrics_client.cache_hits == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "metrics",
+    [
+        pytest.param(_metrics(1, 1), id="failed"),
+        pytest.param(_metrics(1, 1, success=False), id="failed_gauge"),
+        pytest.param(_metrics(2, 1), id="ambiguous"),
+    ],
+)
+async def test_async_get_statuses_from_metrics_falls_back(
+    metrics_client: GatusApiClient, metrics: str
+) -> None:
+    statuses, _ = testdata[0].values
+    failed = [
+        {
+            **statuses[0],
+            "results": [{**statuses[0]["results"][0], "success": False}],
+        }
+    ]
+    with aioresponses() as m:
+        m.get(f"{API_URL}{METRICS_PATH}", body=_metrics(1))
+        m.get(f"{API_URL}{METRICS_PATH}", body=metrics)
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=statuses)
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=failed)
+
+        await metrics_client.async_get_statuses()
+        response = await metrics_client.async_get_statuses()
+
+    # Errors of failed checks are only available from the API.
+    assert response.statuses[0].success is False
+
+
+@pytest.mark.asyncio
+async def test_async_get_statuses_without_metrics(
+    metrics_client: GatusApiClient,
+) -> None:
+    statuses, expected = testdata[0].values
+    with aioresponses() as m:
+        m.get(f"{API_URL}{METRICS_PATH}", status=404)
+        m.get(f"{API_URL}{LATEST_STATUSES_PATH}", payload=statuses, repeat=True)
+
+        assert await metrics_client.async_get_statuses() == expected
+        assert await metrics_client.async_get_statuses() == expected
+        assert len(m.requests[("GET", URL(f"{API_URL}{METRICS_PATH}"))]) == 1
+
+
+@pytest.mark.parametrize(("statuses", "expected"), testdata)
+def test_from_list_validate(statuses: list[dict], expected: StatusesResponse) -> None:
+    assert StatusesResponse.from_list(statuses, validate=True) == expected
+
+
+@pytest.mark.parametrize(
+    ("field", "value"),
+    [("duration", "fast"), ("success", "yes"), ("errors", "boom")],
+)
+def test_from_dict_validate_invalid(field: str, value: str) -> None:
+    endpoint, *_ = testdata[0].values[0]
+    invalid = {**endpoint, "results": [{**endpoint["results"][-1], field: value}]}
+
+    GatusEndpointStatus.from_dict(invalid)
+    with pytest.raises(ValidationError):
+        GatusEndpointStatus.from_dict(invalid, validate=True)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("header", "conditional_header"),
+    [
+        ("ETag", "If-None-Match"),
+        ("Last-Modified", "If-Modified-Since"),
+    ],
+)
+async def test_async_get_statuses_not_modified(
+    client: GatusApiClient, header: str, conditional_header: str
+) -> None:
+    statuses, expected = testdata[0].values
+    with aioresponses() as m:
+        url = f"{API_URL}{LATEST_STATUSES_PATH}"
+        m.get(url, payload=statuses, headers={header: "validator"})
+        m.get(url, status=304)
+
+        first = await client.async_get_statuses()
+        second = await client.async_get_statuses()
+
+        assert first == expected
+        assert second is first
+        requests = m.requests[("GET", URL(url))]
+        assert conditional_header not in (requests[0].kwargs["headers"] or {})
+        assert requests[1].kwargs["headers"] == {conditional_header: "validator"}
+    assert client.cache_hits == 1
+    assert client.cache_misses == 1
+
+
+@pytest.mark.asyncio
+async def test_async_get_statuses_unchanged_body(client: GatusApiClient) -> None:
+    statuses, expected = testdata[0].values
+    changed, _ = testdata[1].values
+    with aioresponses() as m:
+        url = f"{API_URL}{LATEST_STATUSES_PATH}"
+        m.get(url, payload=statuses)
+        m.get(url, payload=statuses)
+        m.get(url, payload=changed)
+
+        first = await client.async_get_statuses()
+        second, stats = await client.async_fetch_statuses()
+        third = await client.async_get_statuses()
+
+    assert first == expected
+    assert second is first
+    # The unchanged body was still streamed through the decoder.
+    assert stats.bytes_transferred > 0
+    assert third != first
+    assert client.cache_hits == 1
+    assert client.cache_misses == 2  # noqa: PLR2004
+
+
 @pytest.mark.asyncio
 @pytest.mark.parametrize(
     ("exception", "error"),
@@ -266,10 +612,37 @@ async def test_async_get_statuses(
     ],
 )
 async def test_timeout_error(
-    client: GatusApiClient, exception: Exception, error: Exception,
+    client: GatusApiClient,
+    exception: Exception,
+    error: Exception,
 ) -> None:
     with aioresponses() as m:
         m.get(f"{API_URL}{CONFIG_PATH}", exception=exception)
 
         with pytest.raises(error):
             await client.async_get_config()
+
+
+async def test_create_session_reuses_connections() -> None:
+    peers: set[tuple[str, int]] = set()
+
+    async def statuses(request: web.Request) -> web.Response:
+        peers.add(request.transport.get_extra_info("peername"))
+        return web.json_response([])
+
+    app = web.Application()
+    app.router.add_get(f"/{STATUSES_PATH}", statuses)
+    async with (
+        TestServer(app, host="127.0.0.1") as server,
+        create_session() as session,
+    ):
+        client = GatusApiClient(str(server.make_url("/")), session, verify_ssl=False)
+        for _ in range(3):
+            await client.async_get_statuses()
+
+    assert len(peers) == 1
+
+
+async def test_create_session_compression() -> None:
+    async with create_session(compress=False) as session:
+        assert session.headers["Accept-Encoding"] == "identity"
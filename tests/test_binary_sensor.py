@@ -1,16 +1,37 @@
 """Tests for the Gatus HA binary sensor integration."""
 
+import json
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
 from typing import Any
 
 import pytest
+from homeassistant.const import EVENT_STATE_CHANGED
 from homeassistant.helpers import entity_registry as er
-from pytest_homeassistant_custom_component.common import MockConfigEntry
+from pytest_homeassistant_custom_component.common import (
+    MockConfigEntry,
+    async_capture_events,
+)
 from pytest_mock import MockerFixture
 
 from custom_components.gatus.api import (
+    GatusApiClient,
+    GatusApiClientConnectionError,
     GatusEndpointStatus,
     StatusesResponse,
 )
+from custom_components.gatus.binary_sensor import GatusBinarySensor
+from custom_components.gatus.const import (
+    ATTRIBUTE_PROFILE_FULL,
+    ATTRIBUTE_PROFILE_MINIMAL,
+    ATTRIBUTE_PROFILE_STANDARD,
+    CONF_ATTRIBUTE_PROFILE,
+    CONF_DEBOUNCE_FAILURES,
+    CONF_DEBOUNCE_WINDOW,
+    CONF_INSTANCES,
+)
+
+from .conftest import make_status, mock_client
 
 
 @pytest.mark.asyncio
@@ -142,3 +163,310 @@ async def test_async_setup_entry_states(
         state = hass.states.get(entity)
         assert state
         assert state.state == is_on
+
+
+@pytest.mark.asyncio
+async def test_endpoints_added_and_removed_in_gatus(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("kept"), make_status("removed")]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    entity_reg = er.async_get(hass)
+    reload = mocker.spy(hass.config_entries, "async_reload")
+
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("kept"), make_status("added")]
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert entity_reg.async_get("binary_sensor.gatus_added") is not None
+    assert hass.states.get("binary_sensor.gatus_added").state == "on"
+    assert entity_reg.async_get("binary_sensor.gatus_removed") is None
+    assert hass.states.get("binary_sensor.gatus_removed") is None
+    assert hass.states.get("binary_sensor.gatus_kept").state == "on"
+    reload.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_debounced_state(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_DEBOUNCE_FAILURES: 2, CONF_DEBOUNCE_WINDOW: 3}
+    )
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint")]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    states = []
+    for minute, success in enumerate([False, True, False, True, True], start=1):
+        status = replace(
+            make_status("endpoint"),
+            success=success,
+            last_checked=f"2023-10-01T00:{minute:02}:00Z",
+        )
+        client.async_get_statuses.return_value = StatusesResponse(statuses=[status])
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        states.append(hass.states.get("binary_sensor.gatus_endpoint"))
+
+    # A single failure doesn't take the endpoint down, 2 of the latest 3 do.
+    assert [state.state for state in states] == ["on", "on", "off", "on", "on"]
+    assert states[2].attributes["consecutive_failures"] == 1
+    assert states[2].attributes["flapping"] is False
+
+
+@pytest.mark.asyncio
+async def test_stale_entities_removed_at_setup(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    entity_reg = er.async_get(hass)
+    stale = entity_reg.async_get_or_create(
+        "binary_sensor",
+        "gatus",
+        f"{entry.entry_id}_gone",
+        config_entry=entry,
+    )
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("kept")]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entity_reg.async_get(stale.entity_id) is None
+    assert entity_reg.async_get("binary_sensor.gatus_kept") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("profile", "success", "writes_per_hour"),
+    [
+        (ATTRIBUTE_PROFILE_MINIMAL, True, 0),
+        (ATTRIBUTE_PROFILE_STANDARD, True, 0),
+        (ATTRIBUTE_PROFILE_FULL, True, 60),
+        (ATTRIBUTE_PROFILE_MINIMAL, False, 0),
+        # Consecutive failures grow with every failed check.
+        (ATTRIBUTE_PROFILE_STANDARD, False, 60),
+        (ATTRIBUTE_PROFILE_FULL, False, 60),
+    ],
+)
+async def test_recorder_writes_per_endpoint_per_hour(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    profile: str,
+    success: bool,  # noqa: FBT001
+    writes_per_hour: int,
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_ATTRIBUTE_PROFILE: profile}
+    )
+    started = datetime(2025, 1, 1, tzinfo=UTC)
+
+    def checked_at(minute: int) -> StatusesResponse:
+        # An endpoint staying healthy, or failing, checked by Gatus once a minute.
+        status = replace(
+            make_status("endpoint"),
+            success=success,
+            errors=[] if success else ["down"],
+            last_checked=(started + timedelta(minutes=minute)).isoformat(),
+            response_time=100 + minute,
+        )
+        return StatusesResponse(statuses=[status])
+
+    client.async_get_statuses.return_value = checked_at(0)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    # The recorder writes a states row for every state_changed event.
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    for minute in range(1, 61):
+        client.async_get_statuses.return_value = checked_at(minute)
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+
+    writes = [
+        event
+        for event in events
+        if event.data["entity_id"] == "binary_sensor.gatus_endpoint"
+    ]
+    assert len(writes) == writes_per_hour
+    # Attributes changing with every check aren't recorded, so those rows share
+    # one attributes row.
+    recorded_attributes = {
+        json.dumps(
+            {
+                name: value
+                for name, value in event.data["new_state"].attributes.items()
+                if name not in GatusBinarySensor._unrecorded_attributes
+            },
+            sort_keys=True,
+        )
+        for event in writes
+    }
+    assert len(recorded_attributes) <= 1
+
+
+@pytest.mark.asyncio
+async def test_federated_instances_rollups(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_INSTANCES: ["https://eu.status.local"]}
+    )
+    eu = mock_client(mocker)
+    eu.url = "https://eu.status.local"
+    eu.async_get_uptime.return_value = 1.0
+    mocker.patch.object(GatusApiClient, "__new__", side_effect=[client, eu])
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("shared"), make_status("primary")]
+    )
+    eu.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("shared", success=False)]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    assert hass.states.get("binary_sensor.gatus_shared").state == "on"
+    assert hass.states.get("binary_sensor.gatus_eu_status_local_shared").state == "off"
+    assert hass.states.get("binary_sensor.gatus_shared_all_up").state == "off"
+    any_up = hass.states.get("binary_sensor.gatus_shared_any_up")
+    assert any_up.state == "on"
+    assert any_up.attributes["up"] == 1
+    assert any_up.attributes["instances"] == 2  # noqa: PLR2004
+    # Endpoints found in a single instance have no rollups.
+    assert hass.states.get("binary_sensor.gatus_primary_any_up") is None
+
+    eu.async_get_statuses.side_effect = GatusApiClientConnectionError
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert coordinator.last_update_success
+    state = hass.states.get("binary_sensor.gatus_eu_status_local_shared")
+    assert state.state == "unavailable"
+    assert hass.states.get("binary_sensor.gatus_shared").state == "on"
+    # The failed instance is left out of the rollups.
+    assert hass.states.get("binary_sensor.gatus_shared_all_up").state == "on"
+
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("primary")]
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.gatus_shared_all_up") is None
+
+
+@pytest.mark.asyncio
+async def test_rollups_only_written_when_their_endpoint_changes(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry, options={CONF_INSTANCES: ["https://eu.status.local"]}
+    )
+    eu = mock_client(mocker)
+    eu.url = "https://eu.status.local"
+    eu.async_get_uptime.return_value = 1.0
+    mocker.patch.object(GatusApiClient, "__new__", side_effect=[client, eu])
+    statuses = StatusesResponse(statuses=[make_status("atuin"), make_status("shlink")])
+    client.async_get_statuses.return_value = statuses
+    eu.async_get_statuses.return_value = statuses
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    events = async_capture_events(hass, EVENT_STATE_CHANGED)
+
+    eu.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("atuin"), make_status("shlink", success=False)]
+    )
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    written = {event.data["entity_id"] for event in events}
+    assert "binary_sensor.gatus_shlink_all_up" in written
+    assert "binary_sensor.gatus_atuin_all_up" not in written
+    assert "binary_sensor.gatus_atuin_any_up" not in written
+    assert hass.states.get("binary_sensor.gatus_shlink_all_up").state == "off"
+
+
+@pytest.mark.asyncio
+async def test_group_entities(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            make_status("atuin", "apps"),
+            make_status("shlink", "apps", success=False),
+            make_status("ungrouped"),
+        ]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    entity_reg = er.async_get(hass)
+
+    state = hass.states.get("binary_sensor.gatus_group_apps_up")
+    assert state.state == "off"
+    assert state.attributes["endpoints"] == 2  # noqa: PLR2004
+    assert state.attributes["failing"] == 1
+    # Endpoints without a group have no group entities.
+    assert entity_reg.async_get("binary_sensor.gatus_group__up") is None
+
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("atuin", "apps"), make_status("ungrouped")]
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    state = hass.states.get("binary_sensor.gatus_group_apps_up")
+    assert state.state == "on"
+    assert state.attributes["endpoints"] == 1
+
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("ungrouped")]
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert entity_reg.async_get("binary_sensor.gatus_group_apps_up") is None
+
+
+@pytest.mark.asyncio
+async def test_entities_added_in_batches(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    mocker.patch("custom_components.gatus.entity.ENTITY_BATCH_SIZE", 2)
+    keys = [f"endpoint_{index}" for index in range(5)]
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status(key) for key in keys]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_reg = er.async_get(hass)
+    for key in keys:
+        assert hass.states.get(f"binary_sensor.gatus_{key}").state == "on"
+    # Every entity is attached to the entry's single device.
+    devices = {
+        entity_reg.async_get(f"binary_sensor.gatus_{key}").device_id for key in keys
+    }
+    assert len(devices) == 1
@@ -5,18 +5,36 @@ from unittest.mock import patch
 
 import pytest
 from homeassistant import config_entries
-from homeassistant.const import CONF_NAME, CONF_URL, CONF_VERIFY_SSL
+from homeassistant.const import (
+    CONF_NAME,
+    CONF_URL,
+    CONF_VERIFY_SSL,
+    CONF_WEBHOOK_ID,
+)
 from homeassistant.core import HomeAssistant
 from homeassistant.data_entry_flow import FlowResultType
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_mock import MockerFixture
 
 from custom_components.gatus.api import (
+    DATA_SOURCE_API,
+    DATA_SOURCE_METRICS,
     GatusApiClientConnectionError,
     GatusApiClientDNSError,
     GatusApiClientError,
     GatusApiClientSSLError,
     GatusApiClientTimeoutError,
 )
+from custom_components.gatus.const import (
+    ATTRIBUTE_PROFILE_MINIMAL,
+    CONF_ATTRIBUTE_PROFILE,
+    CONF_DATA_SOURCE,
+    CONF_DEBOUNCE_FAILURES,
+    CONF_DEBOUNCE_WINDOW,
+    CONF_INSTANCES,
+    CONF_WEBHOOK,
+    DOMAIN,
+)
 
 
 @pytest.fixture
@@ -96,3 +114,128 @@ async def test_handle_exception(
     )
     assert result.get("type") == FlowResultType.FORM
     assert result.get("errors") == {"base": error_key}
+
+
+async def test_options_flow(
+    hass: HomeAssistant,
+    mock_setup_entry: None,
+) -> None:
+    """Test setting the integration's options."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_NAME: "Test Monitor",
+            CONF_URL: "http://example.com",
+            CONF_VERIFY_SSL: True,
+        },
+    )
+    entry.add_to_hass(hass)
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert result.get("type") == FlowResultType.FORM
+    assert result.get("step_id") == "init"
+
+    user_input = {
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_MINIMAL,
+        CONF_DATA_SOURCE: DATA_SOURCE_METRICS,
+        CONF_DEBOUNCE_FAILURES: 6,
+        CONF_DEBOUNCE_WINDOW: 5,
+        CONF_WEBHOOK: False,
+    }
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert result.get("errors") == {CONF_DEBOUNCE_FAILURES: "invalid_debounce"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input={**user_input, CONF_DEBOUNCE_FAILURES: 3}
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert entry.options == {
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_MINIMAL,
+        CONF_DATA_SOURCE: DATA_SOURCE_METRICS,
+        CONF_DEBOUNCE_FAILURES: 3,
+        CONF_DEBOUNCE_WINDOW: 5,
+    }
+
+
+async def test_options_flow_webhook(
+    hass: HomeAssistant,
+    mock_setup_entry: None,
+) -> None:
+    """Test enabling alert webhooks keeps the webhook ID across changes."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_NAME: "Test Monitor",
+            CONF_URL: "http://example.com",
+            CONF_VERIFY_SSL: True,
+        },
+    )
+    entry.add_to_hass(hass)
+    user_input = {
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_MINIMAL,
+        CONF_DATA_SOURCE: DATA_SOURCE_API,
+        CONF_WEBHOOK: True,
+    }
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    assert "webhook_url" in result["description_placeholders"]
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    webhook_id = entry.options[CONF_WEBHOOK_ID]
+    assert webhook_id in result["description_placeholders"]["webhook_url"]
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    await hass.config_entries.options.async_configure(
+        result["flow_id"], user_input=user_input
+    )
+    assert entry.options[CONF_WEBHOOK_ID] == webhook_id
+
+
+async def test_options_flow_instances(
+    hass: HomeAssistant,
+    mock_setup_entry: None,
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> None:
+    """Test additional instances are checked before being saved."""
+    entry = MockConfigEntry(
+        domain=DOMAIN,
+        data={
+            CONF_NAME: "Test Monitor",
+            CONF_URL: "http://example.com",
+            CONF_VERIFY_SSL: True,
+        },
+    )
+    entry.add_to_hass(hass)
+    get_statuses = mocker.patch(
+        "custom_components.gatus.config_flow.GatusApiClient.async_get_statuses",
+        side_effect=[GatusApiClientConnectionError, None],
+    )
+    user_input = {
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_MINIMAL,
+        CONF_DATA_SOURCE: DATA_SOURCE_API,
+        CONF_WEBHOOK: False,
+    }
+
+    result = await hass.config_entries.options.async_init(entry.entry_id)
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={**user_input, CONF_INSTANCES: ["http://example.com"]},
+    )
+    assert result.get("errors") == {CONF_INSTANCES: "duplicate_instance"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={**user_input, CONF_INSTANCES: ["http://eu.example.com"]},
+    )
+    assert result.get("errors") == {CONF_INSTANCES: "connection"}
+
+    result = await hass.config_entries.options.async_configure(
+        result["flow_id"],
+        user_input={**user_input, CONF_INSTANCES: ["http://eu.example.com"]},
+    )
+    assert result.get("type") == FlowResultType.CREATE_ENTRY
+    assert entry.options[CONF_INSTANCES] == ["http://eu.example.com"]
+    assert get_statuses.await_count == 2  # noqa: PLR2004
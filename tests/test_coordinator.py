@@ -1,18 +1,39 @@
 """Test the Gatus coordinator."""
 
+import asyncio
 from collections.abc import Callable, Generator
+from datetime import timedelta
+from typing import Any
 
 import pytest
 from homeassistant.helpers.update_coordinator import UpdateFailed
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 from pytest_mock import MockerFixture
 
 from custom_components.gatus.api import (
+    FetchStats,
     GatusApiClient,
+    GatusApiClientConnectionError,
     GatusApiClientError,
+    GatusApiClientNotFoundError,
     GatusApiClientTimeoutError,
     StatusesResponse,
 )
-from custom_components.gatus.coordinator import GatusDataUpdateCoordinator
+from custom_components.gatus.binary_sensor import GatusBinarySensor
+from custom_components.gatus.const import (
+    AGGREGATE_BATCH_SIZE,
+    COORDINATOR_UPDATE_INTERVAL,
+    UPTIME_DURATIONS,
+    WEBHOOK_RECONCILE_INTERVAL,
+)
+from custom_components.gatus.coordinator import (
+    GatusAggregateCoordinator,
+    GatusDataUpdateCoordinator,
+    GatusFederatedCoordinator,
+    instance_name,
+)
+
+from .conftest import make_status, mock_client
 
 
 @pytest.fixture
@@ -60,3 +81,323 @@ async def test_async_update_data_client_error(
 
     with pytest.raises(UpdateFailed):
         await coordinator._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_refresh_only_writes_changed_entities(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    statuses = [make_status(f"endpoint_{index}") for index in range(800)]
+    client.async_get_statuses.return_value = StatusesResponse(statuses=statuses)
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    write_ha_state = mocker.spy(GatusBinarySensor, "async_write_ha_state")
+
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert write_ha_state.call_count == 0
+
+    statuses[3] = make_status("endpoint_3", success=False)
+    client.async_get_statuses.return_value = StatusesResponse(statuses=statuses)
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert write_ha_state.call_count == 1
+    assert hass.states.get("binary_sensor.gatus_endpoint_3").state == "off"
+
+
+@pytest.mark.asyncio
+async def test_refresh_writes_every_entity_after_failure(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: MockerFixture,
+) -> None:
+    hass, entry, client = mocked_entry
+    response = StatusesResponse(
+        statuses=[make_status(f"endpoint_{index}") for index in range(3)]
+    )
+    client.async_get_statuses.return_value = response
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    write_ha_state = mocker.spy(GatusBinarySensor, "async_write_ha_state")
+
+    client.async_get_statuses.side_effect = GatusApiClientError
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.gatus_endpoint_0").state == "unavailable"
+
+    client.async_get_statuses.side_effect = None
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+    assert write_ha_state.call_count == 6  # noqa: PLR2004
+    assert hass.states.get("binary_sensor.gatus_endpoint_0").state == "on"
+
+
+@pytest.mark.asyncio
+async def test_cached_refresh_skips_store_update(
+    coordinator: GatusDataUpdateCoordinator,
+    mocked_client: GatusApiClient,
+    mocker: MockerFixture,
+) -> None:
+    response = StatusesResponse(statuses=[make_status("endpoint_0")])
+    mocked_client.async_get_statuses.return_value = response
+    mocked_client.cache_hits = 1
+    mocked_client.cache_misses = 2
+    coordinator.data = response
+    update = mocker.spy(coordinator.store, "update")
+
+    assert await coordinator._async_update_data() is response
+
+    update.assert_not_called()
+    assert not coordinator.delta.keys
+    assert coordinator.cache_hits == 1
+    assert coordinator.cache_misses == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_update_interval_adapts(
+    coordinator: GatusDataUpdateCoordinator, mocked_client: GatusApiClient
+) -> None:
+    mocked_client.async_get_statuses.side_effect = GatusApiClientError
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval > COORDINATOR_UPDATE_INTERVAL
+
+    mocked_client.async_get_statuses.side_effect = None
+    mocked_client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint_0")]
+    )
+    await coordinator._async_update_data()
+    assert coordinator.update_interval == COORDINATOR_UPDATE_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_webhook_polls_to_reconcile(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, _, client = mocked_entry
+    coordinator = GatusDataUpdateCoordinator(
+        hass=hass, config_entry_id="test_entry_id", client=client, webhook=True
+    )
+    assert coordinator.update_interval == WEBHOOK_RECONCILE_INTERVAL
+
+    client.async_get_statuses.side_effect = GatusApiClientError
+    with pytest.raises(UpdateFailed):
+        await coordinator._async_update_data()
+    assert coordinator.update_interval == WEBHOOK_RECONCILE_INTERVAL
+
+
+@pytest.mark.asyncio
+async def test_push_status_writes_only_its_entity(
+    coordinator: GatusDataUpdateCoordinator,
+    mocked_client: GatusApiClient,
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> None:
+    mocked_client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint_0"), make_status("endpoint_1")]
+    )
+    await coordinator.async_refresh()
+    listeners = {key: mocker.Mock() for key in ("endpoint_0", "endpoint_1")}
+    for key, listener in listeners.items():
+        coordinator.async_add_listener(listener, key)
+
+    coordinator.async_push_status(make_status("endpoint_1", success=False))
+
+    assert coordinator.store.get("endpoint_1").success is False
+    listeners["endpoint_0"].assert_not_called()
+    listeners["endpoint_1"].assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_snapshot_saved_on_change(
+    coordinator: GatusDataUpdateCoordinator,
+    mocked_client: GatusApiClient,
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> None:
+    coordinator.snapshot = mocker.Mock()
+    mocked_client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint_0")]
+    )
+    await coordinator.async_refresh()
+    assert coordinator.snapshot.async_schedule_save.call_count == 1
+
+    await coordinator.async_refresh()
+    assert coordinator.snapshot.async_schedule_save.call_count == 1
+
+    coordinator.async_push_status(make_status("endpoint_0", success=False))
+    assert coordinator.snapshot.async_schedule_save.call_count == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_aggregate_coordinator_fetches_every_endpoint(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    coordinator: GatusDataUpdateCoordinator,
+) -> None:
+    hass, _, client = mocked_entry
+    count = AGGREGATE_BATCH_SIZE + 10
+    coordinator.store.update(
+        [make_status(f"endpoint_{index}") for index in range(count)]
+    )
+    aggregates = GatusAggregateCoordinator(hass, client, coordinator)
+
+    async def get_uptime(key: str, duration: str) -> float:
+        if key == "endpoint_0":
+            raise GatusApiClientNotFoundError
+        return 0.5 if duration == "1h" else 1.0
+
+    client.async_get_uptime.side_effect = get_uptime
+    data = await aggregates._async_update_data()
+
+    assert len(data) == count - 1
+    assert "endpoint_0" not in data
+    assert data["endpoint_1"] == dict.fromkeys(UPTIME_DURATIONS, 1.0) | {"1h": 0.5}
+
+
+@pytest.mark.asyncio
+async def test_aggregate_coordinator_error(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    coordinator: GatusDataUpdateCoordinator,
+) -> None:
+    hass, _, client = mocked_entry
+    coordinator.store.update([make_status("endpoint_0")])
+    aggregates = GatusAggregateCoordinator(hass, client, coordinator)
+    client.async_get_uptime.side_effect = GatusApiClientError
+
+    with pytest.raises(UpdateFailed):
+        await aggregates._async_update_data()
+
+
+@pytest.mark.asyncio
+async def test_refresh_records_metrics(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_fetch_statuses.side_effect = None
+    client.async_fetch_statuses.return_value = (
+        StatusesResponse(
+            statuses=[make_status(f"endpoint_{index}") for index in range(3)]
+        ),
+        FetchStats(
+            path="api/v1/endpoints/statuses",
+            bytes_transferred=1024,
+            decode_time=0.0,
+            build_time=0.0,
+        ),
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+
+    metrics = coordinator.metrics.latest
+    assert metrics.endpoints == 3  # noqa: PLR2004
+    assert metrics.bytes_transferred == 1024  # noqa: PLR2004
+    assert metrics.network >= 0
+    assert metrics.store > 0
+    assert metrics.write >= 0
+    assert coordinator._pending_metrics is None
+    assert metrics.error is None
+
+    client.async_fetch_statuses.side_effect = GatusApiClientTimeoutError
+    await coordinator.async_refresh()
+
+    assert len(coordinator.metrics) == 2  # noqa: PLR2004
+    assert coordinator.metrics.latest.error == "GatusApiClientTimeoutError"
+    assert coordinator.metrics.errors == 1
+
+
+def _instance_client(
+    mocker: Callable[..., Generator[MockerFixture, None, None]], url: str
+) -> Any:
+    client = mock_client(mocker)
+    client.url = url
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint_0", "apps")]
+    )
+    return client
+
+
+@pytest.fixture
+def federated(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> GatusFederatedCoordinator:
+    hass, _, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("endpoint_0", "apps"), make_status("endpoint_1", "apps")]
+    )
+    return GatusFederatedCoordinator(
+        hass=hass,
+        config_entry_id="test_entry_id",
+        client=client,
+        instances=[
+            _instance_client(mocker, "https://eu.status.local"),
+            _instance_client(mocker, "https://us.status.local/gatus"),
+        ],
+    )
+
+
+def test_instance_name() -> None:
+    assert instance_name("https://eu.status.local") == "eu_status_local"
+    assert (
+        instance_name("https://status.local:8443/gatus/") == "status_local_8443_gatus"
+    )
+
+
+@pytest.mark.asyncio
+async def test_federated_coordinator_merges_instances(
+    federated: GatusFederatedCoordinator,
+) -> None:
+    response = await federated._async_update_data()
+
+    assert sorted(status.key for status in response.statuses) == [
+        "apps_endpoint_0",
+        "apps_endpoint_1",
+        "eu_status_local_apps_endpoint_0",
+        "us_status_local_gatus_apps_endpoint_0",
+    ]
+    status = federated.store.get("eu_status_local_apps_endpoint_0")
+    assert status.instance == "eu_status_local"
+    client, key = federated.endpoint_client(status)
+    assert client is federated.instances["eu_status_local"]
+    assert key == "apps_endpoint_0"
+    assert federated.endpoint_url(status) == (
+        "https://eu.status.local/endpoints/apps_endpoint_0"
+    )
+
+    # Nothing changed in any instance: the previous response is kept.
+    federated.data = response
+    assert await federated._async_update_data() is response
+
+
+@pytest.mark.asyncio
+async def test_federated_coordinator_isolates_failed_instances(
+    federated: GatusFederatedCoordinator,
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> None:
+    federated.data = await federated._async_update_data()
+    eu = federated.instances["eu_status_local"]
+    us = federated.instances["us_status_local_gatus"]
+    eu.async_get_statuses.side_effect = GatusApiClientConnectionError
+
+    async def _hang() -> StatusesResponse:
+        await asyncio.sleep(1)
+        raise AssertionError
+
+    us.async_get_statuses.side_effect = _hang
+    mocker.patch(
+        "custom_components.gatus.coordinator.INSTANCE_TIMEOUT",
+        timedelta(milliseconds=10),
+    )
+
+    response = await federated._async_update_data()
+
+    assert federated.failed_instances == {"eu_status_local", "us_status_local_gatus"}
+    # Failed instances keep their endpoints, and every entity is refreshed.
+    assert len(response.statuses) == 4  # noqa: PLR2004
+    assert federated.delta is None
+
+    federated.client.async_get_statuses.side_effect = GatusApiClientError
+    with pytest.raises(UpdateFailed):
+        await federated._async_update_data()
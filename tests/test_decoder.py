@@ -0,0 +1,98 @@
+"""Tests for the Gatus payload decoders."""
+
+import json
+
+import pytest
+
+from custom_components.gatus.decoder import EndpointStreamDecoder
+
+PAYLOADS = [
+    pytest.param([], id="empty"),
+    pytest.param(
+        [{"name": "atuin", "key": "atuin", "results": []}],
+        id="no_results",
+    ),
+    pytest.param(
+        [
+            {
+                "name": "atuin",
+                "group": "apps",
+                "key": "apps_atuin",
+                "results": [
+                    {"success": True, "duration": 1, "errors": ["a]b}c"]},
+                    {"success": False, "duration": 2, "errors": ['"x" [y] {z}']},
+                ],
+            },
+            {
+                "name": 'sh\\"link\\\\',
+                "key": "shlink",
+                "results": [{"success": True, "nested": {"a": [1, {"b": 2}]}}],
+                "events": [{"type": "START"}],
+            },
+        ],
+        id="nested_and_escaped",
+    ),
+    pytest.param(
+        [{"name": "caf\u00e9 \u2603", "key": "cafe", "results": [{"a": 1}]}],
+        id="multibyte",
+    ),
+]
+
+
+def _decode(body: bytes) -> list[dict]:
+    decoder = EndpointStreamDecoder()
+    return [*decoder.feed(body), *decoder.close()]
+
+
+def _feed(decoder: EndpointStreamDecoder, body: bytes, size: int) -> list[dict]:
+    endpoints = []
+    for start in range(0, len(body), size):
+        endpoints.extend(decoder.feed(body[start : start + size]))
+    return [*endpoints, *decoder.close()]
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("indent", [None, 2])
+def test_decode_latest_results(payload: list[dict], indent: int | None) -> None:
+    expected = [
+        {**endpoint, "results": endpoint["results"][-1:]} for endpoint in payload
+    ]
+
+    body = json.dumps(payload, indent=indent).encode()
+
+    assert _decode(body) == expected
+
+
+@pytest.mark.parametrize("payload", PAYLOADS)
+@pytest.mark.parametrize("size", [1, 7, 64])
+@pytest.mark.parametrize("latest_only", [True, False])
+def test_stream_decoder_chunks(
+    payload: list[dict],
+    size: int,
+    latest_only: bool,  # noqa: FBT001
+) -> None:
+    expected = [
+        {**endpoint, "results": endpoint["results"][-1:]} if latest_only else endpoint
+        for endpoint in payload
+    ]
+    decoder = EndpointStreamDecoder(latest_only=latest_only)
+
+    endpoints = _feed(decoder, json.dumps(payload, ensure_ascii=False).encode(), size)
+
+    assert endpoints == expected
+
+
+def test_stream_decoder_yields_completed_endpoints() -> None:
+    decoder = EndpointStreamDecoder()
+
+    assert decoder.feed(b'[{"key": "a", "results": []}, {"key": "b"') == [
+        {"key": "a", "results": []}
+    ]
+    assert decoder.feed(b', "results": []}]') == [{"key": "b", "results": []}]
+    assert decoder.close() == []
+
+
+@pytest.mark.parametrize("body", [b"", b"{}", b'[{"results": [1, 2', b"[1]"])
+def test_decode_latest_results_invalid(body: bytes) -> None:
+    with pytest.raises((ValueError, IndexError)):
+        _decode(body)
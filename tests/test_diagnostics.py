@@ -0,0 +1,97 @@
+"""Tests for the Gatus diagnostics."""
+
+from typing import Any
+
+import pytest
+from homeassistant.components.diagnostics import REDACTED
+from homeassistant.const import CONF_WEBHOOK_ID
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.gatus.analytics import ResultColumns
+from custom_components.gatus.api import (
+    GatusApiClientError,
+    GatusEndpointStatus,
+    StatusesResponse,
+)
+from custom_components.gatus.const import (
+    ATTRIBUTE_PROFILE_STANDARD,
+    CONF_ATTRIBUTE_PROFILE,
+)
+from custom_components.gatus.diagnostics import async_get_config_entry_diagnostics
+from custom_components.gatus.metrics import STAGES
+
+
+@pytest.mark.asyncio
+async def test_async_get_config_entry_diagnostics(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            CONF_WEBHOOK_ID: "secret",
+            CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_STANDARD,
+        },
+    )
+    client.cache_hits = 0
+    client.cache_misses = 1
+    client.async_get_history.return_value = ResultColumns.from_payload(
+        [
+            {
+                "key": "apps_atuin",
+                "group": "apps",
+                "results": [
+                    {"duration": 100, "success": True},
+                    {"duration": 300, "success": False, "errors": ["down"]},
+                ],
+            }
+        ]
+    )
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            GatusEndpointStatus(
+                key="apps_atuin",
+                name="atuin",
+                group="apps",
+                hostname="atuin.sh",
+                success=True,
+                last_checked="2023-10-01T00:00:00Z",
+                response_time=100,
+                errors=[],
+            ),
+        ]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["entry"]["data"]["url"] == REDACTED
+    assert diagnostics["entry"]["options"] == {
+        CONF_WEBHOOK_ID: REDACTED,
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_STANDARD,
+    }
+    coordinator = diagnostics["coordinator"]
+    assert coordinator["endpoints"] == 1
+    assert coordinator["cache_misses"] == 1
+    refreshes = coordinator["refreshes"]
+    assert refreshes["refreshes"] == 1
+    assert set(refreshes["stages"]) == set(STAGES)
+    assert set(refreshes["stages"]["total"]) == {"p50", "p95", "p99"}
+    assert diagnostics["groups"]["apps"]["uptime"] == 0.5  # noqa: PLR2004
+    assert diagnostics["groups"]["apps"]["p50"] == 200  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_diagnostics_without_history(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(statuses=[])
+    client.async_get_history.side_effect = GatusApiClientError("down")
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    diagnostics = await async_get_config_entry_diagnostics(hass, entry)
+
+    assert diagnostics["groups"] == {"error": "down"}
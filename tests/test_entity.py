@@ -3,10 +3,29 @@
 from unittest.mock import MagicMock
 
 import pytest
+from homeassistant.core import HomeAssistant
 from homeassistant.helpers.device_registry import DeviceEntryType, DeviceInfo
 
+from custom_components.gatus.binary_sensor import GatusBinarySensor
+from custom_components.gatus.const import (
+    ATTRIBUTE_PROFILE_FULL,
+    ATTRIBUTE_PROFILE_MINIMAL,
+    ATTRIBUTE_PROFILE_STANDARD,
+    CONF_ATTRIBUTE_PROFILE,
+)
 from custom_components.gatus.coordinator import GatusDataUpdateCoordinator
-from custom_components.gatus.entity import GatusEntity
+from custom_components.gatus.entity import GatusEntity, async_track_entities
+from custom_components.gatus.outcomes import OutcomeTracker
+
+STANDARD_ATTRIBUTES = {
+    "name",
+    "group",
+    "key",
+    "hostname",
+    "url",
+    "consecutive_failures",
+    "flapping",
+}
 
 
 @pytest.fixture
@@ -16,8 +35,16 @@ def setup() -> tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock]:
     config_entry.entry_id = "test_entry_id"
     config_entry.domain = "test_domain"
     config_entry.data = {"url": "http://test-url"}
+    config_entry.options = {CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_FULL}
+    config_entry.runtime_data.device_info = DeviceInfo(
+        identifiers={("test_domain", "test_entry_id")},
+        manufacturer="Gatus Integration",
+        entry_type=DeviceEntryType.SERVICE,
+    )
     coordinator.config_entry = config_entry
     coordinator.client = MagicMock()
+    coordinator.endpoint_url.return_value = "http://test-url/endpoints/test_key"
+    coordinator.outcomes = OutcomeTracker()
 
     description = MagicMock()
     status = MagicMock()
@@ -43,6 +70,19 @@ def test_init(setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock]) ->
         manufacturer="Gatus Integration",
         entry_type=DeviceEntryType.SERVICE,
     )
+    # Only binary sensors expose the endpoint's attributes.
+    assert not hasattr(entity, "_attr_extra_state_attributes")
+    assert entity.entity_description == description
+    assert entity._endpoint_status == status
+    assert entity._api == coordinator.client
+
+
+def test_binary_sensor_attributes(
+    setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock],
+) -> None:
+    coordinator, description, status = setup
+    entity = GatusBinarySensor(coordinator, description, status)
+
     assert entity._attr_extra_state_attributes == {
         "name": "test_name",
         "group": "test_group",
@@ -52,7 +92,85 @@ def test_init(setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock]) ->
         "response_time": "test_response_time",
         "errors": "test_errors",
         "url": "http://test-url/endpoints/test_key",
+        "consecutive_failures": 0,
+        "flapping": False,
     }
-    assert entity.entity_description == description
-    assert entity._endpoint_status == status
-    assert entity._api == coordinator.client
+
+
+@pytest.mark.parametrize(
+    ("profile", "expected"),
+    [
+        (ATTRIBUTE_PROFILE_MINIMAL, {"name", "group", "key"}),
+        (ATTRIBUTE_PROFILE_STANDARD, STANDARD_ATTRIBUTES),
+        (None, STANDARD_ATTRIBUTES),
+    ],
+)
+def test_attribute_profiles(
+    setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock],
+    profile: str | None,
+    expected: set[str],
+) -> None:
+    coordinator, description, status = setup
+    coordinator.config_entry.options = (
+        {} if profile is None else {CONF_ATTRIBUTE_PROFILE: profile}
+    )
+    entity = GatusBinarySensor(coordinator, description, status)
+
+    assert set(entity._attr_extra_state_attributes) == expected
+    assert entity._attr_extra_state_attributes.keys().isdisjoint(
+        entity._unrecorded_attributes - expected
+    )
+
+
+def test_shared_device_info(
+    setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock],
+) -> None:
+    coordinator, description, status = setup
+    first = GatusEntity(coordinator, description, status)
+    second = GatusEntity(coordinator, description, status)
+
+    assert first._attr_device_info is second._attr_device_info
+    assert first._attr_device_info is coordinator.config_entry.runtime_data.device_info
+
+
+def test_url_only_built_when_shown(
+    setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock],
+) -> None:
+    coordinator, description, status = setup
+    coordinator.config_entry.options = {
+        CONF_ATTRIBUTE_PROFILE: ATTRIBUTE_PROFILE_MINIMAL
+    }
+    entity = GatusBinarySensor(coordinator, description, status)
+    entity._update_status(status)
+
+    coordinator.endpoint_url.assert_not_called()
+
+
+def _create_entities(id_: str) -> list[MagicMock]:
+    entity = MagicMock()
+    entity.unique_id = id_
+    entity.registry_entry = None
+    return [entity]
+
+
+@pytest.mark.asyncio
+async def test_track_entities(
+    hass: HomeAssistant,
+    setup: tuple[GatusDataUpdateCoordinator, MagicMock, MagicMock],
+) -> None:
+    coordinator, _, _ = setup
+    coordinator.hass = hass
+    coordinator.delta = None
+    async_add_entities = MagicMock()
+    ids = ["first", "second"]
+
+    unique_ids = await async_track_entities(
+        MagicMock(), coordinator, async_add_entities, lambda: ids, _create_entities
+    )
+    assert unique_ids == {"first", "second"}
+
+    ids[:] = ["second", "third"]
+    listener = coordinator.async_add_listener.call_args.args[0]
+    listener()
+    added = async_add_entities.call_args.args[0]
+    assert [entity.unique_id for entity in added] == ["third"]
@@ -0,0 +1,126 @@
+"""Tests for the single-flight gate of requests to Gatus."""
+
+import asyncio
+
+import pytest
+
+from custom_components.gatus.gate import RequestGate
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_concurrent_calls_share_a_request() -> None:
+    gate = RequestGate()
+    calls = 0
+
+    async def _fetch() -> list[str]:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        return ["statuses"]
+
+    results = await asyncio.gather(*(gate.async_call("a", _fetch) for _ in range(10)))
+
+    assert calls == 1
+    assert all(result is results[0] for result in results)
+    assert gate.shared == 9  # noqa: PLR2004
+    # Without a TTL, the next call sends a request of its own.
+    await gate.async_call("a", _fetch)
+    assert calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_keys_are_separate() -> None:
+    gate = RequestGate()
+
+    async def _fetch(key: str) -> str:
+        await asyncio.sleep(0)
+        return key
+
+    assert await asyncio.gather(
+        gate.async_call("a", lambda: _fetch("a")),
+        gate.async_call("b", lambda: _fetch("b")),
+    ) == ["a", "b"]
+
+
+@pytest.mark.asyncio
+async def test_results_reused_for_ttl() -> None:
+    clock = _Clock()
+    gate = RequestGate(ttl=1.0, clock=clock)
+    calls = 0
+
+    async def _fetch() -> int:
+        nonlocal calls
+        calls += 1
+        return calls
+
+    assert await gate.async_call("a", _fetch) == 1
+    clock.now = 0.9
+    assert await gate.async_call("a", _fetch) == 1
+    clock.now = 1.0
+    assert await gate.async_call("a", _fetch) == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_expired_results_released() -> None:
+    gate = RequestGate(ttl=0.01)
+
+    async def _fetch() -> list[str]:
+        return ["page"]
+
+    await gate.async_call("a", _fetch)
+    assert "a" in gate._results
+
+    # The key is never requested again, but its result is still dropped.
+    await asyncio.sleep(0.05)
+    assert gate._results == {}
+    assert gate._evictions == {}
+
+
+@pytest.mark.asyncio
+async def test_errors_not_reused() -> None:
+    gate = RequestGate(ttl=1.0, clock=_Clock())
+    calls = 0
+
+    async def _fail() -> None:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0)
+        msg = "down"
+        raise RuntimeError(msg)
+
+    results = await asyncio.gather(
+        *(gate.async_call("a", _fail) for _ in range(3)), return_exceptions=True
+    )
+    assert calls == 1
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+    with pytest.raises(RuntimeError):
+        await gate.async_call("a", _fail)
+    assert calls == 2  # noqa: PLR2004
+
+
+@pytest.mark.asyncio
+async def test_cancelled_caller_leaves_request() -> None:
+    gate = RequestGate()
+    release = asyncio.Event()
+
+    async def _fetch() -> str:
+        await release.wait()
+        return "statuses"
+
+    first = asyncio.ensure_future(gate.async_call("a", _fetch))
+    second = asyncio.ensure_future(gate.async_call("a", _fetch))
+    await asyncio.sleep(0)
+    first.cancel()
+    release.set()
+
+    assert await second == "statuses"
+    assert first.cancelled()
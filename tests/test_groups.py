@@ -0,0 +1,148 @@
+"""Tests for the incrementally updated group aggregates."""
+
+from custom_components.gatus.api import GatusEndpointStatus
+from custom_components.gatus.groups import (
+    HEAP_SLACK,
+    GroupAggregates,
+    changed_group_contexts,
+    group_context,
+)
+from custom_components.gatus.store import GatusStatusStore
+
+from .conftest import make_status
+
+ENDPOINTS = 1_000
+GROUPS = 10
+
+
+def _is_up(status: GatusEndpointStatus) -> bool:
+    return status.success
+
+
+def _assert_matches_store(store: GatusStatusStore, groups: GroupAggregates) -> None:
+    """Compare the aggregates with ones computed over the whole store."""
+    assert sorted(aggregate.name for aggregate in groups) == sorted(store.groups)
+    for name in store.groups:
+        statuses = store.group(name)
+        aggregate = groups.get(name)
+        assert aggregate.endpoints == len(statuses)
+        assert aggregate.failing == sum(not status.success for status in statuses)
+        assert groups.worst_response_time(name) == max(
+            status.response_time for status in statuses
+        )
+
+
+def test_update_counts() -> None:
+    store = GatusStatusStore()
+    groups = GroupAggregates(store)
+    groups.update(
+        store.update(
+            [
+                make_status("endpoint_0", "apps", response_time=300),
+                make_status("endpoint_1", "apps", success=False),
+                make_status("endpoint_2", "core", response_time=50),
+            ]
+        ),
+        _is_up,
+    )
+
+    apps = groups.get("apps")
+    assert (apps.endpoints, apps.failing, apps.up) == (2, 1, False)
+    assert groups.worst_response_time("apps") == 300  # noqa: PLR2004
+    assert groups.get("core").up
+
+    # The slowest endpoint speeds up, and the failing one is replaced in core.
+    groups.update(
+        store.update(
+            [
+                make_status("endpoint_0", "apps", response_time=80),
+                make_status("endpoint_2", "core", response_time=50),
+                make_status("endpoint_3", "core", success=False),
+            ]
+        ),
+        _is_up,
+    )
+
+    _assert_matches_store(store, groups)
+    assert groups.get("apps").up
+    assert groups.worst_response_time("apps") == 80  # noqa: PLR2004
+
+    groups.update(store.update([make_status("endpoint_3", "core")]), _is_up)
+
+    assert groups.get("apps") is None
+    assert groups.worst_response_time("apps") is None
+    _assert_matches_store(store, groups)
+
+
+def test_update_uses_is_up() -> None:
+    store = GatusStatusStore()
+    groups = GroupAggregates(store)
+    # A failure debounced away isn't counted.
+    groups.update(
+        store.update([make_status("endpoint_0", "apps", success=False)]), lambda _: True
+    )
+
+    assert groups.get("apps").failing == 0
+
+
+def test_heap_compacted() -> None:
+    store = GatusStatusStore()
+    groups = GroupAggregates(store)
+    for response_time in range(1, 10 * HEAP_SLACK):
+        groups.update(
+            store.update(
+                [
+                    make_status("endpoint_0", "apps", response_time=response_time),
+                    make_status("endpoint_1", "apps"),
+                ]
+            ),
+            _is_up,
+        )
+
+        assert groups.worst_response_time("apps") == max(response_time, 100)
+    # Entries of the endpoints' previous statuses don't pile up.
+    assert len(groups.get("apps").heap) <= 2 * 2 + HEAP_SLACK
+
+
+def test_changed_group_contexts() -> None:
+    store = GatusStatusStore()
+    store.update(
+        [
+            make_status("endpoint_0", "apps"),
+            make_status("endpoint_1", "core"),
+            make_status("endpoint_2", "web"),
+        ]
+    )
+    delta = store.update(
+        [
+            make_status("endpoint_0", "apps", success=False),
+            make_status("endpoint_2", "web"),
+            make_status("endpoint_3", "db"),
+        ]
+    )
+
+    assert changed_group_contexts(store, delta) == {
+        group_context("apps"),
+        group_context("core"),
+        group_context("db"),
+    }
+    assert changed_group_contexts(store, store.update(store)) == set()
+
+
+def test_many_endpoints() -> None:
+    store = GatusStatusStore()
+    groups = GroupAggregates(store)
+    for check in range(5):
+        # A different tenth of the endpoints fails, and slows down, each check.
+        statuses = [
+            make_status(
+                f"endpoint_{index}",
+                f"group_{index % GROUPS}",
+                success=index % 10 != check,
+                response_time=index * (1 + (index % 10 == check)),
+            )
+            for index in range(ENDPOINTS)
+        ]
+        groups.update(store.update(statuses), _is_up)
+
+        _assert_matches_store(store, groups)
@@ -0,0 +1,226 @@
+"""Tests for the import of the endpoints' history into statistics."""
+
+from collections.abc import Callable, Generator
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from freezegun.api import FrozenDateTimeFactory
+from homeassistant.core import HomeAssistant
+from homeassistant.util import dt as dt_util
+from pytest_homeassistant_custom_component.common import async_fire_time_changed
+from pytest_mock import MockerFixture
+
+from custom_components.gatus.api import (
+    GatusApiClientError,
+    GatusApiClientNotFoundError,
+    GatusResult,
+)
+from custom_components.gatus.const import DOMAIN, HISTORY_SAVE_DELAY
+from custom_components.gatus.history import (
+    EndpointHistory,
+    GatusHistoryImporter,
+    HourlyResults,
+    aggregate_hourly,
+)
+from custom_components.gatus.store import GatusStatusStore
+
+from .conftest import make_status
+
+START = datetime(2025, 2, 4, 4, 0, tzinfo=UTC)
+
+
+def _result(minutes: int, *, success: bool = True, duration: int = 10) -> GatusResult:
+    return GatusResult(
+        timestamp=START + timedelta(minutes=minutes),
+        success=success,
+        duration=duration * 1_000_000,
+    )
+
+
+def test_aggregate_hourly() -> None:
+    hours = aggregate_hourly(
+        [
+            _result(0, duration=10),
+            _result(30, success=False, duration=30),
+            _result(70, duration=20),
+        ]
+    )
+
+    assert [hour.start for hour in hours] == [START, START + timedelta(hours=1)]
+    assert hours[0].response_time() == {
+        "start": START,
+        "mean": 20.0,
+        "min": 10.0,
+        "max": 30.0,
+    }
+    assert hours[0].success_ratio() == {
+        "start": START,
+        "mean": 50.0,
+        "min": 0,
+        "max": 100,
+    }
+    assert hours[1].success_ratio()["min"] == 100  # noqa: PLR2004
+
+
+def test_aggregate_hourly_continues_pending_hour() -> None:
+    pending = aggregate_hourly([_result(0, duration=10)])[0]
+
+    hours = aggregate_hourly([_result(10, duration=30)], pending)
+
+    assert len(hours) == 1
+    assert hours[0].results == 2  # noqa: PLR2004
+    assert hours[0].response_time()["mean"] == 20.0  # noqa: PLR2004
+
+
+def test_endpoint_history_round_trip() -> None:
+    history = EndpointHistory(
+        watermark=START,
+        pending=HourlyResults(start=START, results=1, duration_sum=5),
+    )
+
+    assert EndpointHistory.from_dict(history.as_dict()) == history
+    assert EndpointHistory.from_dict(EndpointHistory().as_dict()) == EndpointHistory()
+
+
+@pytest.fixture
+def importer(
+    hass: HomeAssistant,
+    mocked_client: Any,
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> GatusHistoryImporter:
+    hass.config.components.add("recorder")
+    coordinator = mocker.Mock()
+    coordinator.store = GatusStatusStore()
+    coordinator.store.update([make_status("atuin"), make_status("shlink")])
+    coordinator.endpoint_client = lambda status: (mocked_client, status.key)
+    return GatusHistoryImporter(hass, "test_entry_id", coordinator)
+
+
+@pytest.fixture
+def add_statistics(
+    mocker: Callable[..., Generator[MockerFixture, None, None]],
+) -> Any:
+    return mocker.patch("custom_components.gatus.history.async_add_external_statistics")
+
+
+@pytest.mark.asyncio
+async def test_import_completed_hours(
+    importer: GatusHistoryImporter,
+    mocked_client: Any,
+    add_statistics: Any,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    freezer.move_to(START + timedelta(minutes=80))
+    results = {
+        "atuin": [_result(0), _result(30, success=False), _result(70)],
+        "shlink": GatusApiClientNotFoundError("gone"),
+    }
+    mocked_client.async_get_endpoint_results.side_effect = (
+        lambda key, _since: _raise_or_return(results[key])
+    )
+
+    await importer.async_import()
+
+    mocked_client.async_get_endpoint_results.assert_any_call("atuin", None)
+    # Only the completed hour is imported, as both statistics of the endpoint.
+    assert add_statistics.call_count == 2  # noqa: PLR2004
+    metadata, statistics = add_statistics.call_args_list[0].args[1:]
+    assert metadata["statistic_id"] == f"{DOMAIN}:atuin_response_time"
+    assert [statistic["start"] for statistic in statistics] == [START]
+    metadata, statistics = add_statistics.call_args_list[1].args[1:]
+    assert metadata["statistic_id"] == f"{DOMAIN}:atuin_success_ratio"
+    assert statistics[0]["mean"] == 50.0  # noqa: PLR2004
+
+    # Later imports start from the watermark, and finish the pending hour.
+    add_statistics.reset_mock()
+    freezer.move_to(START + timedelta(minutes=130))
+    results["atuin"] = [_result(80, success=False)]
+    await importer.async_import()
+
+    mocked_client.async_get_endpoint_results.assert_any_call(
+        "atuin", START + timedelta(minutes=70)
+    )
+    statistics = add_statistics.call_args_list[1].args[2]
+    assert statistics == [
+        {"start": START + timedelta(hours=1), "mean": 50.0, "min": 0, "max": 100}
+    ]
+
+
+@pytest.mark.asyncio
+async def test_import_flushes_ended_hour_without_new_results(
+    importer: GatusHistoryImporter,
+    mocked_client: Any,
+    add_statistics: Any,
+    freezer: FrozenDateTimeFactory,
+) -> None:
+    freezer.move_to(START + timedelta(minutes=20))
+    mocked_client.async_get_endpoint_results.return_value = [_result(0), _result(10)]
+    await importer.async_import()
+    add_statistics.assert_not_called()
+
+    # The endpoint stopped being checked, but its hour still ends.
+    freezer.move_to(START + timedelta(minutes=70))
+    mocked_client.async_get_endpoint_results.return_value = []
+    await importer.async_import()
+
+    assert add_statistics.call_count == 4  # noqa: PLR2004
+    statistics = add_statistics.call_args_list[0].args[2]
+    assert [statistic["start"] for statistic in statistics] == [START]
+    history = importer._histories["atuin"]
+    assert history.pending is None
+    assert history.watermark == START + timedelta(minutes=10)
+
+    add_statistics.reset_mock()
+    await importer.async_import()
+    add_statistics.assert_not_called()
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("add_statistics")
+async def test_import_saves_watermarks(
+    hass: HomeAssistant,
+    hass_storage: dict[str, Any],
+    importer: GatusHistoryImporter,
+    mocked_client: Any,
+) -> None:
+    mocked_client.async_get_endpoint_results.return_value = [_result(0), _result(5)]
+
+    await importer.async_import()
+    async_fire_time_changed(hass, dt_util.utcnow() + HISTORY_SAVE_DELAY)
+    await hass.async_block_till_done()
+
+    data = hass_storage[f"{DOMAIN}.test_entry_id.history"]["data"]
+    assert data["atuin"]["watermark"] == (START + timedelta(minutes=5)).isoformat()
+
+
+@pytest.mark.asyncio
+async def test_import_stops_on_error(
+    importer: GatusHistoryImporter,
+    mocked_client: Any,
+    add_statistics: Any,
+) -> None:
+    mocked_client.async_get_endpoint_results.side_effect = GatusApiClientError
+
+    await importer.async_import()
+
+    add_statistics.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_import_needs_recorder(
+    hass: HomeAssistant,
+    importer: GatusHistoryImporter,
+    mocked_client: Any,
+) -> None:
+    hass.config.components.discard("recorder")
+
+    await importer.async_import()
+
+    mocked_client.async_get_endpoint_results.assert_not_called()
+
+
+def _raise_or_return(value: Any) -> Any:
+    if isinstance(value, Exception):
+        raise value
+    return value
@@ -1,11 +1,101 @@
 """Test component setup."""
 
+from typing import Any
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
 from homeassistant.core import HomeAssistant
 from homeassistant.setup import async_setup_component
+from pytest_homeassistant_custom_component.common import MockConfigEntry
 
-from custom_components.gatus.const import DOMAIN
+from custom_components.gatus.api import (
+    GatusApiClientError,
+    GatusEndpointStatus,
+    StatusesResponse,
+)
+from custom_components.gatus.const import (
+    ATTRIBUTE_PROFILE_FULL,
+    ATTRIBUTE_PROFILE_MINIMAL,
+    CONF_ATTRIBUTE_PROFILE,
+    DOMAIN,
+)
+from custom_components.gatus.snapshot import SNAPSHOT_VERSION, encode_snapshot
 
 
 async def test_async_setup(hass: HomeAssistant) -> None:
     """Test the component gets setup."""
     assert await async_setup_component(hass, DOMAIN, {}) is True
+
+
+@pytest.mark.asyncio
+async def test_setup_restores_snapshot(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    hass_storage: dict[str, Any],
+) -> None:
+    """Test entities start from the snapshot while Gatus is unreachable."""
+    hass, entry, client = mocked_entry
+    status = GatusEndpointStatus(
+        key="apps_atuin",
+        name="atuin",
+        group="apps",
+        hostname="atuin.local",
+        success=True,
+        last_checked="2023-10-01T00:00:00Z",
+        response_time=100,
+        errors=[],
+    )
+    hass_storage[f"{DOMAIN}.{entry.entry_id}"] = {
+        "version": SNAPSHOT_VERSION,
+        "key": f"{DOMAIN}.{entry.entry_id}",
+        "data": encode_snapshot([status]),
+    }
+    client.async_get_statuses.side_effect = GatusApiClientError
+
+    assert await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data.coordinator.store.get("apps_atuin") == status
+    assert hass.states.get("binary_sensor.gatus_apps_atuin") is not None
+    client.async_get_statuses.assert_called()
+
+
+@pytest.mark.asyncio
+async def test_setup_without_snapshot_needs_gatus(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    """Test setup is retried when there is no snapshot and Gatus is down."""
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.side_effect = GatusApiClientError
+
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.SETUP_RETRY
+
+
+@pytest.mark.asyncio
+async def test_options_change_reloads_entry(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    """Test an options change unloads the entry fully before setting it up again."""
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(statuses=[])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    first = entry.runtime_data
+
+    for profile in (ATTRIBUTE_PROFILE_FULL, ATTRIBUTE_PROFILE_MINIMAL):
+        hass.config_entries.async_update_entry(
+            entry, options={CONF_ATTRIBUTE_PROFILE: profile}
+        )
+        await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    assert entry.runtime_data is not first
+    # The previous setups' listeners were removed on unload.
+    assert len(entry.update_listeners) == 1
+    assert first.coordinator._unsub_refresh is None
+    # The device info is built again by every setup, not kept across them.
+    assert entry.runtime_data.device_info is not first.device_info
+    assert entry.runtime_data.device_info["identifiers"] == {(DOMAIN, entry.entry_id)}
@@ -0,0 +1,76 @@
+"""Tests for the refresh metrics."""
+
+import pytest
+
+from custom_components.gatus.metrics import (
+    STAGES,
+    RefreshMetrics,
+    RefreshMetricsWindow,
+)
+
+
+def test_total() -> None:
+    metrics = RefreshMetrics(network=1, decode=2, build=3, store=4, write=5)
+
+    assert metrics.total == 15  # noqa: PLR2004
+
+
+def test_percentiles() -> None:
+    window = RefreshMetricsWindow()
+    for index in range(1, 101):
+        window.record(RefreshMetrics(network=index))
+
+    assert window.percentiles("network") == {
+        "p50": pytest.approx(50.5),
+        "p95": pytest.approx(95.05),
+        "p99": pytest.approx(99.01),
+    }
+
+
+@pytest.mark.parametrize(
+    ("values", "expected"),
+    [([], None), ([0.25], 0.25)],
+)
+def test_percentiles_few_refreshes(values: list[float], expected: float | None) -> None:
+    window = RefreshMetricsWindow()
+    for value in values:
+        window.record(RefreshMetrics(decode=value))
+
+    percentiles = window.percentiles("decode")
+    assert percentiles == dict.fromkeys(("p50", "p95", "p99"), expected)
+
+
+def test_window_drops_oldest_refreshes() -> None:
+    window = RefreshMetricsWindow(size=10)
+    for index in range(20):
+        window.record(RefreshMetrics(store=index))
+
+    assert len(window) == 10  # noqa: PLR2004
+    assert window.percentiles("store")["p50"] == pytest.approx(14.5)
+    assert window.latest.store == 19  # noqa: PLR2004
+
+
+def test_errors_are_counted_and_left_out_of_percentiles() -> None:
+    window = RefreshMetricsWindow(size=2)
+    window.record(RefreshMetrics(network=1))
+    window.record(RefreshMetrics(network=30, error="GatusApiClientTimeoutError"))
+    window.record(RefreshMetrics(network=30, error="GatusApiClientTimeoutError"))
+
+    assert window.errors == 2  # noqa: PLR2004
+    assert window.percentiles("network")["p99"] is None
+
+
+def test_as_dict() -> None:
+    window = RefreshMetricsWindow()
+    window.record(RefreshMetrics(network=1, bytes_transferred=10, endpoints=2))
+    window.record(RefreshMetrics(cached=True))
+    window.record(RefreshMetrics(error="GatusApiClientError"))
+
+    summary = window.as_dict()
+
+    assert summary["refreshes"] == 3  # noqa: PLR2004
+    assert summary["errors"] == summary["window_errors"] == 1
+    assert summary["cached"] == 1
+    assert set(summary["stages"]) == set(STAGES)
+    assert summary["latest"]["error"] == "GatusApiClientError"
+    assert summary["latest"]["total"] == 0
@@ -0,0 +1,148 @@
+"""Tests for the rolling windows of endpoint check outcomes."""
+
+from dataclasses import replace
+from itertools import pairwise
+
+import pytest
+
+from custom_components.gatus.outcomes import (
+    FLAPPING_TRANSITIONS,
+    OUTCOME_WINDOW,
+    OutcomeTracker,
+    OutcomeWindow,
+)
+from custom_components.gatus.store import GatusStatusStore
+
+from .conftest import make_status
+
+ENDPOINTS = 10_000
+
+
+@pytest.mark.parametrize("debounce_window", [1, 3, OUTCOME_WINDOW])
+def test_window_counts(debounce_window: int) -> None:
+    window = OutcomeWindow(debounce_window)
+    outcomes: list[bool] = []
+    for index in range(100):
+        # An irregular mix of successes and failures.
+        success = (index * 7919 + debounce_window) % 10 < 7  # noqa: PLR2004
+        window.add(success)
+        outcomes.append(success)
+
+        kept = outcomes[-OUTCOME_WINDOW:]
+        assert len(window) == len(kept)
+        assert window.failures == outcomes[-debounce_window:].count(False)
+        assert window.transitions == sum(a != b for a, b in pairwise(kept))
+        consecutive = (
+            len(outcomes)
+            - 1
+            - max((i for i, outcome in enumerate(outcomes) if outcome), default=-1)
+        )
+        assert window.consecutive_failures == consecutive
+
+
+def test_window_flapping() -> None:
+    window = OutcomeWindow()
+    for index in range(FLAPPING_TRANSITIONS):
+        window.add(index % 2 == 0)
+    assert not window.flapping
+
+    window.add(FLAPPING_TRANSITIONS % 2 == 0)
+    assert window.flapping
+
+    # Once the changes leave the window, the endpoint stops flapping.
+    for _ in range(OUTCOME_WINDOW):
+        window.add(True)  # noqa: FBT003
+    assert not window.flapping
+
+
+def test_tracker_debounces() -> None:
+    store = GatusStatusStore()
+    tracker = OutcomeTracker(debounce_failures=2, debounce_window=3)
+    assert tracker.is_up("endpoint_0", success=False) is False
+
+    for check, success in enumerate([True, False, True, False, True, True]):
+        tracker.update(
+            store,
+            store.update([make_status("endpoint_0", checked=check, success=success)]),
+        )
+        up = tracker.is_up("endpoint_0", success=success)
+        # Down only while 2 of the latest 3 checks failed.
+        assert up is (check != 3)  # noqa: PLR2004
+
+
+def test_tracker_only_counts_new_checks() -> None:
+    store = GatusStatusStore()
+    tracker = OutcomeTracker()
+    tracker.update(store, store.update([make_status("endpoint_0")]))
+
+    # A refresh changing the hostname isn't a new check.
+    tracker.update(
+        store,
+        store.update([replace(make_status("endpoint_0"), hostname="moved.local")]),
+    )
+    assert len(tracker.get("endpoint_0")) == 1
+
+    tracker.update(store, store.update([]))
+    assert tracker.get("endpoint_0") is None
+
+
+@pytest.mark.parametrize("success", [True, False])
+def test_tracker_estimated_check_counted_once(*, success: bool) -> None:
+    store = GatusStatusStore()
+    tracker = OutcomeTracker(debounce_failures=2, debounce_window=3)
+    tracker.update(store, store.update([make_status("endpoint_0", checked=0)]))
+
+    # An alert pushes the check with the time it was received at.
+    pushed = replace(
+        make_status("endpoint_0", checked=1, success=success),
+        last_checked="received",
+        estimated=True,
+    )
+    tracker.update(store, store.update_one(pushed))
+    # The next poll reports the same check, with the time Gatus ran it at.
+    tracker.update(
+        store, store.update([make_status("endpoint_0", checked=1, success=success)])
+    )
+
+    assert len(tracker.get("endpoint_0")) == 2  # noqa: PLR2004
+    assert tracker.is_up("endpoint_0", success=success)
+
+    # A poll whose check ended differently is a check of its own.
+    pushed = replace(
+        make_status("endpoint_0", checked=2, success=success),
+        last_checked="received",
+        estimated=True,
+    )
+    tracker.update(store, store.update_one(pushed))
+    tracker.update(
+        store, store.update([make_status("endpoint_0", checked=3, success=not success)])
+    )
+
+    assert len(tracker.get("endpoint_0")) == 4  # noqa: PLR2004
+
+
+def test_tracker_many_endpoints() -> None:
+    store = GatusStatusStore()
+    tracker = OutcomeTracker(debounce_failures=3, debounce_window=5)
+    for check in range(OUTCOME_WINDOW + 5):
+        # Every tenth endpoint fails every other check, the rest are steady.
+        statuses = [
+            make_status(
+                f"endpoint_{index}",
+                checked=check,
+                success=index % 10 != 0 or check % 2 == 0,
+            )
+            for index in range(ENDPOINTS)
+        ]
+        tracker.update(store, store.update(statuses))
+
+    assert len(tracker) == ENDPOINTS
+    flapping = {status.key for status in store if tracker.get(status.key).flapping}
+    assert flapping == {f"endpoint_{index}" for index in range(0, ENDPOINTS, 10)}
+    # 2 or 3 of the latest 5 checks of flapping endpoints failed.
+    assert all(tracker.get(key).failures in (2, 3) for key in flapping)
+    assert all(
+        tracker.is_up(status.key, success=status.success)
+        for status in store
+        if status.key not in flapping
+    )
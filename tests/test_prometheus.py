@@ -0,0 +1,86 @@
+"""Tests for the Gatus Prometheus metrics parser."""
+
+import pytest
+
+from custom_components.gatus.prometheus import EndpointMetrics, MetricsStreamParser
+
+EXPOSITION = b"""\
+# HELP go_goroutines Number of goroutines that currently exist.
+# TYPE go_goroutines gauge
+go_goroutines 12
+# HELP gatus_results_total Number of results per endpoint
+# TYPE gatus_results_total counter
+gatus_results_total{group="apps",key="apps_atuin",name="atuin",success="false",type="HTTP"} 3
+gatus_results_total{group="apps",key="apps_atuin",name="atuin",success="true",type="HTTP"} 1204
+gatus_results_total{group="",key="_sh-link",name="sh\\"link\\\\",success="true",type="HTTP"} 7 1700000000000
+gatus_results_code_total{code="200",group="apps",key="apps_atuin",name="atuin",type="HTTP"} 1204
+gatus_results_duration_seconds{group="apps",key="apps_atuin",name="atuin",type="HTTP"} 0.043782513
+gatus_results_duration_seconds{group="",key="_sh-link",name="sh\\"link\\\\",type="HTTP"} 0.1
+gatus_results_endpoint_success{group="apps",key="apps_atuin",name="atuin",type="HTTP"} 1
+"""  # noqa: E501
+
+EXPECTED = {
+    "apps_atuin": EndpointMetrics(
+        key="apps_atuin",
+        name="atuin",
+        group="apps",
+        successes=1204,
+        failures=3,
+        duration=0.043782513,
+        success=True,
+    ),
+    "_sh-link": EndpointMetrics(
+        key="_sh-link",
+        name='sh"link\\',
+        group="",
+        successes=7,
+        duration=0.1,
+    ),
+}
+
+
+def _parse(body: bytes) -> dict[str, EndpointMetrics]:
+    parser = MetricsStreamParser()
+    parser.feed(body)
+    return parser.close()
+
+
+def test_parse_metrics() -> None:
+    endpoints = _parse(EXPOSITION)
+
+    assert endpoints == EXPECTED
+    assert endpoints["apps_atuin"].results == 1207  # noqa: PLR2004
+
+
+@pytest.mark.parametrize("size", [1, 7, 64, len(EXPOSITION)])
+def test_parse_metrics_in_chunks(size: int) -> None:
+    parser = MetricsStreamParser()
+    for start in range(0, len(EXPOSITION), size):
+        parser.feed(EXPOSITION[start : start + size])
+
+    assert parser.close() == EXPECTED
+
+
+def test_parse_metrics_without_trailing_newline() -> None:
+    assert _parse(EXPOSITION.rstrip()) == EXPECTED
+
+
+def test_parse_metrics_multibyte() -> None:
+    body = 'gatus_results_total{key="cafe",name="café",success="true"} 1\n'.encode()
+    parser = MetricsStreamParser()
+    for index in range(len(body)):
+        parser.feed(body[index : index + 1])
+
+    assert parser.close()["cafe"].name == "café"
+
+
+def test_parse_metrics_reuses_labels() -> None:
+    first = MetricsStreamParser()
+    first.feed(EXPOSITION)
+    first.close()
+
+    second = MetricsStreamParser(first.labels)
+    second.feed(EXPOSITION.replace(b"1204\n", b"1205\n"))
+
+    assert second.close()["apps_atuin"].successes == 1205  # noqa: PLR2004
+    assert second.labels == first.labels
@@ -0,0 +1,94 @@
+"""Tests for the adaptive polling interval."""
+
+from datetime import timedelta
+
+import pytest
+
+from custom_components.gatus.scheduler import (
+    BACKOFF_JITTER,
+    FAILURE_REFRESHES,
+    AdaptivePollInterval,
+)
+from custom_components.gatus.store import GatusStatusStore
+
+from .conftest import make_status
+
+DEFAULT = timedelta(seconds=10)
+MINIMUM = timedelta(seconds=5)
+MAXIMUM = timedelta(minutes=5)
+BACKOFF_MAXIMUM = timedelta(minutes=10)
+
+
+@pytest.fixture
+def scheduler() -> AdaptivePollInterval:
+    return AdaptivePollInterval(DEFAULT, MINIMUM, MAXIMUM, BACKOFF_MAXIMUM)
+
+
+def test_stretches_up_to_half_the_learned_cadence(
+    scheduler: AdaptivePollInterval,
+) -> None:
+    store = GatusStatusStore()
+    assert (
+        scheduler.on_success(store, store.update([make_status("endpoint_0")]))
+        == DEFAULT
+    )
+    assert (
+        scheduler.on_success(store, store.update([make_status("endpoint_0")]))
+        == DEFAULT
+    )
+
+    delta = store.update([make_status("endpoint_0", checked=120)])
+    assert scheduler.on_success(store, delta) == DEFAULT
+    assert scheduler.cadence == timedelta(minutes=2)
+
+    intervals = [
+        scheduler.on_success(store, store.update(list(store))) for _ in range(10)
+    ]
+    assert intervals[0] == DEFAULT * 1.5
+    assert intervals[-1] == timedelta(minutes=1)
+    assert intervals == sorted(intervals)
+
+
+def test_tightens_when_endpoints_start_failing(
+    scheduler: AdaptivePollInterval,
+) -> None:
+    store = GatusStatusStore()
+    scheduler.on_success(
+        store, store.update([make_status("endpoint_0"), make_status("endpoint_1")])
+    )
+
+    delta = store.update(
+        [
+            make_status("endpoint_0"),
+            make_status("endpoint_1", checked=60, success=False),
+        ]
+    )
+    assert scheduler.on_success(store, delta) == MINIMUM
+    intervals = [
+        scheduler.on_success(store, store.update(list(store)))
+        for _ in range(FAILURE_REFRESHES)
+    ]
+    assert intervals[:-1] == [MINIMUM] * (FAILURE_REFRESHES - 1)
+    # A long-standing outage falls back to the usual interval.
+    assert intervals[-1] == DEFAULT
+
+    delta = store.update(
+        [make_status("endpoint_0"), make_status("endpoint_1", checked=120)]
+    )
+    assert scheduler.on_success(store, delta) == DEFAULT
+
+
+def test_backs_off_on_failure(scheduler: AdaptivePollInterval) -> None:
+    intervals = [scheduler.on_failure() for _ in range(10)]
+
+    for failures, interval in enumerate(intervals[:4], start=1):
+        expected = DEFAULT * 2**failures
+        assert expected * (1 - BACKOFF_JITTER) <= interval
+        assert interval <= expected * (1 + BACKOFF_JITTER)
+    assert intervals[-1] <= BACKOFF_MAXIMUM * (1 + BACKOFF_JITTER)
+
+    store = GatusStatusStore()
+    assert (
+        scheduler.on_success(store, store.update([make_status("endpoint_0")]))
+        == DEFAULT
+    )
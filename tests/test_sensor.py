@@ -0,0 +1,176 @@
+"""Tests for the Gatus HA sensor integration."""
+
+from dataclasses import replace
+from typing import Any
+
+import pytest
+from homeassistant.const import EntityCategory
+from homeassistant.helpers import entity_registry as er
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.gatus.api import (
+    GatusApiClientError,
+    GatusEndpointStatus,
+    StatusesResponse,
+)
+
+
+@pytest.mark.asyncio
+async def test_async_setup_entry(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            GatusEndpointStatus(
+                key="apps_atuin",
+                name="atuin",
+                group="apps",
+                hostname="atuin.sh",
+                success=True,
+                last_checked="2023-10-01T00:00:00Z",
+                response_time=43782513,
+                errors=[],
+            ),
+        ]
+    )
+    client.async_get_uptime.return_value = 0.995
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    entity_reg = er.async_get(hass)
+    response_time = hass.states.get("sensor.gatus_apps_atuin_response_time")
+    assert response_time.state == "43.782513"
+    assert response_time.attributes["unit_of_measurement"] == "ms"
+    assert response_time.attributes["state_class"] == "measurement"
+    # The endpoint's attributes are only on its binary sensor.
+    assert "hostname" not in response_time.attributes
+    for duration in ("1h", "24h", "7d"):
+        entity_id = f"sensor.gatus_apps_atuin_uptime_{duration}"
+        assert entity_reg.async_get(entity_id) is not None
+        assert float(hass.states.get(entity_id).state) == pytest.approx(99.5)
+
+
+@pytest.mark.asyncio
+async def test_uptime_unavailable_before_first_fetch(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            GatusEndpointStatus(
+                key="apps_atuin",
+                name="atuin",
+                group="apps",
+                hostname="atuin.sh",
+                success=True,
+                last_checked="2023-10-01T00:00:00Z",
+                response_time=100,
+                errors=[],
+            ),
+        ]
+    )
+    client.async_get_uptime.side_effect = GatusApiClientError
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done(wait_background_tasks=True)
+
+    state = hass.states.get("sensor.gatus_apps_atuin_uptime_24h")
+    assert state.state == "unavailable"
+
+
+@pytest.mark.asyncio
+async def test_diagnostic_sensors(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            GatusEndpointStatus(
+                key="apps_atuin",
+                name="atuin",
+                group="apps",
+                hostname="atuin.sh",
+                success=False,
+                last_checked="2023-10-01T00:00:00Z",
+                response_time=100,
+                errors=["connection refused", "timeout"],
+            ),
+        ]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    entity_reg = er.async_get(hass)
+    errors = entity_reg.async_get("sensor.gatus_apps_atuin_errors")
+    assert errors.entity_category == EntityCategory.DIAGNOSTIC
+    assert hass.states.get(errors.entity_id).state == "connection refused; timeout"
+    # Last checked changes on every check, so it has to be enabled explicitly.
+    last_checked = entity_reg.async_get("sensor.gatus_apps_atuin_last_checked")
+    assert last_checked.entity_category == EntityCategory.DIAGNOSTIC
+    assert last_checked.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+
+
+@pytest.mark.asyncio
+async def test_refresh_sensors(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    client.async_get_statuses.return_value = StatusesResponse(statuses=[])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.test_gatus_endpoints").state == "0"
+    assert hass.states.get("sensor.test_gatus_refresh_errors").state == "0"
+
+    client.async_get_statuses.side_effect = GatusApiClientError
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.test_gatus_refresh_errors").state == "1"
+    entity_reg = er.async_get(hass)
+    for entity_id in (
+        "sensor.test_gatus_refresh_duration_p95",
+        "sensor.test_gatus_payload_size",
+    ):
+        registry_entry = entity_reg.async_get(entity_id)
+        assert registry_entry.entity_category == EntityCategory.DIAGNOSTIC
+        assert registry_entry.disabled_by is er.RegistryEntryDisabler.INTEGRATION
+
+
+@pytest.mark.asyncio
+async def test_group_sensors(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> None:
+    hass, entry, client = mocked_entry
+    atuin = GatusEndpointStatus(
+        key="apps_atuin",
+        name="atuin",
+        group="apps",
+        hostname="atuin.sh",
+        success=True,
+        last_checked="2023-10-01T00:00:00Z",
+        response_time=43782513,
+        errors=[],
+    )
+    shlink = replace(
+        atuin, key="apps_shlink", name="shlink", success=False, response_time=2000000
+    )
+    client.async_get_statuses.return_value = StatusesResponse(statuses=[atuin, shlink])
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.gatus_group_apps_failing").state == "1"
+    worst = hass.states.get("sensor.gatus_group_apps_worst_response_time")
+    assert worst.state == "43.782513"
+    assert worst.attributes["unit_of_measurement"] == "ms"
+
+    # Only the endpoints that changed are visited to update the group.
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[replace(atuin, response_time=1000000), replace(shlink, success=True)]
+    )
+    await entry.runtime_data.coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("sensor.gatus_group_apps_failing").state == "0"
+    worst = hass.states.get("sensor.gatus_group_apps_worst_response_time")
+    assert worst.state == "2.0"
@@ -0,0 +1,62 @@
+"""Tests for the snapshots of the latest statuses."""
+
+from typing import Any
+
+import pytest
+from homeassistant.core import HomeAssistant
+
+from custom_components.gatus.const import DOMAIN
+from custom_components.gatus.snapshot import (
+    SNAPSHOT_FIELDS,
+    SNAPSHOT_VERSION,
+    GatusSnapshot,
+    decode_snapshot,
+    encode_snapshot,
+)
+
+from .conftest import make_status
+
+
+def test_round_trip() -> None:
+    statuses = [
+        make_status(f"endpoint_{index}", "apps", success=index % 2 == 0)
+        for index in range(3)
+    ]
+    data = encode_snapshot(statuses)
+
+    assert data["fields"] == SNAPSHOT_FIELDS
+    assert all(isinstance(row, list) for row in data["statuses"])
+    assert decode_snapshot(data) == statuses
+
+
+def test_snapshot_with_other_fields_is_discarded() -> None:
+    data = encode_snapshot([make_status("endpoint_0")])
+    data["fields"] = [*SNAPSHOT_FIELDS[:-1], "removed"]
+
+    assert decode_snapshot(data) is None
+
+
+@pytest.mark.asyncio
+async def test_load(hass: HomeAssistant, hass_storage: dict[str, Any]) -> None:
+    statuses = [make_status(f"endpoint_{index}") for index in range(2)]
+    hass_storage[f"{DOMAIN}.test_entry_id"] = {
+        "version": SNAPSHOT_VERSION,
+        "key": f"{DOMAIN}.test_entry_id",
+        "data": encode_snapshot(statuses),
+    }
+
+    assert await GatusSnapshot(hass, "test_entry_id", list).async_load() == statuses
+    assert await GatusSnapshot(hass, "other_entry_id", list).async_load() is None
+
+
+@pytest.mark.asyncio
+async def test_invalid_snapshot_is_ignored(
+    hass: HomeAssistant, hass_storage: dict[str, Any]
+) -> None:
+    hass_storage[f"{DOMAIN}.test_entry_id"] = {
+        "version": SNAPSHOT_VERSION,
+        "key": f"{DOMAIN}.test_entry_id",
+        "data": {"fields": SNAPSHOT_FIELDS, "statuses": [["too", "short"]]},
+    }
+
+    assert await GatusSnapshot(hass, "test_entry_id", list).async_load() is None
@@ -0,0 +1,80 @@
+"""Tests for the Gatus status store."""
+
+from custom_components.gatus.store import GatusStatusStore, StatusesDelta
+
+from .conftest import make_status
+
+
+def test_update_delta() -> None:
+    store = GatusStatusStore()
+    delta = store.update(make_status(f"endpoint_{index}", "apps") for index in range(4))
+    assert delta == StatusesDelta(
+        added={f"apps_endpoint_{index}" for index in range(4)}
+    )
+
+    statuses = [make_status(f"endpoint_{index}", "apps") for index in range(1, 5)]
+    statuses[1] = make_status("endpoint_2", "apps", success=False)
+    statuses[2] = make_status("endpoint_3", "apps", response_time=200)
+
+    assert store.update(statuses) == StatusesDelta(
+        added={"apps_endpoint_4"},
+        removed={"apps_endpoint_0"},
+        changed={"apps_endpoint_2", "apps_endpoint_3"},
+        previous={
+            "apps_endpoint_0": make_status("endpoint_0", "apps"),
+            "apps_endpoint_2": make_status("endpoint_2", "apps"),
+            "apps_endpoint_3": make_status("endpoint_3", "apps"),
+        },
+    )
+    assert store.update(statuses) == StatusesDelta()
+
+
+def test_lookup() -> None:
+    store = GatusStatusStore()
+    statuses = [
+        make_status("endpoint_0", "apps"),
+        make_status("endpoint_1", "links"),
+        make_status("endpoint_2", "links"),
+    ]
+    store.update(statuses)
+
+    assert len(store) == len(statuses)
+    assert "links_endpoint_1" in store
+    assert "apps_endpoint_3" not in store
+    assert store.get("links_endpoint_1") == statuses[1]
+    assert store.get("apps_endpoint_3") is None
+    assert list(store) == statuses
+    assert sorted(store.groups) == ["apps", "links"]
+    assert store.group("apps") == [statuses[0]]
+    assert store.group("missing") == []
+
+
+def test_update_keeps_group_index() -> None:
+    store = GatusStatusStore()
+    store.update(
+        [make_status("endpoint_0", "apps"), make_status("endpoint_1", "links")]
+    )
+
+    changed = make_status("endpoint_1", "links", success=False)
+    store.update([changed])
+
+    assert store.groups == ["links"]
+    assert store.group("links") == [changed]
+    assert store.get("links_endpoint_1") == changed
+
+
+def test_update_one() -> None:
+    store = GatusStatusStore()
+    store.update([make_status("endpoint_0", "apps"), make_status("endpoint_1", "apps")])
+
+    changed = make_status("endpoint_1", "apps", success=False)
+    assert store.update_one(changed) == StatusesDelta(
+        changed={"apps_endpoint_1"},
+        previous={"apps_endpoint_1": make_status("endpoint_1", "apps")},
+    )
+    assert store.update_one(changed) == StatusesDelta()
+    assert store.get("apps_endpoint_0") == make_status("endpoint_0", "apps")
+    assert sorted(store.group("apps"), key=lambda status: status.key) == [
+        make_status("endpoint_0", "apps"),
+        changed,
+    ]
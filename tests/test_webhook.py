@@ -0,0 +1,231 @@
+"""Tests for the Gatus alert webhook."""
+
+from dataclasses import replace
+from http import HTTPStatus
+from typing import Any
+
+import pytest
+from homeassistant.config_entries import ConfigEntryState
+from homeassistant.const import CONF_WEBHOOK_ID
+from pytest_homeassistant_custom_component.common import MockConfigEntry
+
+from custom_components.gatus.api import StatusesResponse
+from custom_components.gatus.const import (
+    CONF_ATTRIBUTE_PROFILE,
+    CONF_DEBOUNCE_FAILURES,
+    CONF_DEBOUNCE_WINDOW,
+    WEBHOOK_RECONCILE_INTERVAL,
+)
+
+from .conftest import make_status
+
+WEBHOOK_ID = "gatus_test_webhook"
+WEBHOOK_URL = f"/api/webhook/{WEBHOOK_ID}"
+
+
+@pytest.fixture
+async def webhook_entry(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+) -> tuple[Any, MockConfigEntry, Any]:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(entry, options={CONF_WEBHOOK_ID: WEBHOOK_ID})
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("atuin", "apps"), make_status("shlink")]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    return hass, entry, client
+
+
+@pytest.mark.asyncio
+async def test_alerts_update_entities_immediately(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, entry, client = webhook_entry
+    http = await hass_client_no_auth()
+    assert entry.runtime_data.coordinator.update_interval == (
+        WEBHOOK_RECONCILE_INTERVAL
+    )
+
+    response = await http.post(
+        WEBHOOK_URL,
+        json={
+            "name": "atuin",
+            "group": "apps",
+            "status": "TRIGGERED",
+            "errors": "connection refused",
+        },
+    )
+    assert response.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "off"
+    assert hass.states.get("binary_sensor.gatus_shlink").state == "on"
+
+    response = await http.post(
+        WEBHOOK_URL, json={"name": "atuin", "group": "apps", "status": "resolved"}
+    )
+    assert response.status == HTTPStatus.OK
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "on"
+    # Alerts are applied without polling Gatus.
+    assert client.async_get_statuses.await_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "payload",
+    [
+        "not json",
+        {"group": "apps", "status": "triggered"},
+        {"name": "atuin", "group": "apps", "status": "unknown"},
+    ],
+)
+async def test_invalid_alerts_rejected(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+    payload: Any,
+) -> None:
+    hass, _, _ = webhook_entry
+    http = await hass_client_no_auth()
+
+    if isinstance(payload, str):
+        response = await http.post(WEBHOOK_URL, data=payload)
+    else:
+        response = await http.post(WEBHOOK_URL, json=payload)
+
+    assert response.status == HTTPStatus.BAD_REQUEST
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "on"
+
+
+@pytest.mark.asyncio
+async def test_unknown_endpoint_refreshes(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, _, client = webhook_entry
+    http = await hass_client_no_auth()
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[
+            make_status("atuin", "apps"),
+            make_status("shlink"),
+            make_status("new"),
+        ]
+    )
+
+    response = await http.post(WEBHOOK_URL, json={"name": "new", "status": "triggered"})
+
+    assert response.status == HTTPStatus.ACCEPTED
+    await hass.async_block_till_done()
+    assert hass.states.get("binary_sensor.gatus_new") is not None
+
+
+@pytest.mark.asyncio
+async def test_alert_from_other_instance_ignored(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, _, _ = webhook_entry
+    http = await hass_client_no_auth()
+
+    response = await http.post(
+        WEBHOOK_URL,
+        json={
+            "name": "atuin",
+            "group": "apps",
+            "status": "triggered",
+            "instance": "eu_status_local",
+        },
+    )
+
+    assert response.status == HTTPStatus.ACCEPTED
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "on"
+
+
+@pytest.mark.asyncio
+async def test_webhook_unregistered_on_unload(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, entry, _ = webhook_entry
+    http = await hass_client_no_auth()
+
+    await hass.config_entries.async_unload(entry.entry_id)
+    await hass.async_block_till_done()
+
+    response = await http.post(
+        WEBHOOK_URL, json={"name": "atuin", "group": "apps", "status": "resolved"}
+    )
+    # Home Assistant answers unknown webhooks with 200, but nothing handles it.
+    assert response.status == HTTPStatus.OK
+    assert WEBHOOK_ID not in hass.data.get("webhook", {})
+
+
+@pytest.mark.asyncio
+async def test_webhook_survives_reload(
+    webhook_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, entry, _ = webhook_entry
+    http = await hass_client_no_auth()
+
+    # Changing the options reloads the entry, registering the webhook again.
+    hass.config_entries.async_update_entry(
+        entry, options={**entry.options, CONF_ATTRIBUTE_PROFILE: "full"}
+    )
+    await hass.async_block_till_done()
+
+    assert entry.state is ConfigEntryState.LOADED
+    response = await http.post(
+        WEBHOOK_URL, json={"name": "atuin", "group": "apps", "status": "triggered"}
+    )
+    assert response.status == HTTPStatus.OK
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "off"
+
+
+@pytest.mark.asyncio
+async def test_pushed_check_not_counted_again_by_poll(
+    mocked_entry: tuple[Any, MockConfigEntry, Any],
+    hass_client_no_auth: Any,
+) -> None:
+    hass, entry, client = mocked_entry
+    hass.config_entries.async_update_entry(
+        entry,
+        options={
+            CONF_WEBHOOK_ID: WEBHOOK_ID,
+            CONF_DEBOUNCE_FAILURES: 2,
+            CONF_DEBOUNCE_WINDOW: 3,
+        },
+    )
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[make_status("atuin", "apps")]
+    )
+    await hass.config_entries.async_setup(entry.entry_id)
+    await hass.async_block_till_done()
+    coordinator = entry.runtime_data.coordinator
+    http = await hass_client_no_auth()
+
+    await http.post(
+        WEBHOOK_URL, json={"name": "atuin", "group": "apps", "status": "triggered"}
+    )
+    # The poll reports the check the alert was about, with its actual time.
+    failed = replace(
+        make_status("atuin", "apps"),
+        success=False,
+        last_checked="2023-10-01T00:01:00Z",
+        errors=["down"],
+    )
+    client.async_get_statuses.return_value = StatusesResponse(statuses=[failed])
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    # A single failed check doesn't trip the 2 of 3 debounce.
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "on"
+
+    client.async_get_statuses.return_value = StatusesResponse(
+        statuses=[replace(failed, last_checked="2023-10-01T00:02:00Z")]
+    )
+    await coordinator.async_refresh()
+    await hass.async_block_till_done()
+
+    assert hass.states.get("binary_sensor.gatus_apps_atuin").state == "off"